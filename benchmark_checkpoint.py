@@ -0,0 +1,63 @@
+#  CHECKPOINT BENCHMARK
+# Checkpoint write, memory-mapped open and full restore time by population size
+
+import sys
+import os
+import random
+import shutil
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+from genesis_engine.core.advanced_evolution import NarrativeState
+from genesis_engine.core.checkpoint import save_checkpoint, load_checkpoint, restore_narratives
+
+
+def population(size, seed=0):
+    """Narratives shaped like evolved ones: a sentence or two, a few concepts, two parent ids"""
+    rng = random.Random(seed)
+    words = "consciousness love resonance evolution divine creation pattern meaning harmony cosmic".split()
+    return [NarrativeState(state_id=f"adv_child_{i}", content=' '.join(rng.choices(words, k=rng.randint(6, 24))),
+                           concepts=rng.sample(words, 4), coherence=rng.random(), fitness_score=rng.random(),
+                           generation=rng.randint(0, 50), parent_ids=[f"adv_child_{rng.randrange(size)}"] * 2,
+                           semantic_quality=rng.random())
+            for i in range(size)]
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def run_benchmark(sizes=(10000, 100000, 1000000)):
+    print(" CHECKPOINT BENCHMARK")
+    print("=" * 60)
+    workdir = tempfile.mkdtemp()
+    histories = {"fitness": [random.random() for _ in range(1000)]}
+    print(f"{'narratives':>11} {'write s':>8} {'MB':>8} {'MB/s':>8} {'mmap ms':>8} {'restore s':>10}")
+    try:
+        for size in sizes:
+            narratives = population(size)
+            path = os.path.join(workdir, f"run_{size}")
+
+            start = time.perf_counter()
+            save_checkpoint(path, narratives, histories, random.getstate(), {"generation": 0})
+            write_time = time.perf_counter() - start
+            megabytes = directory_size(path) / 1e6
+
+            start = time.perf_counter()
+            checkpoint = load_checkpoint(path, mmap=True)
+            mmap_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            restored = restore_narratives(checkpoint, NarrativeState)
+            restore_time = time.perf_counter() - start
+            assert restored[-1] == narratives[-1]
+
+            print(f"{size:>11} {write_time:>8.2f} {megabytes:>8.1f} {megabytes / write_time:>8.0f} "
+                  f"{1e3 * mmap_time:>8.1f} {restore_time:>10.2f}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    run_benchmark(tuple(int(arg) for arg in sys.argv[1:]) or (10000, 100000, 1000000))
@@ -0,0 +1,53 @@
+#  EVALUATION EXECUTOR BENCHMARK
+# CRE evaluation throughput of a large population by backend and worker count
+
+import sys
+import os
+import random
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+from genesis_engine.core.evaluation_executor import make_executor
+
+
+def population(size, seed=0):
+    """Narratives of a few hundred words drawn from the CRE vocabulary"""
+    rng = random.Random(seed)
+    words = ("consciousness love resonance evolution divine creation pattern meaning care community "
+             "unity growth the of and through emerges from gives rise to recursive harmony sacred").split()
+    return [{'content': '. '.join(' '.join(rng.choice(words) for _ in range(rng.randint(8, 20)))
+                                  for _ in range(rng.randint(10, 30))),
+             'concepts': []} for _ in range(size)]
+
+
+def run_benchmark(size=2000, max_workers=None):
+    print(" EVALUATION EXECUTOR BENCHMARK")
+    print("=" * 60)
+    payloads = population(size)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with make_executor('serial') as serial:
+        start = time.perf_counter()
+        expected = serial.evaluate(payloads)
+        serial_time = time.perf_counter() - start
+    print(f"   {size} narratives, serial: {serial_time:.2f}s")
+
+    print(f"{'backend':>8} {'workers':>8} {'seconds':>9} {'speedup':>9} {'efficiency':>11}")
+    workers = 1
+    while True:
+        for backend in ('thread', 'process'):
+            with make_executor(backend, max_workers=workers) as executor:
+                executor.evaluate(payloads[:workers])  # start workers and warm their evaluators
+                start = time.perf_counter()
+                results = executor.evaluate(payloads)
+                elapsed = time.perf_counter() - start
+            assert [r.overall_fitness for r in results] == [e.overall_fitness for e in expected]
+            speedup = serial_time / elapsed
+            print(f"{backend:>8} {workers:>8} {elapsed:>9.2f} {speedup:>8.1f}x {speedup / workers:>10.0%}")
+        if workers >= max_workers:
+            break
+        workers = min(max_workers, workers * 2)
+
+
+if __name__ == "__main__":
+    run_benchmark(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,54 @@
+#  STEADY-STATE BENCHMARK
+# Evaluations/second of generational vs steady-state evolution when evaluation time varies
+
+import sys
+import os
+import random
+import time
+import zlib
+sys.path.insert(0, os.path.dirname(__file__))
+
+from genesis_engine.core.advanced_evolution import AdvancedEvolutionaryEngine
+from genesis_engine.core.evaluation_executor import make_executor
+from genesis_engine.core.fitness_cache import FitnessCache
+from genesis_engine.core.physics_of_meaning import EnhancedCRE
+from genesis_engine.core.steady_state import SteadyStateEvolution
+
+
+class MixedLatencyCRE(EnhancedCRE):
+    """One narrative in eight takes an embedding-sized 40 ms; the rest cost a few milliseconds"""
+
+    def evaluate_narrative_state(self, narrative_state):
+        slow = zlib.crc32(narrative_state['content'].encode()) % 8 == 0
+        time.sleep(0.04 if slow else 0.002)
+        return super().evaluate_narrative_state(narrative_state)
+
+
+def new_engine(executor, population_size):
+    random.seed(0)
+    engine = AdvancedEvolutionaryEngine(None, executor=executor, fitness_cache=FitnessCache(capacity=0))
+    engine.population_size = population_size
+    engine.max_generations = 1000
+    engine.initialize_population()
+    return engine
+
+
+def run_benchmark(population_size=32, generations=10, workers=8):
+    print(" STEADY-STATE BENCHMARK")
+    print("=" * 60)
+    with make_executor('thread', evaluator_factory=MixedLatencyCRE, max_workers=workers) as executor:
+        engine = new_engine(executor, population_size)
+        engine.evolve_narrative(generations=generations)
+        generational = engine.throughput
+        steady = SteadyStateEvolution(new_engine(executor, population_size)).run(
+            evaluations=generational['evaluations'])
+
+    print(f"{'mode':>14} {'evaluations':>12} {'seconds':>8} {'eval/s':>8}")
+    for report in (generational, steady):
+        print(f"{report['mode']:>14} {report['evaluations']:>12} {report['seconds']:>8.2f} "
+              f"{report['evaluations_per_second']:>8.1f}")
+    print(f"   steady-state speedup: {steady['evaluations_per_second'] / generational['evaluations_per_second']:.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(*(int(arg) for arg in sys.argv[1:4]))
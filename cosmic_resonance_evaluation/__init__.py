@@ -4,11 +4,16 @@ Universal Consciousness Principles & Mathematical Foundation
 """
 
 from .cosmic_core import CosmicCore
-from .mathematical_foundation import MathematicalFoundation
+from .mathematical_foundation import MathematicalFoundation, EmbeddingContext
 from .evaluation_metrics import EvaluationMetrics
 from .narrative_synthesis import NarrativeSynthesis
 from .cosmic_evaluator import CosmicEvaluator
 from .cosmic_workbench import CosmicWorkbench
+from .embedding_registry import EmbeddingModelRegistry, get_registry
+from .embedding_cache import EmbeddingCache, CachedEncoder, get_embedding_cache
+from .hilbert_geometry import triple_geometry, pairwise_cosine, row_cosine
+from .meaning_graph import MeaningGraph
+from .ann_index import FlatIndex, IVFPQIndex, NoveltyArchive
 
 __version__ = "1.0.0"
 __author__ = "Cosmic Researcher"
@@ -17,10 +22,23 @@ __email__ = "cosmic@resonance.universe"
 __all__ = [
     "CosmicCore",
     "MathematicalFoundation", 
+    "EmbeddingContext",
     "EvaluationMetrics",
     "NarrativeSynthesis",
     "CosmicEvaluator",
-    "CosmicWorkbench"
+    "CosmicWorkbench",
+    "EmbeddingModelRegistry",
+    "get_registry",
+    "EmbeddingCache",
+    "CachedEncoder",
+    "get_embedding_cache",
+    "triple_geometry",
+    "pairwise_cosine",
+    "row_cosine",
+    "MeaningGraph",
+    "FlatIndex",
+    "IVFPQIndex",
+    "NoveltyArchive"
 ]
 
 print("🌀 Cosmic Resonance Evaluation Package Loaded")
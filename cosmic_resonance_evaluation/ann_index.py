@@ -0,0 +1,382 @@
+# ann_index.py
+"""
+🔭 ANN INDEX - Approximate nearest-neighbour search over narrative embeddings (pure NumPy IVF-PQ)
+"""
+
+import os
+import json
+
+import numpy as np
+from scipy import sparse
+
+try:
+    from hilbert_geometry import normalize_rows
+    from embedding_cache import text_digest
+except ImportError:
+    from .hilbert_geometry import normalize_rows
+    from .embedding_cache import text_digest
+
+PQ_CODEBOOK_SIZE = 256
+MAX_TRAINING_VECTORS = 50000
+KMEANS_ITERATIONS = 20
+QUERY_BLOCK_SIZE = 1024
+SEARCH_BLOCK_ELEMENTS = 1 << 23
+INDEX_FORMAT_VERSION = 1
+
+
+def kmeans(X, n_clusters, iterations=KMEANS_ITERATIONS, seed=0):
+    """Lloyd's k-means with blocked assignments; empty clusters are reseeded from random points"""
+    rng = np.random.default_rng(seed)
+    X = np.asarray(X, dtype=np.float32)
+    n_clusters = min(n_clusters, len(X))
+    centroids = X[rng.choice(len(X), n_clusters, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = assign_clusters(X, centroids)
+        counts = np.bincount(assignments, minlength=n_clusters)
+        membership = sparse.csr_matrix((np.ones(len(X), dtype=np.float32), (assignments, np.arange(len(X)))),
+                                       shape=(n_clusters, len(X)))
+        sums = membership @ X
+
+        empty = counts == 0
+        centroids[~empty] = sums[~empty] / counts[~empty, np.newaxis]
+        if empty.any():
+            centroids[empty] = X[rng.choice(len(X), int(empty.sum()), replace=False)]
+
+    return centroids
+
+
+def assign_clusters(X, centroids, block_size=QUERY_BLOCK_SIZE):
+    """Index of the nearest centroid (squared L2) for every row of X"""
+    centroid_norms = np.einsum('ij,ij->i', centroids, centroids)
+    assignments = np.empty(len(X), dtype=np.int64)
+    for start in range(0, len(X), block_size):
+        block = X[start:start + block_size]
+        # |x|² is constant per row, so argmin(|c|² - 2x·c) is the nearest centroid
+        assignments[start:start + block_size] = np.argmin(centroid_norms - 2 * block @ centroids.T, axis=1)
+    return assignments
+
+
+def _default_subvectors(dim):
+    """Largest divisor of dim giving sub-vectors of at least 8 dimensions"""
+    for m in range(max(1, dim // 8), 0, -1):
+        if dim % m == 0:
+            return m
+    return 1
+
+
+class _GrowableStore:
+    """Append-only row storage with amortized doubling (memmapped arrays are copied on first growth)"""
+
+    def __init__(self):
+        self.arrays = {}
+        self.size = 0
+
+    def append(self, **rows):
+        count = len(next(iter(rows.values())))
+        for name, values in rows.items():
+            current = self.arrays.get(name)
+            if current is None or self.size + count > len(current):
+                capacity = max(16, 2 * (self.size + count))
+                grown = np.empty((capacity,) + values.shape[1:], dtype=values.dtype)
+                if current is not None:
+                    grown[:self.size] = current[:self.size]
+                self.arrays[name] = current = grown
+            current[self.size:self.size + count] = values
+        self.size += count
+
+    def view(self, name):
+        array = self.arrays.get(name)
+        return None if array is None else array[:self.size]
+
+
+class FlatIndex:
+    """
+    WHAT: Exact cosine k-NN by blocked matrix products (the brute-force baseline)
+    HOW-TO: index.add(vectors); scores, ids = index.search(queries, k)
+    """
+
+    def __init__(self, dim):
+        self.dim = dim
+        self._store = _GrowableStore()
+
+    @property
+    def ntotal(self):
+        return self._store.size
+
+    def add(self, vectors, ids=None):
+        vectors = normalize_rows(vectors).astype(np.float32)
+        ids = _resolve_ids(ids, self.ntotal, len(vectors))
+        self._store.append(vectors=vectors, ids=ids)
+        return ids
+
+    def search(self, queries, k=10):
+        """Top-k cosine similarities and ids per query (padded with -inf / -1)"""
+        Q = normalize_rows(queries).astype(np.float32)
+        scores, ids = _empty_results(len(Q), k)
+        if self.ntotal == 0:
+            return scores, ids
+
+        vectors, stored_ids = self._store.view('vectors'), self._store.view('ids')
+        kk = min(k, self.ntotal)
+        for start in range(0, len(Q), QUERY_BLOCK_SIZE):
+            S = Q[start:start + QUERY_BLOCK_SIZE] @ vectors.T
+            top = np.argpartition(-S, kk - 1, axis=1)[:, :kk]
+            top_scores = np.take_along_axis(S, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            scores[start:start + QUERY_BLOCK_SIZE, :kk] = np.take_along_axis(top_scores, order, axis=1)
+            ids[start:start + QUERY_BLOCK_SIZE, :kk] = stored_ids[np.take_along_axis(top, order, axis=1)]
+        return scores, ids
+
+
+class IVFPQIndex:
+    """
+    WHAT: Inverted-file index with product-quantized residuals for cosine k-NN
+    HOW-TO: index = IVFPQIndex(dim); index.add(vectors)   (trains on the first batch)
+            scores, ids = index.search(queries, k=10, n_probe=8)
+            index.save(path); IVFPQIndex.load(path, mmap=True)
+    RERANK: with store_vectors=True the best k * rerank_factor PQ candidates are rescored exactly
+    """
+
+    def __init__(self, dim, n_lists=None, n_subvectors=None, store_vectors=True,
+                 n_probe=8, rerank_factor=10, seed=0):
+        self.dim = dim
+        self.n_lists = n_lists
+        self.n_subvectors = n_subvectors or _default_subvectors(dim)
+        if dim % self.n_subvectors:
+            raise ValueError(f"dim {dim} is not divisible by n_subvectors {self.n_subvectors}")
+        self.store_vectors = store_vectors
+        self.n_probe = n_probe
+        self.rerank_factor = rerank_factor
+        self.seed = seed
+
+        self.centroids = None
+        self.codebooks = None
+        self._store = _GrowableStore()
+        self._order = None
+        self._offsets = None
+
+    @property
+    def ntotal(self):
+        return self._store.size
+
+    @property
+    def is_trained(self):
+        return self.centroids is not None
+
+    def train(self, vectors):
+        """Learn coarse centroids and residual PQ codebooks"""
+        X = normalize_rows(vectors).astype(np.float32)
+        rng = np.random.default_rng(self.seed)
+        if len(X) > MAX_TRAINING_VECTORS:
+            X = X[rng.choice(len(X), MAX_TRAINING_VECTORS, replace=False)]
+
+        n_lists = self.n_lists or max(1, int(4 * np.sqrt(len(X))))
+        self.centroids = kmeans(X, n_lists, seed=self.seed)
+        self.n_lists = len(self.centroids)
+
+        residuals = X - self.centroids[assign_clusters(X, self.centroids)]
+        sub_dim = self.dim // self.n_subvectors
+        self.codebooks = np.stack([
+            kmeans(residuals[:, m * sub_dim:(m + 1) * sub_dim], PQ_CODEBOOK_SIZE, seed=self.seed + m + 1)
+            for m in range(self.n_subvectors)
+        ])
+
+    def add(self, vectors, ids=None):
+        """Insert vectors (incrementally; trains on this batch if the index is untrained)"""
+        if not self.is_trained:
+            self.train(vectors)
+
+        X = normalize_rows(vectors).astype(np.float32)
+        ids = _resolve_ids(ids, self.ntotal, len(X))
+        lists = assign_clusters(X, self.centroids)
+        rows = {'codes': self._encode(X - self.centroids[lists]), 'lists': lists.astype(np.int32), 'ids': ids}
+        if self.store_vectors:
+            rows['vectors'] = X
+        self._store.append(**rows)
+        self._order = None  # Inverted lists are rebuilt lazily on the next search
+        return ids
+
+    def _encode(self, residuals):
+        sub_dim = self.dim // self.n_subvectors
+        codes = np.empty((len(residuals), self.n_subvectors), dtype=np.uint8)
+        for m in range(self.n_subvectors):
+            codes[:, m] = assign_clusters(residuals[:, m * sub_dim:(m + 1) * sub_dim], self.codebooks[m])
+        return codes
+
+    def _inverted_lists(self):
+        if self._order is None:
+            lists = self._store.view('lists')
+            self._order = np.argsort(lists, kind='stable')
+            self._offsets = np.searchsorted(lists[self._order], np.arange(self.n_lists + 1))
+        return self._order, self._offsets
+
+    def search(self, queries, k=10, n_probe=None, rerank=None):
+        """
+        Approximate top-k cosine similarities and ids per query (padded with -inf / -1)
+
+        Scores are exact when reranked against stored vectors, PQ estimates otherwise
+        """
+        Q = normalize_rows(queries).astype(np.float32)
+        scores, ids = _empty_results(len(Q), k)
+        if self.ntotal == 0:
+            return scores, ids
+
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        rerank = self.store_vectors if rerank is None else (rerank and self.store_vectors)
+        shortlist_size = k * self.rerank_factor if rerank else k
+        order, offsets = self._inverted_lists()
+        list_sizes = np.diff(offsets)
+        codes, stored_ids = self._store.view('codes'), self._store.view('ids')
+        vectors = self._store.view('vectors')
+        sub_dim = self.dim // self.n_subvectors
+        table_width = self.n_subvectors * self.codebooks.shape[1]
+        code_offsets = np.arange(self.n_subvectors) * self.codebooks.shape[1]
+
+        # Bound the per-block working set (candidate code lookups and rerank rows)
+        per_query = max(n_probe * list_sizes.mean() * self.n_subvectors, shortlist_size * self.dim, 1)
+        block_size = int(max(1, min(QUERY_BLOCK_SIZE, SEARCH_BLOCK_ELEMENTS // per_query)))
+
+        for start in range(0, len(Q), block_size):
+            block = Q[start:start + block_size]
+            coarse = block @ self.centroids.T
+            probes = np.argpartition(-coarse, n_probe - 1, axis=1)[:, :n_probe].ravel()
+            # Inner product is linear, so one (m, codebook) lookup table per query serves every list
+            tables = np.einsum('qmd,mkd->qmk', block.reshape(len(block), self.n_subvectors, sub_dim),
+                               self.codebooks).ravel()
+
+            # Flatten every (query, probed list) pair into one candidate stream
+            lengths = list_sizes[probes]
+            query_of = np.repeat(np.repeat(np.arange(len(block)), n_probe), lengths)
+            list_of = np.repeat(probes, lengths)
+            positions = np.arange(lengths.sum()) + np.repeat(offsets[probes] - (np.cumsum(lengths) - lengths), lengths)
+            candidates = order[positions]
+            if len(candidates) == 0:
+                continue
+
+            lookups = (query_of * table_width)[:, np.newaxis] + code_offsets + codes[candidates]
+            estimate = coarse[query_of, list_of] + tables[lookups].sum(axis=1)
+
+            query_of, candidates, estimate = _top_per_group(query_of, candidates, estimate, shortlist_size)
+            if rerank:
+                estimate = np.einsum('ij,ij->i', vectors[candidates], block[query_of])
+                query_of, candidates, estimate = _top_per_group(query_of, candidates, estimate, k)
+
+            rank = np.arange(len(query_of)) - np.searchsorted(query_of, query_of)
+            scores[start + query_of, rank] = estimate
+            ids[start + query_of, rank] = stored_ids[candidates]
+
+        return scores, ids
+
+    def save(self, path):
+        """Write the index as .npy files in a directory (loadable as memory maps)"""
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as fh:
+            json.dump({
+                'dim': self.dim, 'n_lists': self.n_lists, 'n_subvectors': self.n_subvectors,
+                'store_vectors': self.store_vectors, 'n_probe': self.n_probe,
+                'rerank_factor': self.rerank_factor, 'seed': self.seed,
+                'ntotal': self.ntotal, 'version': INDEX_FORMAT_VERSION
+            }, fh)
+        if self.is_trained:
+            np.save(os.path.join(path, 'centroids.npy'), self.centroids)
+            np.save(os.path.join(path, 'codebooks.npy'), self.codebooks)
+        for name in ('codes', 'lists', 'ids', 'vectors'):
+            array = self._store.view(name)
+            if array is not None:
+                np.save(os.path.join(path, f'{name}.npy'), array)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Open a saved index; with mmap=True the per-vector arrays stay on disk until written to"""
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as fh:
+            meta = json.load(fh)
+
+        index = cls(meta['dim'], n_lists=meta['n_lists'], n_subvectors=meta['n_subvectors'],
+                    store_vectors=meta['store_vectors'], n_probe=meta['n_probe'],
+                    rerank_factor=meta['rerank_factor'], seed=meta['seed'])
+        if os.path.exists(os.path.join(path, 'centroids.npy')):
+            index.centroids = np.load(os.path.join(path, 'centroids.npy'))
+            index.codebooks = np.load(os.path.join(path, 'codebooks.npy'))
+
+        mmap_mode = 'r' if mmap else None
+        for name in ('codes', 'lists', 'ids', 'vectors'):
+            file_path = os.path.join(path, f'{name}.npy')
+            if os.path.exists(file_path):
+                index._store.arrays[name] = np.load(file_path, mmap_mode=mmap_mode)
+        index._store.size = meta['ntotal']
+        return index
+
+
+class NoveltyArchive:
+    """
+    WHAT: Archive of seen narratives scored by embedding distance to their nearest neighbours
+    HOW-TO: archive = NoveltyArchive(encoder); archive.add(texts); archive.novelty(texts)
+    NOVELTY: 1 - mean cosine similarity to the k nearest archived narratives (other than itself)
+    """
+
+    def __init__(self, encoder, index=None, k=5):
+        self.encoder = encoder
+        self.index = index
+        self.k = k
+        self._digests = []
+        self._seen = set()
+
+    def __len__(self):
+        return len(self._digests)
+
+    def add(self, texts):
+        """Archive texts not seen before (one batched encode)"""
+        fresh = []
+        for text in dict.fromkeys(texts):
+            digest = text_digest(text)
+            if digest not in self._seen:
+                self._seen.add(digest)
+                fresh.append((text, digest))
+        if not fresh:
+            return
+
+        vectors = np.asarray(self.encoder.encode([text for text, _ in fresh]), dtype=np.float32)
+        if self.index is None:
+            self.index = FlatIndex(vectors.shape[1])
+        self.index.add(vectors, ids=np.arange(len(self._digests), len(self._digests) + len(fresh)))
+        self._digests.extend(digest for _, digest in fresh)
+
+    def novelty(self, texts):
+        """Novelty in [0, 1] per text (0.5 while the archive is empty)"""
+        texts = list(texts)
+        if not texts:
+            return np.empty(0)
+        if self.index is None or self.index.ntotal == 0:
+            return np.full(len(texts), 0.5)
+
+        scores, ids = self.index.search(self.encoder.encode(texts), k=self.k + 1)
+        novelty = np.empty(len(texts))
+        for row, text in enumerate(texts):
+            digest = text_digest(text)
+            # A narrative is never its own neighbour
+            keep = (ids[row] >= 0) & np.array([i < 0 or self._digests[i] != digest for i in ids[row]])
+            neighbours = scores[row][keep][:self.k]
+            novelty[row] = 1.0 - np.mean(neighbours) if len(neighbours) else 0.5
+        return np.clip(novelty, 0.0, 1.0)
+
+
+def _resolve_ids(ids, ntotal, count):
+    if ids is None:
+        return np.arange(ntotal, ntotal + count, dtype=np.int64)
+    ids = np.asarray(ids, dtype=np.int64)
+    if len(ids) != count:
+        raise ValueError(f"Got {len(ids)} ids for {count} vectors")
+    return ids
+
+
+def _top_per_group(groups, candidates, values, limit):
+    """Keep the `limit` largest values per group; output sorted by group, then value descending"""
+    order = np.lexsort((-values, groups))
+    groups, candidates, values = groups[order], candidates[order], values[order]
+    keep = np.arange(len(groups)) - np.searchsorted(groups, groups) < limit
+    return groups[keep], candidates[keep], values[keep]
+
+
+def _empty_results(n_queries, k):
+    return np.full((n_queries, k), -np.inf, dtype=np.float32), np.full((n_queries, k), -1, dtype=np.int64)
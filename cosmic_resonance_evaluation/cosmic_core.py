@@ -4,7 +4,6 @@
 """
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 import networkx as nx
 from scipy.spatial.distance import cosine
 
@@ -13,11 +12,15 @@ try:
     from mathematical_foundation import MathematicalFoundation
     from narrative_synthesis import NarrativeSynthesis  
     from evaluation_metrics import CosmicMetrics
+    from embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from embedding_cache import cached_encoder
 except ImportError:
     # If running from same directory, try direct import
     from .mathematical_foundation import MathematicalFoundation
     from .narrative_synthesis import NarrativeSynthesis
     from .evaluation_metrics import CosmicMetrics
+    from .embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from .embedding_cache import cached_encoder
 
 class CosmicCore:
     """
@@ -25,18 +28,29 @@ class CosmicCore:
     HOW-TO: Initialize and run cosmic synthesis + evaluation
     """
     
-    def __init__(self, model_name='all-mpnet-base-v2'):
-        # Core components
-        self.embedding_model = SentenceTransformer(model_name)
-        self.mathematical_foundation = MathematicalFoundation()
-        self.synthesis_engine = NarrativeSynthesis()
-        self.evaluation_metrics = CosmicMetrics()
+    def __init__(self, model_name=DEFAULT_MODEL_NAME, device=None):
+        # Core components share one encoder per (model_name, device) via the registry
+        self.model_name = model_name
+        self.device = device
+        self.embedding_model = cached_encoder(acquire_model(model_name, device), model_name)
+        self.mathematical_foundation = MathematicalFoundation(model_name, device=device)
+        self.synthesis_engine = NarrativeSynthesis(model_name, device=device)
+        self.evaluation_metrics = CosmicMetrics(embedding_model=self.embedding_model)
         
         print("🌌 Cosmic Resonance Engine Initialized")
         print("✅ Mathematical Foundation: ACTIVE")
         print("🌀 Synthesis Engine: READY") 
         print("📊 Evaluation Metrics: OPERATIONAL")
     
+    def release(self):
+        """Release this core's (and its components') references to the shared model"""
+        self.mathematical_foundation.release()
+        self.synthesis_engine.release()
+        self.evaluation_metrics.release()
+        if self.embedding_model is not None:
+            release_model(self.model_name, self.device)
+            self.embedding_model = None
+    
     def cosmic_synthesis(self, parent_a, parent_b, method='hybrid'):
         """
         Perform cosmic narrative synthesis
@@ -63,14 +77,17 @@ class CosmicCore:
         """
         print("📊 Evaluating cosmic resonance...")
         
+        # One batched encode for the whole triple, reused by the scorers
+        vectors = np.asarray(self.embedding_model.encode([parent_a, parent_b, child]), dtype=np.float64)
+        
         # Traditional multi-dimensional scoring
         traditional_scores = self.evaluation_metrics.multi_dimensional_scoring(
-            parent_a, parent_b, child
+            parent_a, parent_b, child, vectors=vectors
         )
         
         # Mathematical UCP validation
         mathematical_validation = self.mathematical_foundation.validate_ucp_principles(
-            parent_a, parent_b, child
+            parent_a, parent_b, child, vectors=vectors
         )
         
         # Combined cosmic score
@@ -86,6 +103,51 @@ class CosmicCore:
             'interpretation': self._interpret_cosmic_score(cosmic_score)
         }
     
+    def evaluate_resonance_batch(self, triples):
+        """
+        Evaluate many (parent_a, parent_b, child) triples at once
+        
+        Texts are deduplicated across the batch and encoded in one model call;
+        every geometric term is computed as a NumPy row operation. Returns one
+        result per triple, matching evaluate_resonance.
+        """
+        triples = [tuple(triple) for triple in triples]
+        if not triples:
+            return []
+        
+        print(f"📊 Evaluating cosmic resonance for {len(triples)} triples...")
+        
+        # Deduplicate texts and encode them in a single batch
+        unique_texts = list(dict.fromkeys(text for triple in triples for text in triple))
+        text_index = {text: i for i, text in enumerate(unique_texts)}
+        embeddings = np.asarray(self.embedding_model.encode(unique_texts), dtype=np.float64)
+        
+        rows = np.array([[text_index[text] for text in triple] for triple in triples])
+        vectors_a, vectors_b, vectors_c = embeddings[rows[:, 0]], embeddings[rows[:, 1]], embeddings[rows[:, 2]]
+        
+        traditional_batch = self.evaluation_metrics.multi_dimensional_scoring_batch(
+            triples, vectors_a, vectors_b, vectors_c
+        )
+        mathematical_batch = self.mathematical_foundation.validate_ucp_principles_batch(
+            vectors_a, vectors_b, vectors_c
+        )
+        
+        # Combined cosmic scores as one matrix statistic
+        traditional_matrix = np.array([list(scores.values()) for scores in traditional_batch], dtype=np.float64)
+        math_scores = np.array([validation['overall_score'] for validation in mathematical_batch])
+        cosmic_scores = np.minimum(1.0, 0.6 * np.mean(traditional_matrix, axis=1) + 0.4 * math_scores)
+        
+        return [
+            {
+                'cosmic_score': cosmic_score,
+                'traditional_scores': traditional_scores,
+                'mathematical_validation': mathematical_validation,
+                'interpretation': self._interpret_cosmic_score(cosmic_score)
+            }
+            for cosmic_score, traditional_scores, mathematical_validation
+            in zip(cosmic_scores, traditional_batch, mathematical_batch)
+        ]
+    
     def run_complete_experiment(self, narratives, num_syntheses=3):
         """
         Run complete cosmic experiment with multiple syntheses
@@ -93,7 +155,7 @@ class CosmicCore:
         print("🔬 Running Complete Cosmic Experiment...")
         print("=" * 60)
         
-        results = []
+        syntheses = []
         
         for i in range(min(num_syntheses, len(narratives) - 1)):
             print(f"\n🧪 Experiment {i+1}:")
@@ -105,12 +167,17 @@ class CosmicCore:
             
             # Perform synthesis
             synthesis_result = self.cosmic_synthesis(parent_a, parent_b, method='hybrid')
-            child = synthesis_result['child']
-            print(f"   Child: {child}")
-            
-            # Evaluate resonance
-            evaluation = self.evaluate_resonance(parent_a, parent_b, child)
-            
+            print(f"   Child: {synthesis_result['child']}")
+            syntheses.append(synthesis_result)
+        
+        # Evaluate resonance for every synthesis in one batch
+        evaluations = self.evaluate_resonance_batch(
+            [(r['parent_a'], r['parent_b'], r['child']) for r in syntheses]
+        )
+        
+        results = []
+        
+        for i, (synthesis_result, evaluation) in enumerate(zip(syntheses, evaluations)):
             experiment_result = {
                 'experiment': i+1,
                 'synthesis': synthesis_result,
@@ -119,6 +186,7 @@ class CosmicCore:
             
             results.append(experiment_result)
             
+            print(f"\n🧪 Experiment {i+1}:")
             print(f"   Cosmic Score: {evaluation['cosmic_score']:.3f}")
             print(f"   Interpretation: {evaluation['interpretation']}")
         
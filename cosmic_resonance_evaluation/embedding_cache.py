@@ -0,0 +1,381 @@
+# embedding_cache.py
+"""
+💾 EMBEDDING CACHE - Content-addressed text embeddings (model name + text hash -> float32 vector)
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, key checks still guard reads
+    fcntl = None
+
+try:
+    from embedding_registry import DEFAULT_MODEL_NAME
+except ImportError:
+    from .embedding_registry import DEFAULT_MODEL_NAME
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'COSMIC_EMBEDDING_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'cosmic_resonance', 'embeddings')
+)
+DEFAULT_MEMORY_CAPACITY = 4096
+DEFAULT_DISK_CAPACITY = 100000
+
+DIGEST_BYTES = 16
+# encode() options that leave the vectors unchanged; any other option bypasses the cache
+CACHE_NEUTRAL_KWARGS = frozenset({'batch_size', 'show_progress_bar'})
+
+
+def text_digest(text):
+    """Stable content hash of a narrative"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=DIGEST_BYTES).digest()
+
+
+class _DiskTier:
+    """
+    WHAT: Fixed-capacity memory-mapped vector store for one model
+    FILES: meta.json (dim, capacity), keys.u8 (digests), vectors.f32, last_used.i64, lock
+    NOTE: One writing process per directory, enforced with an exclusive lock on `lock`;
+          opening a directory another process holds raises BlockingIOError
+    """
+
+    def __init__(self, path, capacity):
+        self._lock_file = self._acquire(path)
+        self.path = path
+        self.capacity = capacity
+        self.dim = None
+        self.keys = None
+        self.vectors = None
+        self.last_used = None
+        self.slots = {}
+        self.free_slots = []
+        self.clock = 0
+        self.evictions = 0
+        self._load()
+
+    @staticmethod
+    def _acquire(path):
+        os.makedirs(path, exist_ok=True)
+        lock_file = open(os.path.join(path, 'lock'), 'a')
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                raise BlockingIOError(f"{path} is in use by another embedding cache")
+        return lock_file
+
+    def close(self):
+        """Flush and release the directory for other processes"""
+        self.flush()
+        self.keys = self.vectors = self.last_used = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _map(self, capacity, dim, mode):
+        keys = np.memmap(self._file('keys.u8'), dtype=np.uint8, mode=mode, shape=(capacity, DIGEST_BYTES))
+        vectors = np.memmap(self._file('vectors.f32'), dtype=np.float32, mode=mode, shape=(capacity, dim))
+        last_used = np.memmap(self._file('last_used.i64'), dtype=np.int64, mode=mode, shape=(capacity,))
+        return keys, vectors, last_used
+
+    def _load(self):
+        """Reopen an existing store, rebuilding the digest -> slot index"""
+        meta_path = self._file('meta.json')
+        if not os.path.exists(meta_path):
+            return
+
+        with open(meta_path, 'r', encoding='utf-8') as fh:
+            meta = json.load(fh)
+
+        dim, stored_capacity = meta['dim'], meta['capacity']
+        keys, vectors, last_used = self._map(stored_capacity, dim, 'r+')
+
+        if stored_capacity != self.capacity:
+            # Keep the most recently used entries that fit the new capacity
+            used = np.flatnonzero(last_used)
+            keep = used[np.argsort(last_used[used])[::-1][:self.capacity]][::-1]
+            entries = [(keys[i].tobytes(), np.array(vectors[i])) for i in keep]
+            del keys, vectors, last_used
+            self._reset_files()
+            self._create(dim)
+            for digest, vector in entries:
+                self.put(digest, vector)
+            return
+
+        self.dim = dim
+        self.keys, self.vectors, self.last_used = keys, vectors, last_used
+        used = self.last_used > 0
+        self.slots = {self.keys[i].tobytes(): int(i) for i in np.flatnonzero(used)}
+        self.free_slots = list(np.flatnonzero(~used)[::-1])
+        self.clock = int(self.last_used.max()) if self.capacity else 0
+
+    def _create(self, dim):
+        os.makedirs(self.path, exist_ok=True)
+        with open(self._file('meta.json'), 'w', encoding='utf-8') as fh:
+            json.dump({'dim': int(dim), 'capacity': int(self.capacity), 'version': 1}, fh)
+
+        self.dim = int(dim)
+        self.keys, self.vectors, self.last_used = self._map(self.capacity, self.dim, 'w+')
+        self.slots = {}
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+        self.clock = 0
+
+    def _reset_files(self):
+        self.keys = self.vectors = self.last_used = None
+        for name in ('meta.json', 'keys.u8', 'vectors.f32', 'last_used.i64'):
+            if os.path.exists(self._file(name)):
+                os.remove(self._file(name))
+
+    def get(self, digest):
+        slot = self.slots.get(digest)
+        if slot is None:
+            return None
+        if self.keys[slot].tobytes() != digest:
+            # The slot was rewritten behind this index: a miss, never another text's vector
+            del self.slots[digest]
+            return None
+        self.clock += 1
+        self.last_used[slot] = self.clock
+        return np.array(self.vectors[slot])
+
+    def put(self, digest, vector):
+        if self.capacity <= 0:
+            return
+        if self.dim is None:
+            self._create(len(vector))
+        if len(vector) != self.dim:
+            return  # Different model geometry; never mix dimensions in one store
+
+        slot = self.slots.get(digest)
+        if slot is None:
+            if not self.free_slots:
+                self._evict(max(1, self.capacity // 8))
+            slot = self.free_slots.pop()
+            self.slots[digest] = slot
+            self.keys[slot] = np.frombuffer(digest, dtype=np.uint8)
+
+        self.clock += 1
+        self.vectors[slot] = vector
+        self.last_used[slot] = self.clock
+
+    def _evict(self, count):
+        """Free the `count` least recently used slots in one vectorized pass"""
+        count = min(count, len(self.slots))
+        victims = np.argpartition(self.last_used, count - 1)[:count]
+        for slot in victims:
+            del self.slots[self.keys[slot].tobytes()]
+            self.keys[slot] = 0
+            self.last_used[slot] = 0
+            self.free_slots.append(int(slot))
+        self.evictions += count
+
+    def flush(self):
+        if self.dim is not None and self.keys is not None:
+            self.keys.flush()
+            self.vectors.flush()
+            self.last_used.flush()
+
+    def clear(self):
+        self._reset_files()
+        self.dim = None
+        self.slots = {}
+        self.free_slots = []
+        self.clock = 0
+
+    def nbytes(self):
+        if self.dim is None:
+            return 0
+        return self.capacity * (DIGEST_BYTES + 4 * self.dim + 8)
+
+
+class EmbeddingCache:
+    """
+    WHAT: Two-tier embedding cache for one model - in-memory LRU in front of a
+          memory-mapped on-disk store that survives restarts
+    HOW-TO: Wrap an encoder with CachedEncoder, or use get_many()/put_many() directly.
+            cache_dir=None keeps the cache in memory only.
+    """
+
+    def __init__(self, model_name=DEFAULT_MODEL_NAME, cache_dir=DEFAULT_CACHE_DIR,
+                 memory_capacity=DEFAULT_MEMORY_CAPACITY, disk_capacity=DEFAULT_DISK_CAPACITY):
+        self.model_name = model_name
+        self.memory_capacity = memory_capacity
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.memory_evictions = 0
+
+        self._disk = None
+        if cache_dir:
+            model_dir = re.sub(r'[^A-Za-z0-9._-]', '_', model_name)
+            try:
+                self._disk = _DiskTier(os.path.join(cache_dir, model_dir), disk_capacity)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️  Embedding disk cache unavailable, using memory only: {e}")
+
+    def get(self, text):
+        """Cached vector for text, or None"""
+        return self.get_many([text])[0]
+
+    def put(self, text, vector):
+        self.put_many([text], [vector])
+
+    def get_many(self, texts):
+        """List aligned with texts: cached float32 vector or None per text"""
+        results = []
+        with self._lock:
+            for text in texts:
+                digest = text_digest(text)
+                vector = self._memory.get(digest)
+                if vector is not None:
+                    self._memory.move_to_end(digest)
+                    self.memory_hits += 1
+                    results.append(vector)
+                    continue
+
+                if self._disk is not None:
+                    vector = self._disk.get(digest)
+                if vector is not None:
+                    self._remember(digest, vector)
+                    self.disk_hits += 1
+                else:
+                    self.misses += 1
+                results.append(vector)
+        return results
+
+    def put_many(self, texts, vectors):
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                digest = text_digest(text)
+                vector = np.asarray(vector, dtype=np.float32)
+                self._remember(digest, vector)
+                if self._disk is not None:
+                    try:
+                        self._disk.put(digest, vector)
+                    except OSError as e:
+                        print(f"⚠️  Embedding disk cache write failed, using memory only: {e}")
+                        self._disk = None
+
+    def _remember(self, digest, vector):
+        """Insert into the memory tier, evicting least recently used entries"""
+        self._memory[digest] = vector
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.memory_capacity:
+            self._memory.popitem(last=False)
+            self.memory_evictions += 1
+
+    def stats(self):
+        """Hit/miss counters and footprint of both tiers"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'model_name': self.model_name,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'memory_bytes': sum(v.nbytes for v in self._memory.values()),
+                'memory_evictions': self.memory_evictions,
+                'disk_entries': len(self._disk.slots) if self._disk else 0,
+                'disk_bytes': self._disk.nbytes() if self._disk else 0,
+                'disk_evictions': self._disk.evictions if self._disk else 0
+            }
+
+    def flush(self):
+        with self._lock:
+            if self._disk is not None:
+                self._disk.flush()
+
+    def close(self):
+        """Flush the disk tier and release its directory; the cache keeps working from memory"""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def clear(self):
+        """Drop both tiers (including the on-disk files)"""
+        with self._lock:
+            self._memory.clear()
+            if self._disk is not None:
+                self._disk.clear()
+
+
+class CachedEncoder:
+    """
+    WHAT: Drop-in encode() front-end that only sends cache misses to the model
+    HOW-TO: CachedEncoder(model, get_embedding_cache(model_name)).encode([...])
+    RETURNS: float32 numpy arrays (one row per input text)
+    NOTE: Calls with output-changing options (normalize_embeddings, convert_to_tensor, ...) go
+          straight to the model, uncached, since cached vectors were made without them
+    """
+
+    def __init__(self, model, cache):
+        self.model = model
+        self.cache = cache
+
+    def encode(self, texts, **encode_kwargs):
+        if not CACHE_NEUTRAL_KWARGS.issuperset(encode_kwargs):
+            return self.model.encode(texts, **encode_kwargs)
+
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+
+        vectors = self.cache.get_many(texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+
+        if missing:
+            # One batched forward pass for all unique misses
+            encoded = np.asarray(self.model.encode(missing, **encode_kwargs), dtype=np.float32)
+            self.cache.put_many(missing, encoded)
+            fresh = dict(zip(missing, encoded))
+            vectors = [v if v is not None else fresh[t] for t, v in zip(texts, vectors)]
+
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float32)
+        stacked = np.stack(vectors)
+        return stacked[0] if single else stacked
+
+    def __getattr__(self, name):
+        # Everything except encode() goes straight to the wrapped model
+        model = self.__dict__.get('model')
+        if model is None:
+            raise AttributeError(name)
+        return getattr(model, name)
+
+
+# Process-wide caches, one per (model_name, cache_dir)
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(model_name=DEFAULT_MODEL_NAME, cache_dir=DEFAULT_CACHE_DIR):
+    """Return the shared cache for a model"""
+    key = (model_name, cache_dir)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = EmbeddingCache(model_name, cache_dir=cache_dir)
+        return _caches[key]
+
+
+def cached_encoder(model, model_name=DEFAULT_MODEL_NAME):
+    """Wrap a loaded model with the shared cache for model_name"""
+    if isinstance(model, CachedEncoder):
+        return model
+    return CachedEncoder(model, get_embedding_cache(model_name))
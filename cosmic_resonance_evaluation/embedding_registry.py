@@ -0,0 +1,103 @@
+# embedding_registry.py
+"""
+🧠 EMBEDDING MODEL REGISTRY - Process-wide shared sentence encoders
+"""
+
+import threading
+
+DEFAULT_MODEL_NAME = 'all-mpnet-base-v2'
+
+
+def _load_sentence_transformer(model_name, device=None):
+    """Load a SentenceTransformer (imported lazily so the registry has no hard dependency)"""
+    from sentence_transformers import SentenceTransformer
+    if device is None:
+        return SentenceTransformer(model_name)
+    return SentenceTransformer(model_name, device=device)
+
+
+class EmbeddingModelRegistry:
+    """
+    WHAT: Reference-counted registry of loaded embedding models
+    HOW-TO: acquire() an encoder by (model_name, device), release() it when done.
+            Each (model_name, device) pair is loaded once per registry and unloaded
+            when its last holder releases it.
+    """
+
+    def __init__(self, loader=None):
+        self._loader = loader or _load_sentence_transformer
+        self._models = {}
+        self._refcounts = {}
+        self._lock = threading.RLock()
+
+    def acquire(self, model_name=DEFAULT_MODEL_NAME, device=None):
+        """Return the shared encoder for (model_name, device), loading it on first use"""
+        key = (model_name, device)
+        with self._lock:
+            if key not in self._models:
+                # Loader errors propagate and leave the registry untouched
+                self._models[key] = self._loader(model_name, device)
+                self._refcounts[key] = 0
+            self._refcounts[key] += 1
+            return self._models[key]
+
+    def register(self, model_name, model, device=None):
+        """Make an already constructed encoder available under (model_name, device)"""
+        key = (model_name, device)
+        with self._lock:
+            self._models[key] = model
+            self._refcounts.setdefault(key, 0)
+
+    def release(self, model_name=DEFAULT_MODEL_NAME, device=None):
+        """
+        Drop one reference to (model_name, device)
+
+        Returns True when this was the last reference and the model was unloaded
+        """
+        key = (model_name, device)
+        with self._lock:
+            if key not in self._refcounts:
+                return False
+
+            self._refcounts[key] -= 1
+            if self._refcounts[key] > 0:
+                return False
+
+            del self._refcounts[key]
+            del self._models[key]
+            return True
+
+    def refcount(self, model_name=DEFAULT_MODEL_NAME, device=None):
+        """Number of live holders of (model_name, device)"""
+        with self._lock:
+            return self._refcounts.get((model_name, device), 0)
+
+    def loaded_models(self):
+        """List of (model_name, device) keys currently loaded"""
+        with self._lock:
+            return list(self._models.keys())
+
+    def clear(self):
+        """Unload every model regardless of outstanding references"""
+        with self._lock:
+            self._models.clear()
+            self._refcounts.clear()
+
+
+# Process-wide default registry shared by all CRE components
+_default_registry = EmbeddingModelRegistry()
+
+
+def get_registry():
+    """Return the process-wide embedding model registry"""
+    return _default_registry
+
+
+def acquire_model(model_name=DEFAULT_MODEL_NAME, device=None):
+    """Acquire a shared encoder from the process-wide registry"""
+    return _default_registry.acquire(model_name, device)
+
+
+def release_model(model_name=DEFAULT_MODEL_NAME, device=None):
+    """Release a shared encoder back to the process-wide registry"""
+    return _default_registry.release(model_name, device)
@@ -8,19 +8,45 @@ import numpy as np
 import re
 from scipy.spatial.distance import cosine
 
+try:
+    from embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from embedding_cache import cached_encoder
+    from hilbert_geometry import row_cosine
+except ImportError:
+    from .embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from .embedding_cache import cached_encoder
+    from .hilbert_geometry import row_cosine
+
 class CosmicMetrics:
     """
     WHAT: Comprehensive evaluation metrics for cosmic resonance
     INCLUDES: Traditional scoring + Mathematical validation integration
+    HOW-TO: Pass an encoder (anything with encode(list_of_texts)) to share an
+            already loaded model; otherwise one is acquired from the registry
+            on first use
     """
     
-    def __init__(self):
+    def __init__(self, embedding_model=None, model_name=DEFAULT_MODEL_NAME, device=None):
+        self.embedding_model = embedding_model
+        self.model_name = model_name
+        self.device = device
+        self._owns_model = False
         print("📊 Cosmic Evaluation Metrics Initialized")
     
-    def multi_dimensional_scoring(self, parent_a, parent_b, child):
+    def release(self):
+        """Return a registry-acquired embedding model"""
+        if self._owns_model:
+            release_model(self.model_name, self.device)
+            self.embedding_model = None
+            self._owns_model = False
+    
+    def multi_dimensional_scoring(self, parent_a, parent_b, child, vectors=None):
         """
         Multi-dimensional scoring of narrative synthesis
         
+        vectors: optional precomputed embeddings (vec_a, vec_b, vec_c) so the
+                 caller's single batched encode can be reused
+        
         Returns dict with individual dimension scores
         """
         scores = {}
@@ -38,10 +64,33 @@ class CosmicMetrics:
         scores['structure'] = self._score_structural_integrity(child)
         
         # 5. Semantic Coherence
-        scores['semantic_coherence'] = self._score_semantic_coherence(parent_a, parent_b, child)
+        scores['semantic_coherence'] = self._score_semantic_coherence(
+            parent_a, parent_b, child, vectors=vectors
+        )
         
         return scores
     
+    def multi_dimensional_scoring_batch(self, triples, vectors_a, vectors_b, vectors_c):
+        """
+        Score N (parent_a, parent_b, child) triples at once
+        
+        vectors_a, vectors_b, vectors_c: stacked (N, d) embeddings aligned with triples
+        Returns one score dict per triple, matching multi_dimensional_scoring
+        """
+        semantic_coherence = self._semantic_coherence_matrix(vectors_a, vectors_b, vectors_c)
+        
+        batch_scores = []
+        for (parent_a, parent_b, child), coherence in zip(triples, semantic_coherence):
+            batch_scores.append({
+                'length_harmony': self._score_length_harmony(parent_a, parent_b, child),
+                'novelty': self._score_novelty(parent_a, parent_b, child),
+                'richness': self._score_conceptual_richness(parent_a, parent_b, child),
+                'structure': self._score_structural_integrity(child),
+                'semantic_coherence': coherence
+            })
+        
+        return batch_scores
+    
     def _score_length_harmony(self, parent_a, parent_b, child):
         """Score harmony in narrative lengths"""
         lengths = [len(parent_a.split()), len(parent_b.split()), len(child.split())]
@@ -112,28 +161,45 @@ class CosmicMetrics:
         
         return score
     
-    def _score_semantic_coherence(self, parent_a, parent_b, child):
+    def _score_semantic_coherence(self, parent_a, parent_b, child, vectors=None):
         """Score semantic coherence using embeddings"""
-        try:
-            from sentence_transformers import SentenceTransformer
-            model = SentenceTransformer('all-mpnet-base-v2')
-            
-            vectors = model.encode([parent_a, parent_b, child])
-            vec_a, vec_b, vec_c = vectors
-            
-            # Calculate semantic relationships
-            parent_similarity = 1 - cosine(vec_a, vec_b)
-            child_to_a = 1 - cosine(vec_c, vec_a)
-            child_to_b = 1 - cosine(vec_c, vec_b)
-            
-            # Coherence: child should relate to both parents
-            coherence = (child_to_a + child_to_b) / 2
-            
-            return max(0, min(1, coherence))
-            
-        except ImportError:
-            # Fallback if embeddings not available
-            return 0.7
+        if vectors is None:
+            encoder = self._get_encoder()
+            if encoder is None:
+                # Fallback if embeddings not available
+                return 0.7
+            vectors = encoder.encode([parent_a, parent_b, child])
+        
+        vec_a, vec_b, vec_c = np.asarray(vectors, dtype=np.float64)
+        
+        # Calculate semantic relationships
+        parent_similarity = 1 - cosine(vec_a, vec_b)
+        child_to_a = 1 - cosine(vec_c, vec_a)
+        child_to_b = 1 - cosine(vec_c, vec_b)
+        
+        # Coherence: child should relate to both parents
+        coherence = (child_to_a + child_to_b) / 2
+        
+        return max(0, min(1, coherence))
+    
+    def _semantic_coherence_matrix(self, vectors_a, vectors_b, vectors_c):
+        """Row-wise semantic coherence for stacked triples"""
+        child_to_a = row_cosine(vectors_c, vectors_a)
+        child_to_b = row_cosine(vectors_c, vectors_b)
+        
+        return np.clip((child_to_a + child_to_b) / 2, 0, 1)
+    
+    def _get_encoder(self):
+        """Injected encoder, or the shared registry model acquired once on first use"""
+        if self.embedding_model is None:
+            try:
+                self.embedding_model = cached_encoder(
+                    acquire_model(self.model_name, self.device), self.model_name
+                )
+                self._owns_model = True
+            except ImportError:
+                return None
+        return self.embedding_model
     
     def _is_verb_like(self, word):
         """Simple heuristic for verb-like words"""
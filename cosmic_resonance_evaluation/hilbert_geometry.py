@@ -0,0 +1,91 @@
+# hilbert_geometry.py
+"""
+📐 HILBERT GEOMETRY - Vectorized kernels over stacked narrative embeddings
+"""
+
+import numpy as np
+
+
+def compute_dtype(*arrays):
+    """float64 stays float64; float32/float16 (and anything else) are computed in float32"""
+    if any(np.asarray(a).dtype == np.float64 for a in arrays):
+        return np.float64
+    return np.float32
+
+
+def as_matrix(X, dtype=None):
+    """View an (N, d) or (d,) embedding array as a 2-D matrix in the compute dtype"""
+    X = np.asarray(X)
+    if X.ndim == 1:
+        X = X[np.newaxis, :]
+    return X.astype(dtype or compute_dtype(X), copy=False)
+
+
+def squared_norms(X):
+    """Row-wise |x|² (the J_0 consciousness current)"""
+    X = as_matrix(X)
+    return np.einsum('ij,ij->i', X, X)
+
+
+def normalize_rows(X):
+    """Unit-normalize rows; all-zero rows stay zero"""
+    X = as_matrix(X)
+    norms = np.sqrt(np.einsum('ij,ij->i', X, X))
+    return X / np.where(norms > 0, norms, 1)[:, np.newaxis]
+
+
+def _cosine_from_dots(dots, norms_x, norms_y):
+    """Cosine from row dot products and squared norms; zero vectors give 0"""
+    denominator = np.sqrt(norms_x * norms_y)
+    return np.clip(dots / np.where(denominator > 0, denominator, 1), -1.0, 1.0)
+
+
+def row_cosine(X, Y):
+    """Cosine similarity of row i of X with row i of Y, clipped to [-1, 1]"""
+    dtype = compute_dtype(X, Y)
+    X, Y = as_matrix(X, dtype), as_matrix(Y, dtype)
+    return _cosine_from_dots(np.einsum('ij,ij->i', X, Y), squared_norms(X), squared_norms(Y))
+
+
+def pairwise_cosine(X, Y=None):
+    """Full cosine similarity matrix between rows of X and rows of Y (X with itself if Y is None)"""
+    Xn = normalize_rows(X)
+    Yn = Xn if Y is None else normalize_rows(as_matrix(Y, Xn.dtype))
+    return np.clip(Xn @ Yn.T, -1.0, 1.0)
+
+
+def triple_geometry(vectors_a, vectors_b, vectors_c):
+    """
+    Hilbert-space geometry for N (parent_a, parent_b, child) triples
+
+    vectors_a, vectors_b, vectors_c: stacked (N, d) embeddings (float64, float32 or float16)
+    Returns a dict of length-N arrays:
+        parent_similarity, heritage_a, heritage_b, child_heritage,
+        novelty_coefficient, geometric_coherence, J_0_a, J_0_b, J_0_c, conservation_ratio
+    """
+    dtype = compute_dtype(vectors_a, vectors_b, vectors_c)
+    A = as_matrix(vectors_a, dtype)
+    B = as_matrix(vectors_b, dtype)
+    C = as_matrix(vectors_c, dtype)
+
+    # J_0 = |v|² doubles as the cosine denominator, so each matrix is read once for norms
+    J_0_a, J_0_b, J_0_c = squared_norms(A), squared_norms(B), squared_norms(C)
+    parent_similarity = _cosine_from_dots(np.einsum('ij,ij->i', A, B), J_0_a, J_0_b)
+    heritage_a = _cosine_from_dots(np.einsum('ij,ij->i', C, A), J_0_c, J_0_a)
+    heritage_b = _cosine_from_dots(np.einsum('ij,ij->i', C, B), J_0_c, J_0_b)
+
+    input_current = J_0_a + J_0_b
+    conservation_ratio = np.where(input_current > 0, J_0_c / np.where(input_current > 0, input_current, 1), 1.0)
+
+    return {
+        'parent_similarity': parent_similarity,
+        'heritage_a': heritage_a,
+        'heritage_b': heritage_b,
+        'child_heritage': (heritage_a + heritage_b) / 2,
+        'novelty_coefficient': np.maximum(0, (heritage_a + heritage_b) - parent_similarity),
+        'geometric_coherence': np.mean([parent_similarity, heritage_a, heritage_b], axis=0),
+        'J_0_a': J_0_a,
+        'J_0_b': J_0_b,
+        'J_0_c': J_0_c,
+        'conservation_ratio': conservation_ratio
+    }
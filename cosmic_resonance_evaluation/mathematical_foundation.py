@@ -4,18 +4,70 @@
 """
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
-import networkx as nx
 from scipy.spatial.distance import cosine
 
+try:
+    from embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from embedding_cache import cached_encoder
+    import hilbert_geometry
+    from meaning_graph import MeaningGraph, DEFAULT_SIMILARITY_THRESHOLD
+except ImportError:
+    from .embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from .embedding_cache import cached_encoder
+    from . import hilbert_geometry
+    from .meaning_graph import MeaningGraph, DEFAULT_SIMILARITY_THRESHOLD
+
+class EmbeddingContext:
+    """
+    WHAT: One (parent_a, parent_b, child) triple and its embeddings, encoded once
+    HOW-TO: Build with EmbeddingContext.encode(model, a, b, c) and hand to every validator
+    """
+    
+    def __init__(self, parent_a, parent_b, child, vectors=None):
+        self.parent_a = parent_a
+        self.parent_b = parent_b
+        self.child = child
+        # float64 so scalar and batched validation agree to rounding error
+        self.vectors = np.asarray(vectors, dtype=np.float64) if vectors is not None else None
+    
+    @classmethod
+    def encode(cls, embedding_model, parent_a, parent_b, child):
+        """Single batched forward pass for the whole triple"""
+        if embedding_model is None:
+            return cls(parent_a, parent_b, child)
+        vectors = embedding_model.encode([parent_a, parent_b, child])
+        return cls(parent_a, parent_b, child, vectors)
+    
+    @property
+    def has_vectors(self):
+        return self.vectors is not None
+    
+    @property
+    def narratives(self):
+        return [self.parent_a, self.parent_b, self.child]
+    
+    @property
+    def vec_a(self):
+        return self.vectors[0]
+    
+    @property
+    def vec_b(self):
+        return self.vectors[1]
+    
+    @property
+    def vec_c(self):
+        return self.vectors[2]
+
 class MathematicalFoundation:
     """
     WHAT: Mathematical implementation of UCP principles
     """
     
-    def __init__(self, embedding_model='all-mpnet-base-v2'):
+    def __init__(self, embedding_model=DEFAULT_MODEL_NAME, device=None):
+        self.model_name = embedding_model
+        self.device = device
         try:
-            self.embedding_model = SentenceTransformer(embedding_model)
+            self.embedding_model = cached_encoder(acquire_model(embedding_model, device), embedding_model)
             print("✅ Sentence Transformer loaded successfully")
         except Exception as e:
             print(f"⚠️  Could not load sentence transformer: {e}")
@@ -25,34 +77,40 @@ class MathematicalFoundation:
         self.meaning_graphs = {}
         print("🏛️ Mathematical Foundation Initialized")
     
-    def validate_ucp_principles(self, parent_a, parent_b, child):
+    def release(self):
+        """Return the shared embedding model to the registry"""
+        if self.embedding_model is not None:
+            release_model(self.model_name, self.device)
+            self.embedding_model = None
+    
+    def validate_ucp_principles(self, parent_a, parent_b, child, vectors=None):
         """
         Validate Universal Consciousness Principles for narrative synthesis
+        
+        vectors: optional precomputed embeddings (vec_a, vec_b, vec_c); otherwise
+                 the triple is encoded once here and shared by every validator
         """
         print("   📐 Running mathematical validation...")
         
         validation_results = {}
         
         try:
+            if vectors is not None:
+                context = EmbeddingContext(parent_a, parent_b, child, vectors)
+            else:
+                context = EmbeddingContext.encode(self.embedding_model, parent_a, parent_b, child)
+            
             # 1. Hilbert Space Validation
-            validation_results['hilbert_space'] = self._validate_hilbert_space(
-                parent_a, parent_b, child
-            )
+            validation_results['hilbert_space'] = self._validate_hilbert_space(context)
             
             # 2. Adjoint Functor Coupling  
-            validation_results['adjoint_coupling'] = self._validate_adjoint_coupling(
-                parent_a, parent_b, child
-            )
+            validation_results['adjoint_coupling'] = self._validate_adjoint_coupling(context)
             
             # 3. Consciousness Current Conservation
-            validation_results['consciousness_conservation'] = self._validate_conservation(
-                parent_a, parent_b, child
-            )
+            validation_results['consciousness_conservation'] = self._validate_conservation(context)
             
             # 4. Graph Curvature Pattern Extraction
-            validation_results['graph_curvature'] = self._validate_graph_curvature(
-                parent_a, parent_b, child
-            )
+            validation_results['graph_curvature'] = self._validate_graph_curvature(context)
             
         except Exception as e:
             print(f"   ⚠️  Mathematical validation error: {e}")
@@ -66,12 +124,105 @@ class MathematicalFoundation:
         
         return validation_results
     
-    def _validate_hilbert_space(self, parent_a, parent_b, child):
+    def validate_ucp_principles_batch(self, vectors_a, vectors_b, vectors_c):
+        """
+        Vectorized validate_ucp_principles for N triples
+        
+        vectors_a, vectors_b, vectors_c: stacked (N, d) embeddings of parent_a, parent_b, child
+                                         (float64 matches the scalar path; float32/float16 are
+                                         computed in float32)
+        Returns one validation dict per triple with the same fields as the scalar path
+        """
+        dtype = hilbert_geometry.compute_dtype(vectors_a, vectors_b, vectors_c)
+        A = hilbert_geometry.as_matrix(vectors_a, dtype)
+        B = hilbert_geometry.as_matrix(vectors_b, dtype)
+        C = hilbert_geometry.as_matrix(vectors_c, dtype)
+        n_triples, dimensionality = A.shape
+        
+        # Hilbert space geometry and consciousness currents J_0 = |v|^2
+        geometry = hilbert_geometry.triple_geometry(A, B, C)
+        parent_similarity = geometry['parent_similarity']
+        heritage_a = geometry['heritage_a']
+        heritage_b = geometry['heritage_b']
+        novelty = geometry['novelty_coefficient']
+        child_heritage = geometry['child_heritage']
+        geometric_coherence = geometry['geometric_coherence']
+        J0_a, J0_b, J0_c = geometry['J_0_a'], geometry['J_0_b'], geometry['J_0_c']
+        input_current = J0_a + J0_b
+        conservation_ratio = geometry['conservation_ratio']
+        
+        # Adjoint coupling
+        left_hom = np.einsum('ij,ij->i', self._functor_F(A), B)
+        right_hom = np.einsum('ij,ij->i', A, self._functor_G(B))
+        adjoint_strength = 1 - np.abs(left_hom - right_hom)
+        
+        # Ricci curvature of each 3-node meaning graph (a=0, b=1, c=2), with the MeaningGraph edge rule
+        # (similarity > threshold). For edge (x, y) with third node z:
+        # curvature = [z adjacent to both] / (2 + [z adjacent to either])
+        threshold = DEFAULT_SIMILARITY_THRESHOLD
+        e_ab = parent_similarity > threshold
+        e_ac = heritage_a > threshold
+        e_bc = heritage_b > threshold
+        curvature_sum = (
+            e_ab * (e_ac & e_bc) / (2 + (e_ac | e_bc)) +
+            e_ac * (e_ab & e_bc) / (2 + (e_ab | e_bc)) +
+            e_bc * (e_ab & e_ac) / (2 + (e_ab | e_ac))
+        )
+        edge_count = e_ab.astype(int) + e_ac + e_bc
+        average_curvature = np.where(edge_count > 0, curvature_sum / np.maximum(edge_count, 1), 0)
+        
+        overall_score = np.mean([
+            geometric_coherence,
+            novelty,
+            np.maximum(0, adjoint_strength),
+            1 - np.abs(conservation_ratio - 1),
+            average_curvature
+        ], axis=0)
+        
+        results = []
+        for i in range(n_triples):
+            power = average_curvature[i]
+            results.append({
+                'hilbert_space': {
+                    'dimensionality': dimensionality,
+                    'parent_similarity': parent_similarity[i],
+                    'child_heritage': child_heritage[i],
+                    'novelty_coefficient': novelty[i],
+                    'geometric_coherence': geometric_coherence[i]
+                },
+                'adjoint_coupling': {
+                    'adjoint_strength': max(0, adjoint_strength[i]),
+                    'is_adjoint': adjoint_strength[i] > 0.7,
+                    'left_hom': left_hom[i],
+                    'right_hom': right_hom[i],
+                    'cartesian_split_resolved': adjoint_strength[i] > 0.7
+                },
+                'consciousness_conservation': {
+                    'input_consciousness': input_current[i],
+                    'output_consciousness': J0_c[i],
+                    'conservation_ratio': conservation_ratio[i],
+                    'is_conserved': abs(conservation_ratio[i] - 1.0) < 0.2,
+                    'currents': {
+                        'parent_a': self._current_components(J0_a[i]),
+                        'parent_b': self._current_components(J0_b[i]),
+                        'child': self._current_components(J0_c[i])
+                    }
+                },
+                'graph_curvature': {
+                    'average_curvature': power,
+                    'pattern_power': power,
+                    'pattern_capability': 'HIGH' if power > 0.3 else 'MEDIUM' if power > 0.15 else 'LOW',
+                    'graph_density': 0.6  # Fallback
+                },
+                'overall_score': overall_score[i]
+            })
+        
+        return results
+    
+    def _validate_hilbert_space(self, context):
         """Validate narratives in Hilbert space structure"""
-        if self.embedding_model:
-            vec_a = self.embedding_model.encode([parent_a])[0]
-            vec_b = self.embedding_model.encode([parent_b])[0]
-            vec_c = self.embedding_model.encode([child])[0]
+        if context.has_vectors:
+            vec_a, vec_b, vec_c = context.vec_a, context.vec_b, context.vec_c
             
             # Calculate geometric relationships
             parent_similarity = 1 - cosine(vec_a, vec_b)
@@ -87,18 +238,17 @@ class MathematicalFoundation:
             novelty_coefficient = 0.2
         
         return {
-            'dimensionality': 768 if self.embedding_model else 100,
+            'dimensionality': context.vectors.shape[1] if context.has_vectors else 100,
             'parent_similarity': parent_similarity,
             'child_heritage': (child_heritage_a + child_heritage_b) / 2,
             'novelty_coefficient': max(0, novelty_coefficient),
             'geometric_coherence': np.mean([parent_similarity, child_heritage_a, child_heritage_b])
         }
     
-    def _validate_adjoint_coupling(self, parent_a, parent_b, child):
+    def _validate_adjoint_coupling(self, context):
         """Validate adjoint functor observer-reality coupling"""
-        if self.embedding_model:
-            vec_a = self.embedding_model.encode([parent_a])[0]
-            vec_b = self.embedding_model.encode([parent_b])[0]
+        if context.has_vectors:
+            vec_a, vec_b = context.vec_a, context.vec_b
             
             # Simplified adjoint condition check
             F_a = self._functor_F(vec_a)
@@ -122,12 +272,10 @@ class MathematicalFoundation:
             'cartesian_split_resolved': adjoint_strength > 0.7
         }
     
-    def _validate_conservation(self, parent_a, parent_b, child):
+    def _validate_conservation(self, context):
         """Validate consciousness current conservation ∇ₘJᵐ = 0"""
-        if self.embedding_model:
-            vec_a = self.embedding_model.encode([parent_a])[0]
-            vec_b = self.embedding_model.encode([parent_b])[0] 
-            vec_c = self.embedding_model.encode([child])[0]
+        if context.has_vectors:
+            vec_a, vec_b, vec_c = context.vec_a, context.vec_b, context.vec_c
             
             J_a = self._calculate_consciousness_current(vec_a)
             J_b = self._calculate_consciousness_current(vec_b)
@@ -155,12 +303,10 @@ class MathematicalFoundation:
             }
         }
     
-    def _validate_graph_curvature(self, parent_a, parent_b, child):
+    def _validate_graph_curvature(self, context):
         """Validate graph curvature for pattern extraction"""
-        narratives = [parent_a, parent_b, child]
-        
         try:
-            graph = self._build_meaning_graph(narratives)
+            graph = self._build_meaning_graph(context.narratives, vectors=context.vectors)
             curvatures = self._compute_ricci_curvature(graph)
             
             if curvatures:
@@ -192,7 +338,10 @@ class MathematicalFoundation:
     def _calculate_consciousness_current(self, vector):
         """Calculate consciousness current Jᵐ for a narrative vector"""
         J_0 = np.linalg.norm(vector)**2 if len(vector) > 0 else 1.0
-        
+        return self._current_components(J_0)
+    
+    def _current_components(self, J_0):
+        """Assemble Jᵐ from its time component"""
         # Simplified spatial components
         J_1 = 0.15
         J_2 = 0.25  
@@ -200,54 +349,58 @@ class MathematicalFoundation:
         
         return {'J_0': J_0, 'J_1': J_1, 'J_2': J_2, 'J_3': J_3}
     
-    def _build_meaning_graph(self, narratives):
-        """Build meaning graph from narratives"""
-        if self.embedding_model:
+    def _build_meaning_graph(self, narratives, vectors=None):
+        """Build sparse meaning graph from narratives (reusing precomputed vectors when given)"""
+        if vectors is None and self.embedding_model:
             vectors = self.embedding_model.encode(narratives)
-        else:
-            # Create random vectors for fallback
-            vectors = [np.random.randn(100) for _ in narratives]
-        
-        G = nx.Graph()
         
-        # Add nodes
-        for i, (narr, vec) in enumerate(zip(narratives, vectors)):
-            G.add_node(i, narrative=narr, vector=vec)
+        if vectors is None:
+            # No geometry available: every pair gets the fallback similarity
+            return MeaningGraph.complete(len(narratives), weight=0.7, narratives=narratives)
         
-        # Add edges based on similarity
-        for i in range(len(narratives)):
-            for j in range(i+1, len(narratives)):
-                if self.embedding_model:
-                    similarity = 1 - cosine(vectors[i], vectors[j])
-                else:
-                    similarity = 0.7  # Fallback
-                
-                if similarity > 0.6:
-                    G.add_edge(i, j, weight=similarity)
-        
-        return G
+        return MeaningGraph.from_vectors(vectors, threshold=DEFAULT_SIMILARITY_THRESHOLD,
+                                         narratives=narratives)
     
     def _compute_ricci_curvature(self, graph):
         """Compute simplified Ricci curvature for graph"""
-        curvatures = {}
+        return graph.curvature_dict('overlap')
+    
+    def validate_graph_curvature_population(self, narratives=None, vectors=None,
+                                            threshold=DEFAULT_SIMILARITY_THRESHOLD, k=None,
+                                            method='ollivier_bound', index=None):
+        """
+        Graph curvature validation over a whole generation of narratives
         
-        for edge in graph.edges():
-            i, j = edge
-            
-            neighbors_i = set(graph.neighbors(i))
-            neighbors_j = set(graph.neighbors(j))
-            
-            common_neighbors = neighbors_i.intersection(neighbors_j)
-            total_neighbors = neighbors_i.union(neighbors_j)
-            
-            if len(total_neighbors) > 0:
-                curvature = len(common_neighbors) / len(total_neighbors)
-            else:
-                curvature = 0
-            
-            curvatures[edge] = curvature
+        vectors: optional (N, d) embeddings; otherwise narratives are encoded in one batch
+        k: build a k-NN graph instead of the all-pairs thresholded graph
+        index: optional ANN index over the same vectors (ids 0..N-1) used for the k-NN graph
+        method: 'ollivier_bound' (vectorized Ollivier-Ricci lower bound), 'ollivier' (exact,
+                one transport problem per edge) or 'overlap'
+        """
+        if vectors is None:
+            if narratives is None:
+                raise ValueError("Graph curvature validation needs narratives or precomputed vectors")
+            if self.embedding_model is None:
+                raise ValueError("No embedding model is loaded to encode the narratives; "
+                                 "pass precomputed vectors instead")
+            vectors = self.embedding_model.encode(list(narratives))
+        
+        graph = MeaningGraph.from_vectors(vectors, threshold=threshold, k=k, narratives=narratives,
+                                          index=index)
+        curvatures = graph.curvature(method)
+        avg_curvature = float(np.mean(curvatures)) if len(curvatures) else 0.0
         
-        return curvatures
+        return {
+            'average_curvature': avg_curvature,
+            'pattern_power': avg_curvature,
+            'pattern_capability': 'HIGH' if avg_curvature > 0.3 else 'MEDIUM' if avg_curvature > 0.15 else 'LOW',
+            'graph_density': graph.density,
+            'num_nodes': graph.n_nodes,
+            'num_edges': graph.n_edges,
+            'edge_curvature': curvatures,
+            'node_curvature': graph.node_curvature(method, edge_curvature=curvatures),
+            'method': method
+        }
     
     def _calculate_mathematical_score(self, validation_results):
         """Calculate overall mathematical validation score"""
@@ -6,7 +6,13 @@ Advanced narrative generation using multiple methods
 
 import random
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+try:
+    from embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from embedding_cache import cached_encoder
+except ImportError:
+    from .embedding_registry import acquire_model, release_model, DEFAULT_MODEL_NAME
+    from .embedding_cache import cached_encoder
 
 class NarrativeSynthesis:
     """
@@ -14,12 +20,20 @@ class NarrativeSynthesis:
     MATHEMATICAL: Incorporates UCP principles in synthesis process
     """
     
-    def __init__(self, model_name='all-mpnet-base-v2'):
-        self.embedding_model = SentenceTransformer(model_name)
+    def __init__(self, model_name=DEFAULT_MODEL_NAME, device=None):
+        self.model_name = model_name
+        self.device = device
+        self.embedding_model = cached_encoder(acquire_model(model_name, device), model_name)
         self.templates = self._initialize_templates()
         
         print("🌀 Narrative Synthesis Engine Initialized")
     
+    def release(self):
+        """Return the shared embedding model to the registry"""
+        if self.embedding_model is not None:
+            release_model(self.model_name, self.device)
+            self.embedding_model = None
+    
     def template_synthesis(self, parent_a, parent_b):
         """Template-based narrative synthesis"""
         template = random.choice(self.templates)
@@ -48,8 +62,7 @@ class NarrativeSynthesis:
     
     def adjoint_synthesis(self, parent_a, parent_b):
         """Adjoint functor-based synthesis"""
-        vec_a = self.embedding_model.encode([parent_a])[0]
-        vec_b = self.embedding_model.encode([parent_b])[0]
+        vec_a, vec_b = self.embedding_model.encode([parent_a, parent_b])
         
         # Apply adjoint coupling: F(A) and G(B) then combine
         F_a = self._functor_F(vec_a)  # Observer -> Reality
@@ -79,8 +92,7 @@ class NarrativeSynthesis:
     def hybrid_synthesis(self, parent_a, parent_b):
         """Hybrid synthesis combining template and adjoint methods"""
         # Use adjoint method for conceptual guidance
-        vec_a = self.embedding_model.encode([parent_a])[0]
-        vec_b = self.embedding_model.encode([parent_b])[0]
+        vec_a, vec_b = self.embedding_model.encode([parent_a, parent_b])
         
         # Calculate conceptual similarity to guide template selection
         similarity = 1 - self._cosine_similarity(vec_a, vec_b)
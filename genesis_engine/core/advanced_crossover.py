@@ -3,9 +3,13 @@
 
 import random
 import math
-from typing import List, Dict, Any, Tuple
+from typing import List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import re
+import numpy as np
+from .concept_embeddings import ConceptEmbeddings, SimilarityBlocks, default_concept_embeddings, top_pairs
+from .offspring import OffspringBatch, OffspringBatchBuilder, OffspringRecord, unique_parents, vector_id_of
+from .semantic_network import SemanticNetwork, load_semantic_network
 
 @dataclass
 class ResonancePoint:
@@ -29,60 +33,20 @@ class SemanticRelationship:
 class AdvancedResonantCrossoverEngine:
     """Advanced crossover with semantic similarity and relationship detection"""
     
-    def __init__(self):
+    def __init__(self, semantic_network: Optional[SemanticNetwork] = None,
+                 concept_groups_path: Optional[str] = None,
+                 concept_embeddings: Optional[ConceptEmbeddings] = None):
         self.resonance_threshold = 0.6
-        self.max_concept_pairs = 15
-        self.semantic_network = self._build_semantic_network()
+        self.max_resonance_points = 5
+        self.max_relationships = 8
+        if concept_embeddings is None:
+            concept_embeddings = default_concept_embeddings()
+        self.concept_embeddings = concept_embeddings
+        # Compiled once per process (per groups file) and shared by every engine
+        if semantic_network is None:
+            semantic_network = load_semantic_network(concept_groups_path)
+        self.semantic_network = semantic_network
         
-    def _build_semantic_network(self) -> Dict[str, Dict[str, float]]:
-        """Build a simple semantic network for concept relationships"""
-        # This simulates a word embedding space with semantic relationships
-        # In a full implementation, this would use actual word embeddings
-        
-        semantic_groups = {
-            'consciousness': ['awareness', 'mind', 'cognition', 'sentience', 'perception'],
-            'love': ['compassion', 'care', 'empathy', 'kindness', 'devotion'],
-            'evolution': ['development', 'growth', 'progress', 'adaptation', 'emergence'],
-            'resonance': ['harmony', 'vibration', 'frequency', 'sympathy', 'alignment'],
-            'mathematics': ['symmetry', 'logic', 'pattern', 'structure', 'calculation'],
-            'divine': ['sacred', 'holy', 'spiritual', 'transcendent', 'eternal'],
-            'creation': ['formation', 'generation', 'synthesis', 'production', 'inception'],
-            'cosmic': ['universal', 'celestial', 'astral', 'galactic', 'infinite']
-        }
-        
-        network = {}
-        
-        # Build similarity matrix
-        all_concepts = set()
-        for group_concepts in semantic_groups.values():
-            all_concepts.update(group_concepts)
-        
-        for concept in all_concepts:
-            network[concept] = {}
-            for other_concept in all_concepts:
-                if concept == other_concept:
-                    network[concept][other_concept] = 1.0
-                else:
-                    # Check if concepts are in same semantic group
-                    similarity = 0.1  # Base similarity
-                    
-                    for group_name, group_concepts in semantic_groups.items():
-                        if concept in group_concepts and other_concept in group_concepts:
-                            similarity = 0.8  # High similarity within group
-                            break
-                        elif concept in group_concepts or other_concept in group_concepts:
-                            # Check if they share any group
-                            for other_group_name, other_group_concepts in semantic_groups.items():
-                                if group_name != other_group_name:
-                                    if (concept in group_concepts and other_concept in other_group_concepts) or \
-                                       (concept in other_group_concepts and other_concept in group_concepts):
-                                        similarity = 0.4  # Medium cross-group similarity
-                                        break
-                    
-                    network[concept][other_concept] = similarity
-        
-        return network
-    
     def crossover(self, parent_a, parent_b):
         """Advanced crossover with semantic relationship analysis"""
         try:
@@ -90,10 +54,6 @@ class AdvancedResonantCrossoverEngine:
             concepts_a = self._safe_get_concepts(parent_a)
             concepts_b = self._safe_get_concepts(parent_b)
             
-            # Limit concepts for performance
-            concepts_a = concepts_a[:8]
-            concepts_b = concepts_b[:8]
-            
             # 1. Advanced resonance detection with semantic analysis
             resonance_points = self._advanced_resonance_detection(concepts_a, concepts_b)
             
@@ -109,106 +69,126 @@ class AdvancedResonantCrossoverEngine:
             blended_content = self._semantic_content_generation(content_a, content_b, relationships)
             
             # Create enhanced offspring
-            offspring = type('AdvancedOffspring', (), {
-                'vector_id': f"advanced_{getattr(parent_a, 'vector_id', 'A')}_{getattr(parent_b, 'vector_id', 'B')}",
-                'content': blended_content,
-                'concepts': blended_concepts,
-                'coherence': (getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
-                'parent_ids': [getattr(parent_a, 'vector_id', 'A'), getattr(parent_b, 'vector_id', 'B')],
-                'resonance_points': resonance_points,
-                'semantic_relationships': relationships
-            })()
-            
-            return offspring
+            id_a, id_b = vector_id_of(parent_a, 'A'), vector_id_of(parent_b, 'B')
+            return OffspringRecord(
+                vector_id=f"advanced_{id_a}_{id_b}",
+                content=blended_content,
+                concepts=blended_concepts,
+                coherence=(getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
+                parent_ids=[id_a, id_b],
+                kind='advanced',
+                resonance_points=resonance_points,
+                semantic_relationships=relationships
+            )
             
         except Exception as e:
             print(f"   Advanced crossover failed, using fallback: {e}")
             return self._fallback_crossover(parent_a, parent_b)
     
+    def crossover_batch(self, pairs: Sequence[Tuple[Any, Any]]) -> OffspringBatch:
+        """
+        One child per (parent_a, parent_b) pair. Concepts, content phrases and semantic network rows
+        are extracted once per distinct parent, and every pair's resonance block comes from one
+        embedding pass over all parent concepts.
+        """
+        parents, pair_rows = unique_parents(pairs)
+        concepts = [self._safe_get_concepts(p) for p in parents]
+        contents = [self._safe_get_content(p) for p in parents]
+        phrases = [self._extract_key_phrases(c) for c in contents]
+        coherence = [getattr(p, 'coherence', 0.3) for p in parents]
+        network_rows = [self.semantic_network.indices(c) for c in concepts]
+        blocks = SimilarityBlocks(self.concept_embeddings, concepts)
+        
+        builder = OffspringBatchBuilder(parents, pair_rows, kind='advanced')
+        for a, b in pair_rows.tolist():
+            try:
+                lexical = blocks.block(a, b).astype(np.float64)
+                semantic = self._semantic_block(network_rows[a], network_rows[b], lexical)
+                resonance_points = self._resonance_points(concepts[a], concepts[b], lexical, semantic)
+                relationships = self._strongest_relationships(concepts[a], concepts[b], semantic)
+                builder.add(
+                    content=self._semantic_content_generation(contents[a], contents[b], relationships,
+                                                              phrases[a], phrases[b]),
+                    concepts=self._semantic_concept_blending(concepts[a], concepts[b], resonance_points, relationships),
+                    coherence=(coherence[a] + coherence[b]) / 2,
+                    resonance=resonance_points[0].resonance_strength if resonance_points else 0.0,
+                    resonance_points=len(resonance_points)
+                )
+            except Exception as e:
+                print(f"   Advanced crossover failed, using fallback: {e}")
+                content, blended_concepts = self._fallback_blend(contents[a], contents[b], concepts[a], concepts[b])
+                builder.add(content=content, concepts=blended_concepts,
+                            coherence=(coherence[a] + coherence[b]) / 2, fallback=True)
+        return builder.build()
+    
     def _advanced_resonance_detection(self, concepts_a: List[str], concepts_b: List[str]) -> List[ResonancePoint]:
-        """Advanced resonance detection with semantic analysis"""
-        resonance_points = []
-        comparisons = 0
+        """Advanced resonance detection with semantic analysis over every concept pair"""
+        lexical = self._lexical_resonance_matrix(concepts_a, concepts_b)
+        semantic = self._semantic_resonance_matrix(concepts_a, concepts_b, lexical)
+        return self._resonance_points(concepts_a, concepts_b, lexical, semantic)
+    
+    def _resonance_points(self, concepts_a: List[str], concepts_b: List[str],
+                          lexical: np.ndarray, semantic: np.ndarray) -> List[ResonancePoint]:
+        """Strongest combined lexical/semantic pairs above the resonance threshold"""
+        combined = lexical * 0.3 + semantic * 0.7
         
-        for concept_a in concepts_a:
-            for concept_b in concepts_b:
-                if comparisons >= self.max_concept_pairs:
-                    break
-                    
-                # Calculate multiple resonance metrics
-                lexical_resonance = self._calculate_lexical_resonance(concept_a, concept_b)
-                semantic_resonance = self._calculate_semantic_resonance(concept_a, concept_b)
-                combined_resonance = (lexical_resonance * 0.3 + semantic_resonance * 0.7)
-                
-                if combined_resonance > self.resonance_threshold:
-                    # Determine relationship type
-                    relationship_type = self._determine_relationship_type(concept_a, concept_b, semantic_resonance)
-                    
-                    # Calculate emergent potential
-                    emergent_potential = self._calculate_emergent_potential(concept_a, concept_b, relationship_type)
-                    
-                    resonance_points.append(
-                        ResonancePoint(
-                            concept_a=concept_a,
-                            concept_b=concept_b,
-                            resonance_strength=combined_resonance,
-                            emergent_potential=emergent_potential,
-                            semantic_similarity=semantic_resonance,
-                            relationship_type=relationship_type
-                        )
-                    )
-                
-                comparisons += 1
+        resonance_points = []
+        for i, j, combined_resonance in top_pairs(combined, self.max_resonance_points, self.resonance_threshold):
+            concept_a, concept_b = concepts_a[i], concepts_b[j]
+            semantic_resonance = float(semantic[i, j])
+            
+            # Determine relationship type
+            relationship_type = self._determine_relationship_type(concept_a, concept_b, semantic_resonance)
+            
+            # Calculate emergent potential
+            emergent_potential = self._calculate_emergent_potential(concept_a, concept_b, relationship_type)
+            
+            resonance_points.append(
+                ResonancePoint(
+                    concept_a=concept_a,
+                    concept_b=concept_b,
+                    resonance_strength=combined_resonance,
+                    emergent_potential=emergent_potential,
+                    semantic_similarity=semantic_resonance,
+                    relationship_type=relationship_type
+                )
+            )
         
-        # Sort by resonance strength
-        resonance_points.sort(key=lambda x: x.resonance_strength, reverse=True)
-        return resonance_points[:5]  # Return top 5 resonance points
+        # Strongest first, top resonance points only
+        return resonance_points
+    
+    def _lexical_resonance_matrix(self, concepts_a: List[str], concepts_b: List[str]) -> np.ndarray:
+        """Lexical resonance of every pair: cosine of cached concept embeddings"""
+        return self.concept_embeddings.similarity(concepts_a, concepts_b).astype(np.float64)
+    
+    def _semantic_resonance_matrix(self, concepts_a: List[str], concepts_b: List[str],
+                                   lexical: np.ndarray) -> np.ndarray:
+        """Semantic network similarity where both concepts are known, half the lexical resonance otherwise"""
+        return self._semantic_block(self.semantic_network.indices(concepts_a),
+                                    self.semantic_network.indices(concepts_b), lexical)
+    
+    def _semantic_block(self, rows: np.ndarray, columns: np.ndarray, lexical: np.ndarray) -> np.ndarray:
+        """Semantic resonance from semantic network rows (-1 for unknown concepts)"""
+        semantic = lexical * 0.5
+        known_a, known_b = np.flatnonzero(rows >= 0), np.flatnonzero(columns >= 0)
+        semantic[np.ix_(known_a, known_b)] = self.semantic_network.similarity[np.ix_(rows[known_a], columns[known_b])]
+        return semantic
     
     def _calculate_lexical_resonance(self, concept_a: str, concept_b: str) -> float:
-        """Calculate lexical (word-based) resonance"""
+        """Calculate lexical (word-based) resonance from the concept embeddings"""
         if not concept_a or not concept_b:
             return 0.0
-            
-        a_lower = concept_a.lower()
-        b_lower = concept_b.lower()
-        
-        # Exact match
-        if a_lower == b_lower:
-            return 1.0
-        
-        # Shared substring
-        if a_lower in b_lower or b_lower in a_lower:
-            return 0.7
-        
-        # Shared letters with weighting
-        set_a = set(a_lower)
-        set_b = set(b_lower)
-        
-        if not set_a or not set_b:
-            return 0.2
-            
-        shared_letters = len(set_a & set_b)
-        total_letters = len(set_a | set_b)
-        
-        if total_letters > 0:
-            base_similarity = shared_letters / total_letters
-            
-            # Boost for shared prefixes/suffixes
-            if a_lower[:3] == b_lower[:3]:
-                base_similarity += 0.2
-            elif a_lower[-3:] == b_lower[-3:]:
-                base_similarity += 0.1
-                
-            return min(1.0, base_similarity)
-        
-        return 0.2
+        return float(self._lexical_resonance_matrix([concept_a], [concept_b])[0, 0])
     
     def _calculate_semantic_resonance(self, concept_a: str, concept_b: str) -> float:
         """Calculate semantic resonance using the semantic network"""
-        if concept_a not in self.semantic_network or concept_b not in self.semantic_network:
+        index = self.semantic_network.index
+        i = index.get(concept_a)
+        j = index.get(concept_b)
+        if i is None or j is None:
             return self._calculate_lexical_resonance(concept_a, concept_b) * 0.5
             
-        return self.semantic_network[concept_a].get(concept_b, 0.1)
+        return float(self.semantic_network.similarity[i, j])
     
     def _determine_relationship_type(self, concept_a: str, concept_b: str, semantic_similarity: float) -> str:
         """Determine the type of semantic relationship"""
@@ -235,35 +215,33 @@ class AdvancedResonantCrossoverEngine:
     
     def _analyze_semantic_relationships(self, concepts_a: List[str], concepts_b: List[str]) -> List[SemanticRelationship]:
         """Analyze semantic relationships between concept sets"""
+        lexical = self._lexical_resonance_matrix(concepts_a, concepts_b)
+        similarities = self._semantic_resonance_matrix(concepts_a, concepts_b, lexical)
+        return self._strongest_relationships(concepts_a, concepts_b, similarities)
+    
+    def _strongest_relationships(self, concepts_a: List[str], concepts_b: List[str],
+                                 similarities: np.ndarray) -> List[SemanticRelationship]:
+        """Most significant relationships of a semantic resonance matrix"""
         relationships = []
-        
-        for concept_a in concepts_a[:5]:  # Limit analysis
-            for concept_b in concepts_b[:5]:
-                similarity = self._calculate_semantic_resonance(concept_a, concept_b)
-                relationship_type = self._determine_relationship_type(concept_a, concept_b, similarity)
-                
-                # Calculate confidence based on similarity strength
-                confidence = min(1.0, similarity * 1.2)
-                
-                relationships.append(
-                    SemanticRelationship(
-                        concept_a=concept_a,
-                        concept_b=concept_b,
-                        similarity=similarity,
-                        relationship=relationship_type,
-                        confidence=confidence
-                    )
+        for i, j, similarity in top_pairs(similarities, self.max_relationships):
+            concept_a, concept_b = concepts_a[i], concepts_b[j]
+            relationships.append(
+                SemanticRelationship(
+                    concept_a=concept_a,
+                    concept_b=concept_b,
+                    similarity=similarity,
+                    relationship=self._determine_relationship_type(concept_a, concept_b, similarity),
+                    # Confidence based on similarity strength
+                    confidence=min(1.0, similarity * 1.2)
                 )
-        
-        # Return most significant relationships
-        relationships.sort(key=lambda x: x.similarity, reverse=True)
-        return relationships[:8]
+            )
+        return relationships
     
     def _semantic_concept_blending(self, concepts_a: List[str], concepts_b: List[str], 
                                  resonance_points: List[ResonancePoint], 
                                  relationships: List[SemanticRelationship]) -> List[str]:
-        """Blend concepts using semantic guidance"""
-        blended = set(concepts_a + concepts_b)
+        """Blend concepts using semantic guidance (first-seen order, independent of string hashing)"""
+        blended = dict.fromkeys(concepts_a + concepts_b)
         
         # Add emergent concepts from high-resonance pairs
         for point in resonance_points[:3]:
@@ -272,18 +250,20 @@ class AdvancedResonantCrossoverEngine:
                     emergent_concept = f"{point.concept_a}-{point.concept_b}"
                 else:
                     emergent_concept = f"{point.concept_a}_{point.concept_b}"
-                blended.add(emergent_concept)
+                blended[emergent_concept] = None
         
         # Add concepts from strong semantic relationships
         for rel in relationships[:3]:
             if rel.similarity > 0.7 and rel.confidence > 0.8:
                 blended_concept = f"{rel.concept_a}-{rel.concept_b}"
-                blended.add(blended_concept)
+                blended[blended_concept] = None
         
         return list(blended)[:10]  # Limit to 10 concepts
     
     def _semantic_content_generation(self, content_a: str, content_b: str, 
-                                   relationships: List[SemanticRelationship]) -> str:
+                                   relationships: List[SemanticRelationship],
+                                   phrases_a: Optional[List[str]] = None,
+                                   phrases_b: Optional[List[str]] = None) -> str:
         """Generate content using semantic relationships"""
         if not content_a and not content_b:
             return "Semantic resonance emerging..."
@@ -292,9 +272,11 @@ class AdvancedResonantCrossoverEngine:
         elif not content_b:
             return content_a
         
-        # Extract key phrases
-        phrases_a = self._extract_key_phrases(content_a)
-        phrases_b = self._extract_key_phrases(content_b)
+        # Extract key phrases (unless the caller already has them)
+        if phrases_a is None:
+            phrases_a = self._extract_key_phrases(content_a)
+        if phrases_b is None:
+            phrases_b = self._extract_key_phrases(content_b)
         
         # Use semantic relationships to guide blending
         if relationships and len(relationships) > 0:
@@ -344,25 +326,27 @@ class AdvancedResonantCrossoverEngine:
             content = ''
         return str(content)
     
+    def _fallback_blend(self, content_a: str, content_b: str,
+                        concepts_a: List[str], concepts_b: List[str]) -> Tuple[str, List[str]]:
+        """Content and concepts of a fallback child, shared by crossover and crossover_batch"""
+        return (f"{content_a} integrated with {content_b} through resonance",
+                list(dict.fromkeys(concepts_a + concepts_b))[:8])
+    
     def _fallback_crossover(self, parent_a, parent_b):
         """Fallback crossover method"""
-        content_a = self._safe_get_content(parent_a)
-        content_b = self._safe_get_content(parent_b)
-        concepts_a = self._safe_get_concepts(parent_a)
-        concepts_b = self._safe_get_concepts(parent_b)
-        
-        blended_content = f"{content_a} integrated with {content_b} through resonance"
-        blended_concepts = list(set(concepts_a + concepts_b))[:8]
-        
-        offspring = type('FallbackOffspring', (), {
-            'vector_id': f"fallback_{getattr(parent_a, 'vector_id', 'A')}_{getattr(parent_b, 'vector_id', 'B')}",
-            'content': blended_content,
-            'concepts': blended_concepts,
-            'coherence': (getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
-            'parent_ids': [getattr(parent_a, 'vector_id', 'A'), getattr(parent_b, 'vector_id', 'B')]
-        })()
+        blended_content, blended_concepts = self._fallback_blend(
+            self._safe_get_content(parent_a), self._safe_get_content(parent_b),
+            self._safe_get_concepts(parent_a), self._safe_get_concepts(parent_b))
         
-        return offspring
+        id_a, id_b = vector_id_of(parent_a, 'A'), vector_id_of(parent_b, 'B')
+        return OffspringRecord(
+            vector_id=f"fallback_{id_a}_{id_b}",
+            content=blended_content,
+            concepts=blended_concepts,
+            coherence=(getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
+            parent_ids=[id_a, id_b],
+            kind='fallback'
+        )
 
 # Advanced Resonant Crossover Engine
 print(" Advanced Resonant Crossover Engine loaded successfully")
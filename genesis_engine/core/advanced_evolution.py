@@ -2,12 +2,24 @@
 # Integrated with semantic similarity and advanced algorithms
 
 import random
+import time
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import math
 from .physics_of_meaning import EnhancedCRE
+from .fitness_cache import FitnessCache
+from .evaluation_executor import SerialEvaluationExecutor
+from .population_store import Interner, PopulationStore
+from .concept_index import ConceptIndex
+from .steady_state import throughput_report
+from .lineage import LineageStore
+from .checkpoint import save_checkpoint, load_checkpoint, restore_narratives, restore_histories, restore_random_state
 from .advanced_crossover import AdvancedResonantCrossoverEngine
+from .offspring import OffspringRecord
+
+# Cached in place of a CRE evaluation that failed, so the failure is not re-evaluated every generation
+FAILED_EVALUATION = object()
 
 @dataclass 
 class NarrativeState:
@@ -20,20 +32,53 @@ class NarrativeState:
     generation: int = 0
     parent_ids: List[str] = None
     semantic_quality: float = 0.0  # New: semantic coherence metric
+    objectives: Tuple[float, ...] = ()  # CRE components, kept by multi-objective engines
+    lineage_id: int = -1  # Row in the engine's LineageStore
     
     def __post_init__(self):
         if self.parent_ids is None:
             self.parent_ids = []
+    
+    @classmethod
+    def from_offspring(cls, offspring: OffspringRecord, parent_a: 'NarrativeState', parent_b: 'NarrativeState',
+                       state_id: str, generation: int, semantic_quality: float = 0.5) -> 'NarrativeState':
+        """Child state of a crossover record; lineage links come from the parent states themselves"""
+        return cls(
+            state_id=state_id,
+            content=offspring.content,
+            concepts=offspring.concepts,
+            coherence=(parent_a.coherence + parent_b.coherence) / 2,
+            parent_ids=[parent_a.state_id, parent_b.state_id],
+            generation=generation,
+            semantic_quality=semantic_quality
+        )
 
 class AdvancedEvolutionaryEngine:
     """Evolutionary engine with advanced crossover and semantic analysis"""
     
-    def __init__(self, hilbert_space, cre_system=None):
+    def __init__(self, hilbert_space, cre_system=None, novelty_archive=None, fitness_cache=None, executor=None,
+                 lineage=None):
         self.hilbert_space = hilbert_space
         self.cre_system = cre_system or EnhancedCRE()
+        # Batched CRE evaluation (serial, thread or process backend); its evaluator should match cre_system
+        self.executor = executor if executor is not None else SerialEvaluationExecutor(evaluator=self.cre_system)
+        # CRE evaluations memoized by content hash; may be shared with other engines
+        self.fitness_cache = fitness_cache if fitness_cache is not None else FitnessCache()
+        # Optional embedding novelty (e.g. CRE NoveltyArchive over an ANN index); concept overlap otherwise
+        self.novelty_archive = novelty_archive
         self.crossover_engine = AdvancedResonantCrossoverEngine()
+        # Parent graph of every narrative created; state ids carry its compact integer id
+        self.lineage = lineage if lineage is not None else LineageStore()
         self.population: List[NarrativeState] = []
+        # Columnar view of the population for selection; rebuilt after scores change
+        self.concept_interner = Interner()
+        self._store = None
+        # Concept counts of the population for novelty, updated as narratives enter and leave
+        self.concept_index = ConceptIndex(self.concept_interner)
+        self._indexed: Dict[int, NarrativeState] = {}
         self.generation = 0
+        # Loop position of the current run (generation, stagnation), saved with checkpoints
+        self._run_state: Dict[str, Any] = {}
         self.fitness_history: List[float] = []
         self.semantic_history: List[float] = []
         
@@ -47,6 +92,10 @@ class AdvancedEvolutionaryEngine:
         # Advanced metrics
         self.semantic_coherence_history = []
         self.innovation_history = []
+        
+        # Narratives scored, and the throughput of the last run (generational or steady-state)
+        self.evaluation_count = 0
+        self.throughput: Dict[str, Any] = {}
     
     def initialize_population(self) -> None:
         """Initialize population with enhanced diversity"""
@@ -60,10 +109,9 @@ class AdvancedEvolutionaryEngine:
                     content=state_vector.semantic_content.get('content', 'Advanced cosmic evolution...'),
                     concepts=state_vector.concepts[:6],
                     coherence=state_vector.coherence,
-                    generation=0
+                    generation=0,
+                    lineage_id=self.lineage.add()
                 )
-                narrative.fitness_score = self._enhanced_fitness(narrative)
-                narrative.semantic_quality = self._calculate_semantic_quality(narrative)
                 self.population.append(narrative)
         
         # Enhanced basic narratives with semantic richness
@@ -83,30 +131,51 @@ class AdvancedEvolutionaryEngine:
                 content=content,
                 concepts=self._extract_semantic_concepts(content),
                 coherence=0.4,
-                generation=0
+                generation=0,
+                lineage_id=self.lineage.add()
             )
-            narrative.fitness_score = self._enhanced_fitness(narrative)
-            narrative.semantic_quality = self._calculate_semantic_quality(narrative)
             self.population.append(narrative)
         
+        self._score_narratives(self.population)
         print(f"   Created {len(self.population)} advanced narratives")
+        self._archive_population()
         self._update_advanced_metrics()
     
-    def evolve_narrative(self, generations: int = 25) -> NarrativeState:
+    def evolve_narrative(self, generations: int = 25, checkpoint_path: Optional[str] = None,
+                         checkpoint_every: int = 1) -> NarrativeState:
         """Advanced evolutionary loop with semantic optimization"""
         print(f" Starting advanced evolution ({generations} generations)...")
         
-        max_generations = min(generations, self.max_generations)
-        stagnation = 0
-        previous_best = 0.0
+        self._run_state = {
+            "next_generation": 0,
+            "max_generations": min(generations, self.max_generations),
+            "stagnation": 0,
+            "previous_best": 0.0,
+            "stopped": False
+        }
+        return self._run_generations(checkpoint_path, checkpoint_every)
+    
+    def resume_from(self, path: str, checkpoint_path: Optional[str] = None, checkpoint_every: int = 1,
+                    seed: Optional[int] = None) -> NarrativeState:
+        """Continue a checkpointed run exactly where it stopped; a seed forks a distinct continuation"""
+        self.load_checkpoint(path)
+        if seed is not None:
+            random.seed(seed)
+        print(f" Resuming advanced evolution at generation {self._run_state['next_generation']}...")
+        return self._run_generations(checkpoint_path, checkpoint_every)
+    
+    def _run_generations(self, checkpoint_path: Optional[str], checkpoint_every: int) -> NarrativeState:
+        """Generations from _run_state onwards, checkpointing every checkpoint_every of them"""
+        run = self._run_state
+        started, evaluations_before = time.perf_counter(), self.evaluation_count
         
-        for gen in range(max_generations):
+        for gen in range(run["next_generation"], run["max_generations"]):
+            if run["stopped"]:
+                break
             self.generation = gen
             
             # Enhanced fitness evaluation
-            for narrative in self.population:
-                narrative.fitness_score = self._enhanced_fitness(narrative)
-                narrative.semantic_quality = self._calculate_semantic_quality(narrative)
+            self._score_narratives(self.population)
             
             # Advanced selection with semantic bias
             parents = self._semantic_aware_selection()
@@ -116,21 +185,23 @@ class AdvancedEvolutionaryEngine:
             
             # Update population
             self.population = offspring[:self.population_size]
+            self._archive_population()
             
             # Track metrics
-            current_best = max(n.fitness_score for n in self.population)
-            current_semantic = max(n.semantic_quality for n in self.population)
+            store = self._population_store()
+            current_best = float(store.fitness.max())
+            current_semantic = float(store.semantic_quality.max())
             
             self.fitness_history.append(current_best)
             self.semantic_history.append(current_semantic)
             
             # Check stagnation with semantic consideration
-            improvement = current_best - previous_best
+            improvement = current_best - run["previous_best"]
             if improvement < 0.01:
-                stagnation += 1
+                run["stagnation"] += 1
             else:
-                stagnation = 0
-            previous_best = current_best
+                run["stagnation"] = 0
+            run["previous_best"] = current_best
             
             # Enhanced progress reporting
             if gen % 4 == 0:
@@ -139,29 +210,109 @@ class AdvancedEvolutionaryEngine:
                 print(f"  Gen {gen:2d}: Fit={current_best:.3f}, Sem={current_semantic:.3f}, Div={diversity:.3f}")
             
             # Advanced stopping conditions
-            if stagnation >= 10 or current_best > 0.85:
+            if run["stagnation"] >= 10 or current_best > 0.85:
                 print(f"   Advanced stopping at generation {gen}")
-                break
+                run["stopped"] = True
+            
+            run["next_generation"] = gen + 1
+            if checkpoint_path and (run["stopped"] or (gen + 1) % max(1, checkpoint_every) == 0):
+                self.save_checkpoint(checkpoint_path)
         
+        self.throughput = throughput_report("generational", self.evaluation_count - evaluations_before,
+                                            time.perf_counter() - started)
         best_narrative = self._get_best_narrative()
         print(f"   Advanced evolution complete: {best_narrative.fitness_score:.3f} fitness")
         return best_narrative
     
-    def _enhanced_fitness(self, narrative: NarrativeState) -> float:
-        """Enhanced fitness evaluation with semantic quality"""
+    def save_checkpoint(self, path: str) -> None:
+        """Population, histories, loop state and the random module's state as a checkpoint directory"""
+        histories = {
+            "fitness": self.fitness_history,
+            "semantic": self.semantic_history,
+            "semantic_coherence": self.semantic_coherence_history,
+            "innovation": self.innovation_history
+        }
+        save_checkpoint(path, self.population, histories, random.getstate(),
+                        {"generation": self.generation, "run": self._run_state}, self.lineage.to_arrays())
+    
+    def load_checkpoint(self, path: str) -> None:
+        """Replace this engine's run with a checkpointed one; the novelty archive is not part of it"""
+        checkpoint = load_checkpoint(path)
+        self.population = restore_narratives(checkpoint, NarrativeState)
+        histories = restore_histories(checkpoint)
+        self.fitness_history = histories["fitness"]
+        self.semantic_history = histories["semantic"]
+        self.semantic_coherence_history = histories["semantic_coherence"]
+        self.innovation_history = histories["innovation"]
+        self.generation = checkpoint["meta"]["generation"]
+        if "lineage_parents" in checkpoint["arrays"]:
+            self.lineage = LineageStore.from_arrays(checkpoint["arrays"])
+        self._run_state = dict(checkpoint["meta"]["run"])
+        self._store = None
+        self.concept_index.clear()
+        self._indexed.clear()
+        random.setstate(restore_random_state(checkpoint))
+    
+    def _score_narratives(self, narratives: List[NarrativeState]) -> None:
+        """Fitness and semantic quality of each narrative, with one batched CRE evaluation"""
+        evaluations = self._evaluate_cre_batch(narratives)
+        novelties = self._population_novelty(narratives)
+        for narrative, cre_evaluation, novelty in zip(narratives, evaluations, novelties):
+            narrative.fitness_score = self._fitness_from_evaluation(narrative, cre_evaluation, novelty)
+            narrative.semantic_quality = self._calculate_semantic_quality(narrative)
+            narrative.objectives = self._objective_vector(cre_evaluation)
+        self.evaluation_count += len(narratives)
+        self._store = None
+    
+    def _prepare_evaluation(self, narrative: NarrativeState) -> Tuple[Optional[Dict[str, Any]], Optional[Any]]:
+        """(executor payload, None) for a narrative still to be evaluated, (None, evaluation) on a cache hit"""
+        cached = self.fitness_cache.get(self._cre_key(narrative))
+        if cached is not None:
+            return None, None if cached is FAILED_EVALUATION else cached
+        return {'content': narrative.content, 'concepts': narrative.concepts}, None
+    
+    def _finish_evaluation(self, narrative: NarrativeState, cre_evaluation=None, computed: bool = False) -> None:
+        """
+        Score one narrative from a CRE evaluation computed asynchronously (cached here) or taken from
+        the cache; None means the evaluation failed and scores with the quick fallback, without a retry
+        """
+        if computed:
+            self.fitness_cache.put(self._cre_key(narrative),
+                                   FAILED_EVALUATION if cre_evaluation is None else cre_evaluation)
+        novelty = self._population_novelty([narrative])[0]
+        narrative.fitness_score = self._fitness_from_evaluation(narrative, cre_evaluation, novelty)
+        narrative.semantic_quality = self._calculate_semantic_quality(narrative)
+        narrative.objectives = self._objective_vector(cre_evaluation)
+        self.evaluation_count += 1
+    
+    def _objective_vector(self, cre_evaluation) -> Tuple[float, ...]:
+        """Separate objectives kept per narrative; the weighted-sum engine needs none"""
+        return ()
+    
+    def _enhanced_fitness(self, narrative: NarrativeState, cre_evaluation=None, novelty=None) -> float:
+        """Enhanced fitness evaluation with semantic quality, evaluating the CRE here if not given"""
         try:
             # Use CRE system for comprehensive evaluation
-            cre_evaluation = self.cre_system.evaluate_narrative_state({
-                'content': narrative.content,
-                'concepts': narrative.concepts
-            })
-            
+            if cre_evaluation is None:
+                cre_evaluation = self._evaluate_cre(narrative)
+            if novelty is None:
+                novelty = self._calculate_novelty(narrative)
+        except Exception:
+            # Fallback fitness calculation
+            return self._quick_fitness(narrative)
+        return self._fitness_from_evaluation(narrative, cre_evaluation, novelty)
+    
+    def _fitness_from_evaluation(self, narrative: NarrativeState, cre_evaluation, novelty: float) -> float:
+        """Fitness from a finished CRE evaluation; None (the evaluation failed) falls back to quick fitness"""
+        if cre_evaluation is None:
+            return self._quick_fitness(narrative)
+        try:
             # Combine multiple factors
             fitness = (
                 0.5 * cre_evaluation.overall_fitness +
                 0.2 * narrative.coherence +
                 0.2 * narrative.semantic_quality +
-                0.1 * self._calculate_novelty(narrative)
+                0.1 * novelty
             )
             
             return min(1.0, fitness)
@@ -170,6 +321,49 @@ class AdvancedEvolutionaryEngine:
             # Fallback fitness calculation
             return self._quick_fitness(narrative)
     
+    def _evaluate_cre(self, narrative: NarrativeState):
+        """CRE evaluation of one narrative; raises if the evaluator failed on it"""
+        cre_evaluation = self._evaluate_cre_batch([narrative])[0]
+        if cre_evaluation is None:
+            raise ValueError(f"CRE evaluation failed for {narrative.state_id}")
+        return cre_evaluation
+    
+    def _cre_key(self, narrative: NarrativeState):
+        return FitnessCache.key(narrative.content, narrative.concepts, None, self.executor.evaluator_version)
+    
+    def _evaluate_cre_batch(self, narratives: List[NarrativeState]) -> List[Optional[Any]]:
+        """CRE evaluations in narrative order; cache misses go to the executor in one batch"""
+        # Coherence, semantic quality and novelty are combined outside the cached evaluation
+        keys = [self._cre_key(n) for n in narratives]
+        results: List[Optional[Any]] = [None] * len(narratives)
+        pending: Dict[Any, List[int]] = {}
+        
+        for index, key in enumerate(keys):
+            if key in pending:
+                # Same narrative earlier in this batch: evaluated once, counted as a hit
+                self.fitness_cache.hits += 1
+                pending[key].append(index)
+                continue
+            cached = self.fitness_cache.get(key)
+            if cached is not None:
+                results[index] = None if cached is FAILED_EVALUATION else cached
+            else:
+                pending[key] = [index]
+        
+        if pending:
+            payloads = [{'content': narratives[indices[0]].content, 'concepts': narratives[indices[0]].concepts}
+                        for indices in pending.values()]
+            for (key, indices), cre_evaluation in zip(pending.items(), self.executor.evaluate(payloads)):
+                if cre_evaluation is None:
+                    # Remembered so the failing evaluation is not retried every generation
+                    self.fitness_cache.put(key, FAILED_EVALUATION)
+                    continue
+                self.fitness_cache.put(key, cre_evaluation)
+                for index in indices:
+                    results[index] = cre_evaluation
+        
+        return results
+    
     def _quick_fitness(self, narrative: NarrativeState) -> float:
         """Quick fitness fallback"""
         if not narrative.content:
@@ -200,83 +394,119 @@ class AdvancedEvolutionaryEngine:
         semantic_quality = min(1.0, concept_alignment * 0.7 + random.uniform(0.1, 0.3))
         return semantic_quality
     
+    def _population_store(self) -> PopulationStore:
+        """Columnar view of the current population"""
+        store = self._store
+        if store is None or store.narratives is not self.population or len(store) != len(self.population):
+            store = self._store = PopulationStore(self.population, self.concept_interner)
+        return store
+    
+    def _selection_scores(self, store: PopulationStore) -> np.ndarray:
+        """Fitness with semantic bias, as used for parent selection"""
+        return store.weighted_score(0.7, 0.3)
+    
     def _semantic_aware_selection(self) -> List[NarrativeState]:
         """Selection with semantic quality bias"""
         # Combine fitness and semantic quality for selection
-        scored_narratives = []
-        for narrative in self.population:
-            combined_score = (narrative.fitness_score * 0.7 + narrative.semantic_quality * 0.3)
-            scored_narratives.append((narrative, combined_score))
+        store = self._population_store()
+        combined_scores = self._selection_scores(store)
         
-        # Tournament selection with combined scores
-        parents = []
+        # Tournament selection with combined scores, all tournaments at once
         tournament_size = 3
-        
-        while len(parents) < len(self.population) // 2:
-            tournament = random.sample(scored_narratives, tournament_size)
-            winner = max(tournament, key=lambda x: x[1])[0]
-            parents.append(winner)
-        
-        return parents
+        winners = store.tournament(len(self.population) // 2, tournament_size, combined_scores)
+        return [self.population[i] for i in winners]
     
     def _generate_advanced_offspring(self, parents: List[NarrativeState]) -> List[NarrativeState]:
         """Generate offspring using advanced crossover"""
         offspring = []
         
         # Elitism with semantic consideration
-        elites = sorted(self.population, 
-                      key=lambda x: (x.fitness_score * 0.6 + x.semantic_quality * 0.4), 
-                      reverse=True)[:self.elitism_count]
+        store = self._population_store()
+        elites = [self.population[i] for i in store.top_k(self.elitism_count, store.weighted_score(0.6, 0.4))]
         offspring.extend(elites)
         
-        # Generate new offspring
-        while len(offspring) < self.population_size:
+        # Generate new offspring, all crossovers in one batch
+        offspring.extend(self._breed_children(parents, self.population_size - len(offspring)))
+        
+        # Score all children together so their CRE evaluations share one batch
+        self._score_narratives(offspring[len(elites):])
+        return offspring
+    
+    def _breed_child(self, parents: List[NarrativeState], generation: Optional[int] = None) -> NarrativeState:
+        """One unscored child of the parent pool: crossover or clone, then maybe mutation"""
+        return self._breed_children(parents, 1, generation)[0]
+    
+    def _breed_children(self, parents: List[NarrativeState], count: int,
+                        generation: Optional[int] = None) -> List[NarrativeState]:
+        """
+        Unscored children of the parent pool. Which children are crossovers (and of which parents)
+        is drawn first, so all crossovers go to the crossover engine as one batch; clones and
+        mutations then follow in child order. Children belong to `generation`, by default the
+        one after the engine's.
+        """
+        origins = []
+        for _ in range(count):
             if random.random() < self.crossover_rate and len(parents) >= 2:
+                origins.append(tuple(random.sample(parents, 2)))
+            else:
+                origins.append((random.choice(parents),))
+        # Each child takes the next lineage id in order, so crossover children know theirs up front
+        first_id = self.lineage.next_id
+        crossovers = iter(self._perform_advanced_crossover_batch(
+            [o for o in origins if len(o) == 2],
+            [first_id + k for k, o in enumerate(origins) if len(o) == 2]
+        ))
+        
+        children = []
+        for origin in origins:
+            if len(origin) == 2:
                 # Advanced crossover
-                parent_a, parent_b = random.sample(parents, 2)
-                child = self._perform_advanced_crossover(parent_a, parent_b)
+                child = next(crossovers)
             else:
                 # Clone with semantic enhancement
-                parent = random.choice(parents)
-                child = self._clone_with_semantic_variation(parent)
+                child = self._clone_with_semantic_variation(origin[0])
             
             # Advanced mutation
             if random.random() < self.mutation_rate:
                 child = self._apply_semantic_mutation(child)
             
-            child.generation = self.generation + 1
-            child.fitness_score = self._enhanced_fitness(child)
-            child.semantic_quality = self._calculate_semantic_quality(child)
-            offspring.append(child)
-        
-        return offspring
+            # Ids reserved by the variation operators above become this child's lineage row
+            child.generation = self.generation + 1 if generation is None else generation
+            child.lineage_id = self.lineage.add([p.lineage_id for p in origin], child.generation)
+            children.append(child)
+        return children
     
     def _perform_advanced_crossover(self, parent_a: NarrativeState, parent_b: NarrativeState) -> NarrativeState:
         """Perform advanced crossover with semantic analysis"""
         try:
-            child_state = self.crossover_engine.crossover(parent_a, parent_b)
-            
-            # Create enhanced narrative state
-            child = NarrativeState(
-                state_id=f"adv_child_{parent_a.state_id}_{parent_b.state_id}_{self.generation}",
-                content=getattr(child_state, 'content', 'Semantically blended narrative'),
-                concepts=getattr(child_state, 'concepts', []),
-                coherence=(parent_a.coherence + parent_b.coherence) / 2,
-                parent_ids=[parent_a.state_id, parent_b.state_id],
-                generation=self.generation + 1,
-                semantic_quality=getattr(child_state, 'semantic_quality', 0.5)
-            )
-            
-            return child
-            
+            return NarrativeState.from_offspring(self.crossover_engine.crossover(parent_a, parent_b), parent_a, parent_b,
+                                                 f"adv_child_{self.lineage.next_id}", self.generation + 1)
         except Exception as e:
             print(f"   Advanced crossover failed: {e}")
             return self._fallback_crossover(parent_a, parent_b)
     
+    def _perform_advanced_crossover_batch(self, pairs: List[Tuple[NarrativeState, NarrativeState]],
+                                          child_ids: Optional[List[int]] = None) -> List[NarrativeState]:
+        """Children of every (parent_a, parent_b) pair from one crossover_batch call"""
+        if not pairs:
+            return []
+        if child_ids is None:
+            child_ids = [self.lineage.next_id] * len(pairs)
+        try:
+            batch = self.crossover_engine.crossover_batch(pairs)
+            return [NarrativeState.from_offspring(batch.record(row), parent_a, parent_b,
+                                                  f"adv_child_{child_ids[row]}", self.generation + 1)
+                    for row, (parent_a, parent_b) in enumerate(pairs)]
+            
+        except Exception as e:
+            print(f"   Advanced crossover failed: {e}")
+            return [self._fallback_crossover(parent_a, parent_b, child_id)
+                    for (parent_a, parent_b), child_id in zip(pairs, child_ids)]
+    
     def _clone_with_semantic_variation(self, narrative: NarrativeState) -> NarrativeState:
         """Clone with slight semantic variations"""
         return NarrativeState(
-            state_id=f"adv_clone_{narrative.state_id}",
+            state_id=f"adv_clone_{self.lineage.next_id}",
             content=narrative.content,
             concepts=narrative.concepts.copy(),
             coherence=narrative.coherence,
@@ -326,7 +556,7 @@ class AdvancedEvolutionaryEngine:
             content += random.choice(expansions)
         
         return NarrativeState(
-            state_id=f"sem_mutated_{narrative.state_id}",
+            state_id=f"sem_mutated_{self.lineage.next_id}",
             content=content,
             concepts=concepts,
             coherence=narrative.coherence,
@@ -334,14 +564,15 @@ class AdvancedEvolutionaryEngine:
             generation=narrative.generation
         )
     
-    def _fallback_crossover(self, parent_a: NarrativeState, parent_b: NarrativeState) -> NarrativeState:
+    def _fallback_crossover(self, parent_a: NarrativeState, parent_b: NarrativeState,
+                            child_id: Optional[int] = None) -> NarrativeState:
         """Fallback crossover method"""
         # Simple content blending
         content = f"{parent_a.content} blended with {parent_b.content}"
-        concepts = list(set(parent_a.concepts + parent_b.concepts))[:6]
+        concepts = list(dict.fromkeys(parent_a.concepts + parent_b.concepts))[:6]
         
         return NarrativeState(
-            state_id=f"fallback_{parent_a.state_id}_{parent_b.state_id}",
+            state_id=f"fallback_{self.lineage.next_id if child_id is None else child_id}",
             content=content,
             concepts=concepts,
             coherence=(parent_a.coherence + parent_b.coherence) / 2,
@@ -349,39 +580,54 @@ class AdvancedEvolutionaryEngine:
             generation=self.generation + 1
         )
     
+    def _archive_population(self) -> None:
+        """Record the current population in the novelty archive"""
+        if self.novelty_archive is not None:
+            self.novelty_archive.add([n.content for n in self.population])
+    
     def _calculate_novelty(self, narrative: NarrativeState) -> float:
         """Calculate novelty relative to population"""
+        return float(self._population_novelty([narrative])[0])
+    
+    def _population_novelty(self, narratives: List[NarrativeState]) -> np.ndarray:
+        """Novelty of each narrative relative to the current population, in one batch"""
+        if self.novelty_archive is not None:
+            return np.asarray(self.novelty_archive.novelty([n.content for n in narratives]), dtype=np.float64)
+        
         if len(self.population) < 2:
-            return 0.5
-            
-        similarities = []
-        for other in self.population:
-            if other.state_id != narrative.state_id:
-                shared_concepts = len(set(narrative.concepts) & set(other.concepts))
-                total_concepts = len(set(narrative.concepts) | set(other.concepts))
-                similarity = shared_concepts / total_concepts if total_concepts > 0 else 0
-                similarities.append(similarity)
+            return np.full(len(narratives), 0.5)
         
-        avg_similarity = sum(similarities) / len(similarities) if similarities else 0
-        return 1.0 - avg_similarity
+        self._sync_concept_index()
+        return self.concept_index.novelty([n.state_id for n in narratives], [n.concepts for n in narratives])
+    
+    def _sync_concept_index(self) -> None:
+        """Bring the concept index in line with the population, touching only changed narratives"""
+        # Keyed by object identity; holding the objects in _indexed keeps their ids from being reused
+        current: Dict[int, int] = {}
+        for narrative in self.population:
+            current[id(narrative)] = current.get(id(narrative), 0) + 1
+        index = self.concept_index
+        for key in index.keys():
+            if current.get(key) != index.multiplicity(key):
+                index.remove(key)
+                del self._indexed[key]
+        entering = {id(n): n for n in self.population if id(n) not in index}
+        index.add_many(list(entering), [n.state_id for n in entering.values()],
+                       [n.concepts for n in entering.values()], [current[key] for key in entering])
+        self._indexed.update(entering)
     
     def _calculate_semantic_diversity(self) -> float:
         """Calculate semantic diversity of population"""
         if len(self.population) < 2:
             return 1.0
             
-        all_concepts = set()
-        semantic_scores = []
-        
-        for narrative in self.population:
-            all_concepts.update(narrative.concepts)
-            semantic_scores.append(narrative.semantic_quality)
-        
-        if not all_concepts:
+        store = self._population_store()
+        unique_concepts = store.unique_concept_count()
+        if not unique_concepts:
             return 0.5
             
-        concept_diversity = len(all_concepts) / (len(self.population) * 3)  # Normalized
-        semantic_variance = np.var(semantic_scores) if semantic_scores else 0.5
+        concept_diversity = unique_concepts / (len(self.population) * 3)  # Normalized
+        semantic_variance = float(store.semantic_quality.var())
         
         return min(1.0, (concept_diversity + semantic_variance) / 2)
     
@@ -397,7 +643,7 @@ class AdvancedEvolutionaryEngine:
     def _update_advanced_metrics(self):
         """Update advanced evolutionary metrics"""
         if self.population:
-            avg_semantic = sum(n.semantic_quality for n in self.population) / len(self.population)
+            avg_semantic = float(self._population_store().semantic_quality.mean())
             self.semantic_coherence_history.append(avg_semantic)
             
             innovation = self._calculate_innovation()
@@ -409,8 +655,8 @@ class AdvancedEvolutionaryEngine:
             return NarrativeState("default", "Advanced evolution in progress...", [])
         
         # Weighted selection considering fitness and semantic quality
-        return max(self.population, 
-                  key=lambda x: x.fitness_score * 0.7 + x.semantic_quality * 0.3)
+        store = self._population_store()
+        return self.population[store.best(store.weighted_score(0.7, 0.3))]
     
     def _extract_semantic_concepts(self, text: str) -> List[str]:
         """Extract semantic concepts from text"""
@@ -430,7 +676,7 @@ class AdvancedEvolutionaryEngine:
         other_words = [w for w in words if w not in priority_concepts]
         concepts.extend(other_words[:4])  # Limit additional concepts
         
-        return list(set(concepts))[:6]  # Limit to 6 concepts
+        return list(dict.fromkeys(concepts))[:6]  # Limit to 6 concepts
     
     def get_advanced_report(self) -> Dict[str, Any]:
         """Get comprehensive advanced evolutionary report"""
@@ -445,7 +691,10 @@ class AdvancedEvolutionaryEngine:
             "fitness_progression": self.fitness_history,
             "semantic_progression": self.semantic_history,
             "semantic_coherence_history": self.semantic_coherence_history,
-            "innovation_history": self.innovation_history
+            "innovation_history": self.innovation_history,
+            "fitness_cache": self.fitness_cache.stats(),
+            "population_statistics": self._population_store().statistics(),
+            "throughput": self.throughput
         }
 
 # Advanced Evolutionary Engine
@@ -0,0 +1,131 @@
+#  EVOLUTION CHECKPOINTS
+# Populations as memory-mappable .npy columns plus a small JSON header
+
+import os
+import json
+import shutil
+import dataclasses
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+CHECKPOINT_FORMAT_VERSION = 1
+# Column dtype and the value written for narratives without the field
+NUMERIC_FIELDS = {'coherence': (np.float64, 0.0), 'fitness_score': (np.float64, 0.0),
+                  'generation': (np.int64, 0), 'semantic_quality': (np.float64, 0.0),
+                  'lineage_id': (np.int64, -1)}
+TEXT_FIELDS = ('state_id', 'content')
+LIST_FIELDS = ('concepts', 'parent_ids')
+
+
+def pack_strings(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 bytes of all strings back to back, and offsets[i]:offsets[i + 1] of each"""
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_strings(buffer: np.ndarray, offsets: np.ndarray) -> List[str]:
+    raw = bytes(buffer)
+    bounds = offsets.tolist()
+    return [raw[start:end].decode('utf-8') for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def random_state_to_array(state: tuple) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """random.getstate() as a uint32 array (Mersenne Twister words + position) and its JSON-safe rest"""
+    version, internal, gauss_next = state
+    return np.array(internal, dtype=np.uint32), {'version': version, 'gauss_next': gauss_next}
+
+
+def random_state_from_array(words: np.ndarray, header: Dict[str, Any]) -> tuple:
+    return header['version'], tuple(int(word) for word in words), header['gauss_next']
+
+
+def save_checkpoint(path: str, narratives: Sequence[Any], histories: Dict[str, Sequence[float]],
+                    random_state: tuple, meta: Dict[str, Any], arrays: Optional[Dict[str, np.ndarray]] = None) -> None:
+    """
+    Write a checkpoint directory: one .npy file per column, history, the random state and any extra
+    arrays (e.g. the lineage graph), and meta.json.
+    The directory is written next to `path` and swapped in, so a crash never leaves a half-written checkpoint.
+    """
+    staging = f"{path}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    columns = {}
+
+    for name, (dtype, default) in NUMERIC_FIELDS.items():
+        columns[name] = np.fromiter((getattr(n, name, default) for n in narratives), dtype=dtype,
+                                    count=len(narratives))
+    for name in TEXT_FIELDS:
+        columns[f'{name}_bytes'], columns[f'{name}_offsets'] = pack_strings([getattr(n, name) for n in narratives])
+    for name in LIST_FIELDS:
+        lists = [getattr(n, name) or [] for n in narratives]
+        columns[f'{name}_rows'] = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum([len(items) for items in lists], out=columns[f'{name}_rows'][1:])
+        columns[f'{name}_bytes'], columns[f'{name}_offsets'] = pack_strings([item for items in lists for item in items])
+    for name, values in histories.items():
+        columns[f'history_{name}'] = np.asarray(values, dtype=np.float64)
+    columns['random_state'], random_header = random_state_to_array(random_state)
+    columns.update(arrays or {})
+
+    for name, array in columns.items():
+        np.save(os.path.join(staging, f'{name}.npy'), array)
+    with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as fh:
+        json.dump({'version': CHECKPOINT_FORMAT_VERSION, 'population_size': len(narratives),
+                   'histories': list(histories), 'random': random_header, **meta}, fh)
+
+    if os.path.exists(path):
+        retired = f"{path}.old"
+        shutil.rmtree(retired, ignore_errors=True)
+        os.rename(path, retired)
+        os.rename(staging, path)
+        shutil.rmtree(retired)
+    else:
+        os.rename(staging, path)
+
+
+def load_checkpoint(path: str, mmap: bool = True) -> Dict[str, Any]:
+    """Header and arrays of a checkpoint; with mmap=True the columns stay on disk until read"""
+    with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as fh:
+        meta = json.load(fh)
+    if meta.get('version') != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format {meta.get('version')} in {path}")
+
+    mmap_mode = 'r' if mmap else None
+    arrays = {}
+    for file_name in os.listdir(path):
+        if file_name.endswith('.npy'):
+            arrays[file_name[:-4]] = np.load(os.path.join(path, file_name), mmap_mode=mmap_mode)
+    return {'meta': meta, 'arrays': arrays}
+
+
+def restore_narratives(checkpoint: Dict[str, Any], narrative_factory: Callable[..., Any]) -> List[Any]:
+    """Rebuild narrative objects; fields the factory does not declare are skipped"""
+    arrays = checkpoint['arrays']
+    accepted = {field.name for field in dataclasses.fields(narrative_factory)} \
+        if dataclasses.is_dataclass(narrative_factory) else None
+    columns: Dict[str, list] = {}
+
+    for name in NUMERIC_FIELDS:
+        if name in arrays:
+            columns[name] = arrays[name].tolist()
+    for name in TEXT_FIELDS:
+        columns[name] = unpack_strings(arrays[f'{name}_bytes'], arrays[f'{name}_offsets'])
+    for name in LIST_FIELDS:
+        items = unpack_strings(arrays[f'{name}_bytes'], arrays[f'{name}_offsets'])
+        rows = arrays[f'{name}_rows'].tolist()
+        columns[name] = [items[start:end] for start, end in zip(rows[:-1], rows[1:])]
+
+    if accepted is not None:
+        columns = {name: values for name, values in columns.items() if name in accepted}
+    names = list(columns)
+    return [narrative_factory(**dict(zip(names, row))) for row in zip(*columns.values())]
+
+
+def restore_histories(checkpoint: Dict[str, Any]) -> Dict[str, List[float]]:
+    arrays = checkpoint['arrays']
+    return {name: arrays[f'history_{name}'].tolist() for name in checkpoint['meta']['histories']}
+
+
+def restore_random_state(checkpoint: Dict[str, Any]) -> tuple:
+    return random_state_from_array(checkpoint['arrays']['random_state'], checkpoint['meta']['random'])
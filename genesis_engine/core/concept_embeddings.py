@@ -0,0 +1,152 @@
+#  CONCEPT EMBEDDINGS
+# Cached concept vectors so resonance between two concept lists is one matrix product
+
+import zlib
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_DIMENSION = 256
+CHARACTER_NGRAMS = (1, 2, 3)
+# Cached concepts before the table is dropped and refilled (emergent concepts keep arriving)
+DEFAULT_CAPACITY = 100_000
+# float32 products differ in the last bits between matrix shapes; rounding makes a concept's
+# self-similarity exactly 1 and ranks ties the same in batched and per-pair scoring
+SIMILARITY_DECIMALS = 6
+# Largest batch vocabulary whose full similarity matrix is computed up front (16 MB of float32)
+BATCH_MATRIX_LIMIT = 2048
+
+
+def _finish_similarity(scores: np.ndarray) -> np.ndarray:
+    np.clip(scores, 0.0, 1.0, out=scores)
+    return np.round(scores, SIMILARITY_DECIMALS, out=scores)
+
+
+def character_ngram_embedding(concept: str, dimension: int = DEFAULT_DIMENSION) -> np.ndarray:
+    """
+    Unit vector of hashed character 1-3 gram counts of the lowercased concept. Features are
+    non-negative, so cosine similarity lies in [0, 1]: 1 for the same word, high for shared
+    stems and substrings, near 0 for words without common letters.
+    """
+    vector = np.zeros(dimension, dtype=np.float32)
+    text = f" {concept.lower().strip()} "
+    for n in CHARACTER_NGRAMS:
+        for start in range(len(text) - n + 1):
+            gram = text[start:start + n]
+            if gram.strip():
+                vector[zlib.crc32(gram.encode('utf-8')) % dimension] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def top_pairs(scores: np.ndarray, k: int, threshold: float = -np.inf) -> List[Tuple[int, int, float]]:
+    """
+    The k highest (row, column, score) entries above threshold, best first. Ties keep row-major
+    order, so the result equals a stable sort of all pairs, without sorting all of them.
+    """
+    flat = scores.ravel()
+    candidates = np.flatnonzero(flat > threshold)
+    if k <= 0 or candidates.size == 0:
+        return []
+    if candidates.size > k:
+        values = flat[candidates]
+        kth = values[np.argpartition(-values, k - 1)[k - 1]]
+        above = candidates[values > kth]
+        candidates = np.concatenate([above, candidates[values == kth][:k - above.size]])
+    order = candidates[np.lexsort((candidates, -flat[candidates]))]
+    rows, columns = np.divmod(order, scores.shape[1])
+    return [(int(r), int(c), float(flat[i])) for r, c, i in zip(rows, columns, order)]
+
+
+class ConceptEmbeddings:
+    """
+    Concept -> unit vector table. Misses are encoded in one batch, by `encoder.encode(texts)`
+    when given (e.g. a SentenceTransformer or CachedEncoder) or by character n-gram hashing.
+    """
+
+    def __init__(self, encoder: Optional[Any] = None, dimension: int = DEFAULT_DIMENSION,
+                 capacity: int = DEFAULT_CAPACITY):
+        self.encoder = encoder
+        self.dimension = dimension
+        self.capacity = capacity
+        self.index: Dict[str, int] = {}
+        self.vectors: Optional[np.ndarray] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _encode(self, concepts: List[str]) -> np.ndarray:
+        if self.encoder is None:
+            return np.stack([character_ngram_embedding(c, self.dimension) for c in concepts])
+        vectors = np.asarray(self.encoder.encode(concepts), dtype=np.float32).reshape(len(concepts), -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    def _store(self, concepts: List[str]) -> None:
+        vectors = self._encode(concepts)
+        if self.vectors is None:
+            self.vectors = np.empty((max(64, len(concepts)), vectors.shape[1]), dtype=np.float32)
+        size = len(self.index)
+        if size + len(concepts) > len(self.vectors):
+            grown = np.empty((2 * (size + len(concepts)), self.vectors.shape[1]), dtype=np.float32)
+            grown[:size] = self.vectors[:size]
+            self.vectors = grown
+        self.vectors[size:size + len(concepts)] = vectors
+        self.index.update((c, size + i) for i, c in enumerate(concepts))
+
+    def embed(self, concepts: Sequence[str]) -> np.ndarray:
+        """(n, d) unit vectors of the concepts, encoding only the ones not yet cached"""
+        if not concepts:
+            return np.zeros((0, self.vectors.shape[1] if self.vectors is not None else self.dimension),
+                            dtype=np.float32)
+        missing = list(dict.fromkeys(c for c in concepts if c not in self.index))
+        self.misses += len(missing)
+        self.hits += len(concepts) - len(missing)
+        if missing and len(self.index) + len(missing) > self.capacity:
+            # Full: start over with just this call's concepts
+            self.index, self.vectors = {}, None
+            missing = list(dict.fromkeys(concepts))
+        if missing:
+            self._store(missing)
+        return self.vectors[[self.index[c] for c in concepts]]
+
+    def similarity(self, concepts_a: Sequence[str], concepts_b: Sequence[str]) -> np.ndarray:
+        """(len(a), len(b)) cosine similarities, clipped to [0, 1]"""
+        return _finish_similarity(self.embed(concepts_a) @ self.embed(concepts_b).T)
+
+
+class SimilarityBlocks:
+    """
+    Concept similarity between any two of many concept lists, from one embedding lookup.
+    With a small combined vocabulary every block is a slice of one vocabulary x vocabulary
+    product; otherwise each block is its own product of the cached vectors.
+    """
+
+    def __init__(self, embeddings: ConceptEmbeddings, concept_lists: Sequence[Sequence[str]]):
+        vocabulary = list(dict.fromkeys(c for concepts in concept_lists for c in concepts))
+        position = {c: i for i, c in enumerate(vocabulary)}
+        self.rows = [np.fromiter((position[c] for c in concepts), dtype=np.int64, count=len(concepts))
+                     for concepts in concept_lists]
+        self.vectors = embeddings.embed(vocabulary)
+        self.matrix: Optional[np.ndarray] = None
+        if len(vocabulary) <= BATCH_MATRIX_LIMIT:
+            self.matrix = _finish_similarity(self.vectors @ self.vectors.T)
+
+    def block(self, a: int, b: int) -> np.ndarray:
+        """(len(lists[a]), len(lists[b])) similarities, clipped to [0, 1]"""
+        rows_a, rows_b = self.rows[a], self.rows[b]
+        if self.matrix is not None:
+            return self.matrix[np.ix_(rows_a, rows_b)]
+        return _finish_similarity(self.vectors[rows_a] @ self.vectors[rows_b].T)
+
+
+_DEFAULT_EMBEDDINGS: Optional[ConceptEmbeddings] = None
+
+
+def default_concept_embeddings() -> ConceptEmbeddings:
+    """Process-wide character n-gram table shared by crossover engines without their own encoder"""
+    global _DEFAULT_EMBEDDINGS
+    if _DEFAULT_EMBEDDINGS is None:
+        _DEFAULT_EMBEDDINGS = ConceptEmbeddings()
+    return _DEFAULT_EMBEDDINGS
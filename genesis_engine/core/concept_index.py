@@ -0,0 +1,134 @@
+#  CONCEPT INDEX
+# Population-level concept counts for linear-time novelty scoring
+
+from collections import Counter
+import numpy as np
+from scipy import sparse
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
+from .population_store import Interner
+
+
+class ConceptIndex:
+    """
+    Inverted concept index over a changing population.
+
+    counts[c] is the number of indexed rows containing concept c, i.e. the column sums of the
+    population's binary concept matrix. Rows enter with add() and leave with remove(), so keeping
+    the index in step with a population costs time proportional to the rows that changed.
+    """
+
+    def __init__(self, concept_interner: Optional[Interner] = None):
+        self.concept_interner = concept_interner if concept_interner is not None else Interner()
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.total_rows = 0
+        self.total_concepts = 0
+        # key -> (state id, distinct concept ids, multiplicity)
+        self._rows: Dict[Hashable, tuple] = {}
+        # state id -> [rows, concepts, per-concept counts]; novelty skips rows sharing the query's id
+        self._by_state_id: Dict[str, list] = {}
+
+    def __len__(self) -> int:
+        return self.total_rows
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def keys(self) -> List[Hashable]:
+        return list(self._rows)
+
+    def multiplicity(self, key: Hashable) -> int:
+        return self._rows[key][2]
+
+    def _concept_ids(self, concepts: Iterable[str]) -> List[int]:
+        intern = self.concept_interner.intern
+        return sorted({intern(c) for c in concepts})
+
+    def add(self, key: Hashable, state_id: str, concepts: Iterable[str], multiplicity: int = 1) -> None:
+        """Index one row (counted `multiplicity` times) under a caller-chosen key"""
+        self.add_many([key], [state_id], [concepts], [multiplicity])
+
+    def add_many(self, keys: Sequence[Hashable], state_ids: Sequence[str], concept_lists: Sequence[Iterable[str]],
+                 multiplicities: Optional[Sequence[int]] = None) -> None:
+        """Index a batch of rows with one update of the concept counts"""
+        if multiplicities is None:
+            multiplicities = [1] * len(keys)
+        touched: List[int] = []
+        weights: List[int] = []
+        for key, state_id, concepts, multiplicity in zip(keys, state_ids, concept_lists, multiplicities):
+            if key in self._rows:
+                raise KeyError(f"Row {key!r} is already indexed")
+            ids = self._concept_ids(concepts)
+            self._rows[key] = (state_id, ids, multiplicity)
+            touched.extend(ids)
+            weights.extend([multiplicity] * len(ids))
+            self.total_rows += multiplicity
+            self.total_concepts += multiplicity * len(ids)
+
+            group = self._by_state_id.get(state_id)
+            if group is None:
+                group = self._by_state_id[state_id] = [0, 0, Counter()]
+            group[0] += multiplicity
+            group[1] += multiplicity * len(ids)
+            for concept in ids:
+                group[2][concept] += multiplicity
+
+        vocabulary = len(self.concept_interner)
+        if vocabulary > self.counts.size:
+            self.counts = np.concatenate([self.counts, np.zeros(vocabulary - self.counts.size, dtype=np.int64)])
+        if touched:
+            self.counts += np.bincount(touched, weights=weights, minlength=vocabulary).astype(np.int64)
+
+    def remove(self, key: Hashable) -> None:
+        state_id, ids, multiplicity = self._rows.pop(key)
+        self.counts[ids] -= multiplicity
+        self.total_rows -= multiplicity
+        self.total_concepts -= multiplicity * len(ids)
+
+        group = self._by_state_id[state_id]
+        group[0] -= multiplicity
+        group[1] -= multiplicity * len(ids)
+        group[2].subtract({concept: multiplicity for concept in ids})
+        if group[0] == 0:
+            del self._by_state_id[state_id]
+
+    def clear(self) -> None:
+        self.counts[:] = 0
+        self.total_rows = self.total_concepts = 0
+        self._rows.clear()
+        self._by_state_id.clear()
+
+    def concept_matrix(self, concept_lists: Sequence[Iterable[str]]) -> sparse.csr_matrix:
+        """Binary CSR matrix with one row per concept list (duplicates counted once)"""
+        rows = [self._concept_ids(concepts) for concepts in concept_lists]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in rows], out=indptr[1:])
+        indices = np.fromiter((c for ids in rows for c in ids), dtype=np.int64, count=int(indptr[-1]))
+        return sparse.csr_matrix((np.ones(indices.size, dtype=np.int64), indices, indptr),
+                                 shape=(len(rows), len(self.concept_interner)))
+
+    def novelty(self, state_ids: Sequence[str], concept_lists: Sequence[Iterable[str]]) -> np.ndarray:
+        """
+        1 - pooled Jaccard similarity of each query against the indexed rows with a different state id:
+        sum of |a & b| over sum of |a | b|. Both sums follow from the concept counts, so a whole batch
+        costs one sparse matrix-vector product instead of a pass over the population per query.
+        """
+        queries = self.concept_matrix(concept_lists)
+        counts = np.zeros(queries.shape[1], dtype=np.int64)
+        counts[:self.counts.size] = self.counts
+        sizes = np.diff(queries.indptr)
+        shared = queries @ counts
+        others = np.full(len(sizes), self.total_rows, dtype=np.int64)
+        other_concepts = np.full(len(sizes), self.total_concepts, dtype=np.int64)
+
+        # Rows carrying the query's own state id are not its competitors
+        for row, state_id in enumerate(state_ids):
+            group = self._by_state_id.get(state_id)
+            if group is not None:
+                ids = queries.indices[queries.indptr[row]:queries.indptr[row + 1]]
+                shared[row] -= sum(group[2][concept] for concept in ids.tolist())
+                others[row] -= group[0]
+                other_concepts[row] -= group[1]
+
+        union = others * sizes + other_concepts - shared
+        similarity = np.divide(shared, union, out=np.zeros(len(sizes)), where=union > 0)
+        return 1.0 - similarity
@@ -0,0 +1,95 @@
+#  CONCEPT POSTINGS
+# Inverted index from normalized concept to state vector ids, overall and per domain
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Postings are dicts used as insertion-ordered sets: O(1) add/remove, stable iteration order
+Postings = Dict[str, None]
+
+QUERY_MODES = ('and', 'or')
+
+
+def normalize_concept(concept: str) -> str:
+    return concept.strip().lower()
+
+
+class ConceptPostings:
+    """
+    Maintained inverted index over a Hilbert space: normalized concept -> vector ids, plus the
+    same postings per domain. Lookups cost O(postings), however many states the space holds.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Postings] = {}
+        self.domain_postings: Dict[str, Dict[str, Postings]] = {}
+        # What each vector was indexed under, so removal touches only its own postings
+        self._entries: Dict[str, Tuple[Tuple[str, ...], Optional[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, vector_id: str) -> bool:
+        return vector_id in self._entries
+
+    def add(self, vector_id: str, concepts: Iterable[str], domain: Optional[str] = None) -> None:
+        """Index a vector under its concepts (re-adding an id replaces its previous entry)"""
+        if vector_id in self._entries:
+            self.remove(vector_id)
+        normalized = tuple(dict.fromkeys(normalize_concept(c) for c in concepts or () if c))
+        self._entries[vector_id] = (normalized, domain)
+        for concept in normalized:
+            self.postings.setdefault(concept, {})[vector_id] = None
+        if domain is not None:
+            by_concept = self.domain_postings.setdefault(domain, {})
+            for concept in normalized:
+                by_concept.setdefault(concept, {})[vector_id] = None
+
+    def remove(self, vector_id: str) -> bool:
+        """Drop a vector from every posting it is in; False if it was not indexed"""
+        entry = self._entries.pop(vector_id, None)
+        if entry is None:
+            return False
+        concepts, domain = entry
+        indexes = [self.postings]
+        if domain is not None:
+            indexes.append(self.domain_postings[domain])
+        for index in indexes:
+            for concept in concepts:
+                posting = index[concept]
+                del posting[vector_id]
+                if not posting:
+                    del index[concept]
+        if domain is not None and not self.domain_postings[domain]:
+            del self.domain_postings[domain]
+        return True
+
+    def _index(self, domain: Optional[str]) -> Dict[str, Postings]:
+        return self.postings if domain is None else self.domain_postings.get(domain, {})
+
+    def lookup(self, concept: str, domain: Optional[str] = None) -> List[str]:
+        """Vector ids indexed under the concept (optionally within one domain), in insertion order"""
+        return list(self._index(domain).get(normalize_concept(concept), ()))
+
+    def query(self, concepts: Iterable[str], mode: str = 'and', domain: Optional[str] = None) -> List[str]:
+        """Vector ids having all ('and') or any ('or') of the concepts"""
+        if mode not in QUERY_MODES:
+            raise ValueError(f"Unknown query mode '{mode}', expected one of {QUERY_MODES}")
+        index = self._index(domain)
+        postings = [index.get(c, {}) for c in dict.fromkeys(normalize_concept(c) for c in concepts)]
+        if not postings:
+            return []
+        if mode == 'or':
+            merged: Postings = {}
+            for posting in postings:
+                merged.update(posting)
+            return list(merged)
+        # Walk the shortest posting and probe the others
+        postings.sort(key=len)
+        shortest, rest = postings[0], postings[1:]
+        return [vid for vid in shortest if all(vid in posting for posting in rest)]
+
+    def document_frequency(self, concept: str, domain: Optional[str] = None) -> int:
+        return len(self._index(domain).get(normalize_concept(concept), ()))
+
+    def concepts(self, domain: Optional[str] = None) -> List[str]:
+        return list(self._index(domain))
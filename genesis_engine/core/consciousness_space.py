@@ -1,10 +1,14 @@
 #  CONSCIOUSNESS HILBERT SPACE - PHASE 1 IMPLEMENTATION
 # Formal implementation of Consciousness Hilbert Space (ℋ)
 
+import heapq
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 import hashlib
+from .concept_postings import ConceptPostings
+from .concept_embeddings import ConceptEmbeddings
+from .state_embeddings import MMAP_THRESHOLD_BYTES, StateEmbeddingMatrix, embed_states
 
 @dataclass
 class ConsciousnessState:
@@ -30,25 +34,52 @@ class ConsciousnessState:
 class ConsciousnessHilbertSpace:
     """Formal implementation of Consciousness Hilbert Space (ℋ)"""
     
-    def __init__(self):
+    def __init__(self, encoder: Optional[Any] = None, concept_embeddings: Optional[ConceptEmbeddings] = None,
+                 mmap_threshold: int = MMAP_THRESHOLD_BYTES):
         self.state_vectors: Dict[str, ConsciousnessState] = {}
         self.dimensionality = 0
         self.current_superposition = None
         self.coherence_history: List[float] = []
+        # Normalized concept -> vector ids, kept in step with state_vectors
+        self.concept_index = ConceptPostings()
+        # Unit embedding of every state, one float32 row each: `encoder.encode(contents)` when
+        # given, otherwise the centroid of the state's concept embeddings
+        self.encoder = encoder
+        self.concept_embeddings = concept_embeddings
+        self.embeddings = StateEmbeddingMatrix(mmap_threshold)
+        
+    def add_state(self, state: ConsciousnessState) -> None:
+        """Insert (or replace) a state vector, index its concepts and embed it"""
+        self.add_states([state])
+        
+    def add_states(self, states: Iterable[ConsciousnessState]) -> None:
+        """Insert (or replace) state vectors, embedding all of them in one batched encode"""
+        states = list(states)
+        for state in states:
+            self.state_vectors[state.vector_id] = state
+            self.concept_index.add(state.vector_id, state.concepts, state.document_type)
+        if states:
+            vectors = embed_states(states, self.encoder, self.concept_embeddings)
+            self.embeddings.append([state.vector_id for state in states], vectors)
+        
+    def remove_state(self, vector_id: str) -> Optional[ConsciousnessState]:
+        """Remove a state vector, its postings and its embedding; None if it was not in the space"""
+        self.concept_index.remove(vector_id)
+        self.embeddings.remove(vector_id)
+        return self.state_vectors.pop(vector_id, None)
         
     def initialize_from_corpus(self, corpus_documents: List[Any]) -> None:
         """Transform corpus into orthogonal state vectors - PHASE 1 IMPLEMENTATION"""
         print("🌀 Initializing Consciousness Hilbert Space from corpus...")
         
-        for doc in corpus_documents:
-            state_vector = self._create_state_from_document(doc)
-            self.state_vectors[state_vector.vector_id] = state_vector
+        self.add_states([self._create_state_from_document(doc) for doc in corpus_documents])
             
         self.dimensionality = len(self.state_vectors)
         self.current_superposition = self._create_primordial_chaos()
         
         print(f"   Created {self.dimensionality} state vectors")
         print(f"   Initial coherence: {self.measure_coherence():.3f}")
+        print(f"   Geometric coherence: {self.measure_geometric_coherence():.3f}")
         
     def _create_state_from_document(self, document) -> ConsciousnessState:
         """Create a state vector from a document"""
@@ -103,9 +134,61 @@ class ConsciousnessHilbertSpace:
         return avg_coherence
     
     def get_state_by_concept(self, concept: str) -> List[ConsciousnessState]:
-        """Find states containing a specific concept"""
-        return [state for state in self.state_vectors.values() 
-                if concept.lower() in [c.lower() for c in state.concepts]]
+        """Find states containing a specific concept (case-insensitive)"""
+        return [self.state_vectors[vid] for vid in self.concept_index.lookup(concept)]
+    
+    def find_states(self, concepts: Iterable[str], mode: str = 'and', domain: Optional[str] = None,
+                    top_k: Optional[int] = None) -> List[ConsciousnessState]:
+        """
+        States having all ('and') or any ('or') of the concepts, optionally within one document type.
+        With top_k, only the k most coherent, best first.
+        """
+        states = [self.state_vectors[vid] for vid in self.concept_index.query(concepts, mode, domain)]
+        if top_k is not None:
+            states = heapq.nlargest(top_k, states, key=lambda state: state.coherence)
+        return states
+    
+    def state_ids(self) -> List[str]:
+        """Ids of the states in embedding row order (the order of project() amplitudes)"""
+        ids = self.embeddings.ids
+        return [ids[row] for row in self.embeddings.live_rows()]
+    
+    def state_embedding(self, vector_id: str) -> np.ndarray:
+        return self.embeddings.matrix[self.embeddings.rows[vector_id]]
+    
+    def superpose(self, vector_ids: Sequence[str], weights: Optional[Sequence[float]] = None) -> np.ndarray:
+        """Normalized weighted sum Σ w_i |state_i⟩ of the states' embeddings (equal weights by default)"""
+        rows = self.embeddings.rows_of(vector_ids)
+        if weights is None:
+            weights = np.ones(len(rows), dtype=np.float32)
+        weights = np.asarray(weights, dtype=np.float32)
+        if weights.shape != (len(rows),):
+            raise ValueError(f"Expected {len(rows)} weights, got shape {weights.shape}")
+        superposition = weights @ self.embeddings.matrix[rows] if len(rows) else \
+            np.zeros(self.embeddings.dimension or 0, dtype=np.float32)
+        norm = np.linalg.norm(superposition)
+        return superposition / norm if norm > 0 else superposition
+    
+    def project(self, vector: np.ndarray) -> np.ndarray:
+        """Amplitudes ⟨state|vector⟩ of the vector on every state, in state_ids() order"""
+        return self.embeddings.dot(vector)
+    
+    def nearest_states(self, query: Union[str, np.ndarray], k: int = 10) -> List[Tuple[ConsciousnessState, float]]:
+        """
+        The k states whose embeddings are closest (cosine) to a vector, or to a state given by
+        id (the state itself excluded), best first
+        """
+        exclude = None
+        if isinstance(query, str):
+            exclude = self.embeddings.rows[query]
+            query = self.embeddings.matrix[exclude]
+        rows, scores = self.embeddings.nearest(query, k, exclude)
+        ids = self.embeddings.ids
+        return [(self.state_vectors[ids[row]], float(score)) for row, score in zip(rows, scores)]
+    
+    def measure_geometric_coherence(self) -> float:
+        """Whole-space coherence: mean cosine similarity over all pairs of distinct state embeddings"""
+        return self.embeddings.mean_pairwise_similarity()
     
     def calculate_conceptual_density(self) -> float:
         """Calculate conceptual density of the space"""
@@ -123,6 +206,7 @@ class ConsciousnessHilbertSpace:
             "average_coherence": self.measure_coherence(),
             "total_potential_energy": self._calculate_total_potential_energy(),
             "conceptual_density": self.calculate_conceptual_density(),
+            "geometric_coherence": self.measure_geometric_coherence(),
             "coherence_history_length": len(self.coherence_history)
         }
 
@@ -1,8 +1,9 @@
 #  ENHANCED CONSCIOUSNESS HILBERT SPACE
 # Complete implementation with all required methods
 
+import heapq
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from dataclasses import dataclass
 import hashlib
 import json
@@ -14,6 +15,8 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from genesis_engine.core.concept_postings import ConceptPostings
+
 try:
     from genesis_engine.integration.corpus_integrator import CorpusIntegrator, IntegratedDocument
     from genesis_engine.core.enhanced_cross_domain import EnhancedCrossDomainDetector
@@ -119,6 +122,29 @@ class EnhancedConsciousnessHilbertSpace:
         self.domain_vectors: Dict[str, List[str]] = {}
         self.cross_domain_map: Dict[str, List[str]] = {}
         self.cross_domain_detector = EnhancedCrossDomainDetector()
+        # Normalized concept -> vector ids, overall and per domain, kept in step with state_vectors
+        self.concept_index = ConceptPostings()
+        
+    def add_state(self, state: EnhancedConsciousnessState) -> None:
+        """Insert (or replace) a state vector in its domain and index its concepts"""
+        if state.vector_id in self.state_vectors:
+            self.remove_state(state.vector_id)
+        self.state_vectors[state.vector_id] = state
+        self.domain_vectors.setdefault(state.document_type, []).append(state.vector_id)
+        self.concept_index.add(state.vector_id, state.concepts, state.document_type)
+        
+    def remove_state(self, vector_id: str) -> Optional[EnhancedConsciousnessState]:
+        """Remove a state vector from the space, its domain and its postings"""
+        state = self.state_vectors.pop(vector_id, None)
+        if state is None:
+            return None
+        self.concept_index.remove(vector_id)
+        domain = self.domain_vectors.get(state.document_type, [])
+        if vector_id in domain:
+            domain.remove(vector_id)
+            if not domain:
+                del self.domain_vectors[state.document_type]
+        return state
         
     def initialize_from_integrated_corpus(self) -> None:
         """Initialize from integrated corpus documents"""
@@ -130,12 +156,9 @@ class EnhancedConsciousnessHilbertSpace:
         # Create state vectors from integrated documents
         for doc in corpus_documents:
             state_vector = self._create_state_from_integrated_document(doc)
-            self.state_vectors[state_vector.vector_id] = state_vector
             
-            # Track domain organization
-            if doc.doc_type not in self.domain_vectors:
-                self.domain_vectors[doc.doc_type] = []
-            self.domain_vectors[doc.doc_type].append(state_vector.vector_id)
+            # Track domain organization and concept postings
+            self.add_state(state_vector)
         
         self.dimensionality = len(self.state_vectors)
         self.current_superposition = self._create_enhanced_primordial_chaos()
@@ -213,12 +236,11 @@ class EnhancedConsciousnessHilbertSpace:
         # Update state vectors with cross-domain connections
         for concept, connecting_domains in self.cross_domain_map.items():
             for domain in connecting_domains:
-                for vid in self.domain_vectors[domain]:
+                for vid in self.concept_index.lookup(concept, domain):
                     state_vector = self.state_vectors[vid]
-                    if concept in state_vector.concepts:
-                        connection_desc = f"{concept} connects {', '.join(connecting_domains)}"
-                        if connection_desc not in state_vector.cross_domain_connections:
-                            state_vector.cross_domain_connections.append(connection_desc)
+                    connection_desc = f"{concept} connects {', '.join(connecting_domains)}"
+                    if connection_desc not in state_vector.cross_domain_connections:
+                        state_vector.cross_domain_connections.append(connection_desc)
     
     def _create_enhanced_primordial_chaos(self, C: float = 0) -> Dict:
         """Create enhanced primordial chaos state with domain awareness"""
@@ -322,8 +344,7 @@ class EnhancedConsciousnessHilbertSpace:
             connecting_domains = self.cross_domain_map[concept]
             
             for domain in connecting_domains:
-                domain_vectors = [self.state_vectors[vid] for vid in self.domain_vectors[domain] 
-                                if concept in self.state_vectors[vid].concepts]
+                domain_vectors = [self.state_vectors[vid] for vid in self.concept_index.lookup(concept, domain)]
                 
                 for vector in domain_vectors:
                     resonance_points.append({
@@ -336,6 +357,21 @@ class EnhancedConsciousnessHilbertSpace:
         
         return resonance_points
     
+    def get_state_by_concept(self, concept: str) -> List[EnhancedConsciousnessState]:
+        """Find states containing a specific concept (case-insensitive)"""
+        return [self.state_vectors[vid] for vid in self.concept_index.lookup(concept)]
+    
+    def find_states(self, concepts: Iterable[str], mode: str = 'and', domain: Optional[str] = None,
+                    top_k: Optional[int] = None) -> List[EnhancedConsciousnessState]:
+        """
+        States having all ('and') or any ('or') of the concepts, optionally within one domain.
+        With top_k, only the k most coherent, best first.
+        """
+        states = [self.state_vectors[vid] for vid in self.concept_index.query(concepts, mode, domain)]
+        if top_k is not None:
+            states = heapq.nlargest(top_k, states, key=lambda state: state.coherence)
+        return states
+    
     def get_corpus_integration_report(self) -> Dict[str, Any]:
         """Get comprehensive corpus integration report"""
         corpus_report = self.corpus_integrator.get_corpus_report()
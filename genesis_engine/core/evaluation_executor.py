@@ -0,0 +1,176 @@
+#  EVALUATION EXECUTOR
+# Serial, thread-pool and process-pool backends for batched CRE evaluation
+
+import math
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from .physics_of_meaning import EnhancedCRE
+from .fitness_cache import evaluator_version
+
+# Warm evaluator of the current worker process (set by the pool initializer)
+_worker_evaluator = None
+
+
+def _init_worker(evaluator_factory: Callable[[], Any]) -> None:
+    global _worker_evaluator
+    _worker_evaluator = evaluator_factory()
+
+
+def _evaluate_all(evaluator, payloads: Sequence[Dict[str, Any]]) -> List[Optional[Any]]:
+    """Evaluate payloads in order; a failing payload yields None instead of aborting the chunk"""
+    results = []
+    for payload in payloads:
+        try:
+            results.append(evaluator.evaluate_narrative_state(payload))
+        except Exception:
+            results.append(None)
+    return results
+
+
+def _evaluate_chunk_in_worker(payloads: Sequence[Dict[str, Any]]) -> List[Optional[Any]]:
+    return _evaluate_all(_worker_evaluator, payloads)
+
+
+class EvaluationExecutor:
+    """Evaluates narrative payloads ({'content', 'concepts'}) and returns results in input order"""
+
+    backend = 'base'
+
+    def __init__(self, evaluator_factory: Callable[[], Any] = EnhancedCRE, evaluator=None):
+        self.evaluator_factory = evaluator_factory
+        # Local evaluator: used by the serial backend and to name the cache namespace
+        self.evaluator = evaluator if evaluator is not None else evaluator_factory()
+        self.evaluator_version = evaluator_version(self.evaluator)
+
+    def evaluate(self, payloads: Sequence[Dict[str, Any]]) -> List[Optional[Any]]:
+        raise NotImplementedError
+
+    def submit(self, payload: Dict[str, Any]) -> Future:
+        """Start evaluating one payload; the future resolves to its result (None on failure)"""
+        future = Future()
+        future.set_result(self.evaluate([payload])[0])
+        return future
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SerialEvaluationExecutor(EvaluationExecutor):
+    """In-process evaluation, one narrative at a time"""
+
+    backend = 'serial'
+
+    def evaluate(self, payloads: Sequence[Dict[str, Any]]) -> List[Optional[Any]]:
+        return _evaluate_all(self.evaluator, payloads)
+
+
+class _PoolEvaluationExecutor(EvaluationExecutor):
+    """Chunked submission to a lazily created, persistent worker pool"""
+
+    def __init__(self, evaluator_factory: Callable[[], Any] = EnhancedCRE, max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None, chunks_per_worker: int = 4):
+        super().__init__(evaluator_factory)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.chunks_per_worker = chunks_per_worker
+        self._pool = None
+
+    def _chunks(self, payloads: Sequence[Dict[str, Any]]) -> List[Sequence[Dict[str, Any]]]:
+        size = self.chunk_size or max(1, math.ceil(len(payloads) / (self.max_workers * self.chunks_per_worker)))
+        return [payloads[start:start + size] for start in range(0, len(payloads), size)]
+
+    def _create_pool(self):
+        raise NotImplementedError
+
+    def _chunk_function(self) -> Callable[[Sequence[Dict[str, Any]]], List[Optional[Any]]]:
+        raise NotImplementedError
+
+    def evaluate(self, payloads: Sequence[Dict[str, Any]]) -> List[Optional[Any]]:
+        payloads = list(payloads)
+        if not payloads:
+            return []
+        if self._pool is None:
+            self._pool = self._create_pool()
+        # map() yields chunk results in submission order, so output follows input order
+        results = []
+        for chunk_results in self._pool.map(self._chunk_function(), self._chunks(payloads)):
+            results.extend(chunk_results)
+        return results
+
+    def submit(self, payload: Dict[str, Any]) -> Future:
+        if self._pool is None:
+            self._pool = self._create_pool()
+        # Unwrap the one-item chunk so callers can wait() on single results
+        single = Future()
+        chunk = self._pool.submit(self._chunk_function(), [payload])
+
+        def unwrap(done: Future) -> None:
+            error = done.exception()
+            if error is not None:
+                single.set_exception(error)
+            else:
+                single.set_result(done.result()[0])
+        chunk.add_done_callback(unwrap)
+        return single
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+class ThreadPoolEvaluationExecutor(_PoolEvaluationExecutor):
+    """Worker threads, each with its own evaluator; pays off for evaluators that release the GIL"""
+
+    backend = 'thread'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+
+    def _create_pool(self):
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _chunk_function(self):
+        def evaluate_chunk(payloads):
+            evaluator = getattr(self._local, 'evaluator', None)
+            if evaluator is None:
+                evaluator = self._local.evaluator = self.evaluator_factory()
+            return _evaluate_all(evaluator, payloads)
+        return evaluate_chunk
+
+
+class ProcessPoolEvaluationExecutor(_PoolEvaluationExecutor):
+    """Worker processes, each building one warm evaluator at start-up; the factory must be picklable"""
+
+    backend = 'process'
+
+    def _create_pool(self):
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                   initargs=(self.evaluator_factory,))
+
+    def _chunk_function(self):
+        return _evaluate_chunk_in_worker
+
+
+_BACKENDS = {
+    'serial': SerialEvaluationExecutor,
+    'thread': ThreadPoolEvaluationExecutor,
+    'process': ProcessPoolEvaluationExecutor,
+}
+
+
+def make_executor(backend: str = 'serial', evaluator_factory: Callable[[], Any] = EnhancedCRE,
+                  **options) -> EvaluationExecutor:
+    """Executor for 'serial', 'thread' or 'process' evaluation"""
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown evaluation backend '{backend}', expected one of {sorted(_BACKENDS)}")
+    return _BACKENDS[backend](evaluator_factory, **options)
@@ -2,11 +2,16 @@
 # Further optimizations for speed and reliability
 
 import random
+import time
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import math
 from .physics_of_meaning import EnhancedCRE
+from .fitness_cache import FitnessCache
+from .population_store import Interner, PopulationStore
+from .steady_state import throughput_report
+from .lineage import LineageStore
 
 @dataclass 
 class NarrativeState:
@@ -18,6 +23,7 @@ class NarrativeState:
     fitness_score: float = 0.0
     generation: int = 0
     parent_ids: List[str] = None
+    lineage_id: int = -1  # Row in the engine's LineageStore
     
     def __post_init__(self):
         if self.parent_ids is None:
@@ -26,10 +32,20 @@ class NarrativeState:
 class GenerativeEvolutionaryAlgorithm:
     """Optimized evolutionary engine - PERFORMANCE FOCUSED"""
     
-    def __init__(self, hilbert_space, cre_system=None):
+    # Bump whenever _compute_quick_fitness changes
+    quick_fitness_version = "quick:1"
+    
+    def __init__(self, hilbert_space, cre_system=None, fitness_cache=None, lineage=None):
         self.hilbert_space = hilbert_space
         self.cre_system = cre_system or EnhancedCRE()
+        # Pass one FitnessCache to several engines to share evaluations between them
+        self.fitness_cache = fitness_cache if fitness_cache is not None else FitnessCache()
         self.population: List[NarrativeState] = []
+        # Parent graph of every narrative created; state ids carry its compact integer id
+        self.lineage = lineage if lineage is not None else LineageStore()
+        # Columnar view of the population for selection; rebuilt after scores change
+        self.concept_interner = Interner()
+        self._store = None
         self.generation = 0
         self.fitness_history: List[float] = []
         
@@ -42,6 +58,9 @@ class GenerativeEvolutionaryAlgorithm:
         
         # Performance tracking
         self.generation_times = []
+        # Narratives scored, and the throughput of the last run (generational or steady-state)
+        self.evaluation_count = 0
+        self.throughput: Dict[str, Any] = {}
     
     def initialize_population(self) -> None:
         """Create optimized initial population"""
@@ -55,7 +74,8 @@ class GenerativeEvolutionaryAlgorithm:
                     content=state_vector.semantic_content.get('content', 'Cosmic evolution...'),
                     concepts=state_vector.concepts[:5],  # Limit concepts
                     coherence=state_vector.coherence,
-                    generation=0
+                    generation=0,
+                    lineage_id=self.lineage.add()
                 )
                 narrative.fitness_score = self._quick_fitness(narrative)
                 self.population.append(narrative)
@@ -75,11 +95,13 @@ class GenerativeEvolutionaryAlgorithm:
                 content=content,
                 concepts=self._extract_concepts(content)[:3],  # Limit to 3 concepts
                 coherence=0.3,
-                generation=0
+                generation=0,
+                lineage_id=self.lineage.add()
             )
             narrative.fitness_score = self._quick_fitness(narrative)
             self.population.append(narrative)
         
+        self._store = None
         print(f"   Created {len(self.population)} narratives")
     
     def evolve_narrative(self, generations: int = 30) -> NarrativeState:
@@ -89,6 +111,7 @@ class GenerativeEvolutionaryAlgorithm:
         max_generations = min(generations, self.max_generations)
         stagnation = 0
         previous_best = 0.0
+        started, evaluations_before = time.perf_counter(), self.evaluation_count
         
         for gen in range(max_generations):
             self.generation = gen
@@ -96,6 +119,8 @@ class GenerativeEvolutionaryAlgorithm:
             # Evaluate fitness
             for narrative in self.population:
                 narrative.fitness_score = self._quick_fitness(narrative)
+            self.evaluation_count += len(self.population)
+            self._store = None
             
             # Simple tournament selection (faster than roulette wheel)
             parents = self._tournament_selection()
@@ -107,7 +132,7 @@ class GenerativeEvolutionaryAlgorithm:
             self.population = offspring[:self.population_size]
             
             # Track best fitness
-            current_best = max(n.fitness_score for n in self.population)
+            current_best = float(self._population_store().fitness.max())
             self.fitness_history.append(current_best)
             
             # Check stagnation
@@ -127,11 +152,19 @@ class GenerativeEvolutionaryAlgorithm:
                 print(f"   Early stop at generation {gen}")
                 break
         
+        self.throughput = throughput_report("generational", self.evaluation_count - evaluations_before,
+                                            time.perf_counter() - started)
         best = self._get_best_narrative()
         print(f"   Evolution complete: {best.fitness_score:.3f} fitness")
         return best
     
     def _quick_fitness(self, narrative: NarrativeState) -> float:
+        """Fast fitness evaluation, memoized on content, concepts and coherence"""
+        key = FitnessCache.key(narrative.content, narrative.concepts, narrative.coherence,
+                               self.quick_fitness_version)
+        return self.fitness_cache.get_or_compute(key, lambda: self._compute_quick_fitness(narrative))
+    
+    def _compute_quick_fitness(self, narrative: NarrativeState) -> float:
         """Fast fitness evaluation"""
         try:
             # Simplified evaluation for performance
@@ -152,49 +185,73 @@ class GenerativeEvolutionaryAlgorithm:
         except Exception:
             return 0.3  # Default fitness
     
+    def _population_store(self) -> PopulationStore:
+        """Columnar view of the current population"""
+        store = self._store
+        if store is None or store.narratives is not self.population or len(store) != len(self.population):
+            store = self._store = PopulationStore(self.population, self.concept_interner)
+        return store
+    
+    def _selection_scores(self, store: PopulationStore) -> np.ndarray:
+        return store.fitness
+    
     def _tournament_selection(self) -> List[NarrativeState]:
         """Tournament selection - faster than roulette wheel"""
-        parents = []
         tournament_size = 3
-        
-        while len(parents) < len(self.population) // 2:
-            # Random tournament
-            tournament = random.sample(self.population, tournament_size)
-            # Select best from tournament
-            winner = max(tournament, key=lambda x: x.fitness_score)
-            parents.append(winner)
-        
-        return parents
+        store = self._population_store()
+        # All tournaments drawn and decided at once
+        winners = store.tournament(len(self.population) // 2, tournament_size, self._selection_scores(store))
+        return [self.population[i] for i in winners]
     
     def _generate_offspring_fast(self, parents: List[NarrativeState]) -> List[NarrativeState]:
         """Fast offspring generation"""
         offspring = []
         
         # Elitism
-        elites = sorted(self.population, key=lambda x: x.fitness_score, reverse=True)[:self.elitism_count]
+        store = self._population_store()
+        elites = [self.population[i] for i in store.top_k(self.elitism_count, store.fitness)]
         offspring.extend(elites)
         
         # Generate new offspring
         while len(offspring) < self.population_size:
-            if random.random() < self.crossover_rate and len(parents) >= 2:
-                # Crossover
-                parent_a, parent_b = random.sample(parents, 2)
-                child = self._fast_crossover(parent_a, parent_b)
-            else:
-                # Clone
-                parent = random.choice(parents)
-                child = self._clone_narrative(parent)
-            
-            # Mutation
-            if random.random() < self.mutation_rate:
-                child = self._fast_mutation(child)
-            
+            child = self._breed_child(parents)
             child.generation = self.generation + 1
             child.fitness_score = self._quick_fitness(child)
             offspring.append(child)
         
+        self.evaluation_count += len(offspring) - len(elites)
         return offspring
     
+    def _breed_child(self, parents: List[NarrativeState], generation: Optional[int] = None) -> NarrativeState:
+        """One unscored child of `generation` (default: the next one): crossover or clone, then maybe mutation"""
+        if random.random() < self.crossover_rate and len(parents) >= 2:
+            # Crossover
+            parent_a, parent_b = random.sample(parents, 2)
+            child = self._fast_crossover(parent_a, parent_b)
+            origin = (parent_a, parent_b)
+        else:
+            # Clone
+            parent = random.choice(parents)
+            child = self._clone_narrative(parent)
+            origin = (parent,)
+        
+        # Mutation
+        if random.random() < self.mutation_rate:
+            child = self._fast_mutation(child)
+        
+        # Ids reserved by the variation operators above become this child's lineage row
+        child.generation = self.generation + 1 if generation is None else generation
+        child.lineage_id = self.lineage.add([p.lineage_id for p in origin], child.generation)
+        return child
+    
+    def _prepare_evaluation(self, narrative: NarrativeState) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """Quick fitness needs no executor: nothing to submit"""
+        return None, None
+    
+    def _finish_evaluation(self, narrative: NarrativeState, evaluation=None, computed: bool = False) -> None:
+        narrative.fitness_score = self._quick_fitness(narrative)
+        self.evaluation_count += 1
+    
     def _fast_crossover(self, parent_a: NarrativeState, parent_b: NarrativeState) -> NarrativeState:
         """Fast crossover implementation"""
         try:
@@ -215,7 +272,7 @@ class GenerativeEvolutionaryAlgorithm:
             concepts = list(set(parent_a.concepts + parent_b.concepts))[:5]  # Limit concepts
             
             return NarrativeState(
-                state_id=f"child_{self.generation}_{len(offspring)}",
+                state_id=f"child_{self.lineage.next_id}",
                 content=content,
                 concepts=concepts,
                 coherence=(parent_a.coherence + parent_b.coherence) / 2,
@@ -249,7 +306,7 @@ class GenerativeEvolutionaryAlgorithm:
                     content = ' '.join(words)
         
         return NarrativeState(
-            state_id=f"mutated_{narrative.state_id}",
+            state_id=f"mutated_{self.lineage.next_id}",
             content=content,
             concepts=concepts,
             coherence=narrative.coherence,
@@ -260,7 +317,7 @@ class GenerativeEvolutionaryAlgorithm:
     def _clone_narrative(self, narrative: NarrativeState) -> NarrativeState:
         """Clone a narrative"""
         return NarrativeState(
-            state_id=f"clone_{narrative.state_id}",
+            state_id=f"clone_{self.lineage.next_id}",
             content=narrative.content,
             concepts=narrative.concepts.copy(),
             coherence=narrative.coherence,
@@ -273,20 +330,19 @@ class GenerativeEvolutionaryAlgorithm:
         if len(self.population) < 2:
             return 1.0
             
-        all_concepts = set()
-        for n in self.population:
-            all_concepts.update(n.concepts)
-        
-        if not all_concepts:
+        store = self._population_store()
+        unique_concepts = store.unique_concept_count()
+        if not unique_concepts:
             return 0.0
             
-        return min(1.0, sum(len(n.concepts) for n in self.population) / (len(self.population) * len(all_concepts)))
+        return min(1.0, store.concept_ids.size / (len(self.population) * unique_concepts))
     
     def _get_best_narrative(self) -> NarrativeState:
         """Get best narrative"""
         if not self.population:
             return NarrativeState("default", "Evolution in progress...", [])
-        return max(self.population, key=lambda x: x.fitness_score)
+        store = self._population_store()
+        return self.population[store.best(store.fitness)]
     
     def _extract_concepts(self, text: str) -> List[str]:
         """Extract concepts from text"""
@@ -302,7 +358,10 @@ class GenerativeEvolutionaryAlgorithm:
             "best_fitness": best.fitness_score,
             "best_narrative": best.content,
             "best_concepts": best.concepts,
-            "fitness_history": self.fitness_history
+            "fitness_history": self.fitness_history,
+            "fitness_cache": self.fitness_cache.stats(),
+            "population_statistics": self._population_store().statistics(),
+            "throughput": self.throughput
         }
 
 # Optimized Evolutionary Engine
@@ -0,0 +1,89 @@
+#  FITNESS CACHE
+# Bounded memo of narrative evaluations keyed by content hash
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+DEFAULT_CAPACITY = 100000
+
+
+def content_digest(content: str) -> bytes:
+    """Stable 16-byte hash of narrative content"""
+    return hashlib.blake2b((content or '').encode('utf-8'), digest_size=16).digest()
+
+
+def evaluator_version(evaluator: Any) -> str:
+    """Cache namespace of an evaluator: its class plus its declared version, if any"""
+    cls = type(evaluator)
+    return f"{cls.__module__}.{cls.__qualname__}:{getattr(evaluator, 'evaluator_version', '0')}"
+
+
+class FitnessCache:
+    """LRU cache of fitness evaluations shared by the evolutionary engines"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(content: str, concepts: Iterable[str] = (), coherence: Optional[float] = None,
+            version: str = '') -> Tuple[bytes, Tuple[str, ...], Optional[float], str]:
+        """(content hash, concepts, coherence, evaluator version)"""
+        return content_digest(content), tuple(concepts or ()), coherence, version
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached value for key, computing and storing it on a miss"""
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for key, counting the lookup as a hit or a miss"""
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value computed after a missed get()"""
+        if self.capacity <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,276 @@
+#  ISLAND MODEL EVOLUTION
+# Independent AdvancedEvolutionaryEngine populations with periodic migration
+
+import copy
+import queue
+import random
+import traceback
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .advanced_evolution import AdvancedEvolutionaryEngine, NarrativeState
+
+TOPOLOGIES = ('ring', 'full')
+# How long a collecting run waits for a reply before checking that the islands are still alive
+REPLY_POLL_SECONDS = 1.0
+SHUTDOWN_SECONDS = 10.0
+
+
+class IslandError(RuntimeError):
+    """An island raised or died; the message carries its traceback or exit code"""
+
+
+def default_engine_factory(island_id: int) -> AdvancedEvolutionaryEngine:
+    """Engine of one island; replace with any picklable callable taking the island id"""
+    return AdvancedEvolutionaryEngine(None)
+
+
+def _rank_key(narrative: NarrativeState) -> float:
+    # Same weighting AdvancedEvolutionaryEngine uses for its best narrative
+    return narrative.fitness_score * 0.7 + narrative.semantic_quality * 0.3
+
+
+def migration_targets(island_id: int, n_islands: int, topology: str) -> List[int]:
+    """Islands that receive migrants from island_id"""
+    if n_islands < 2:
+        return []
+    if topology == 'ring':
+        return [(island_id + 1) % n_islands]
+    if topology == 'full':
+        return [other for other in range(n_islands) if other != island_id]
+    raise ValueError(f"Unknown topology '{topology}', expected one of {TOPOLOGIES}")
+
+
+class IslandWorker:
+    """One island: an engine plus its own random stream, driven by commands"""
+
+    def __init__(self, island_id: int, seed: int, engine_factory: Callable[[int], Any] = default_engine_factory):
+        self.island_id = island_id
+        # The engines draw from the global random module; each island swaps in its own state
+        saved = random.getstate()
+        random.seed(seed)
+        self.engine = engine_factory(island_id)
+        self.engine.initialize_population()
+        self._random_state = random.getstate()
+        random.setstate(saved)
+
+    def handle(self, command: Tuple) -> Tuple:
+        saved = random.getstate()
+        random.setstate(self._random_state)
+        try:
+            return self._dispatch(*command)
+        finally:
+            self._random_state = random.getstate()
+            random.setstate(saved)
+
+    def _dispatch(self, action: str, *args) -> Tuple:
+        if action == 'evolve':
+            generations, migration_size = args
+            self.engine.evolve_narrative(generations=generations)
+            return ('evolved', self.island_id, self.emigrants(migration_size), self._best().fitness_score)
+        if action == 'immigrate':
+            self.immigrate(args[0])
+            return ('immigrated', self.island_id)
+        if action == 'report':
+            best = self._best()
+            report = self.engine.get_advanced_report()
+            report.update(island_id=self.island_id, best_state_id=best.state_id,
+                          generations_run=len(self.engine.fitness_history))
+            return ('report', self.island_id, report)
+        raise ValueError(f"Unknown island command '{action}'")
+
+    def _best(self) -> NarrativeState:
+        return self.engine._get_best_narrative()
+
+    def emigrants(self, count: int) -> List[NarrativeState]:
+        """Copies of the top narratives"""
+        top = sorted(self.engine.population, key=_rank_key, reverse=True)[:count]
+        return [copy.deepcopy(narrative) for narrative in top]
+
+    def immigrate(self, migrants: List[NarrativeState]) -> None:
+        """Replace the weakest narratives, always keeping this island's best"""
+        population = sorted(self.engine.population, key=_rank_key, reverse=True)
+        slots = min(len(migrants), max(0, len(population) - 1))
+        if slots:
+            arrivals = [copy.deepcopy(migrant) for migrant in migrants[:slots]]
+            # Lineage ids are per engine: immigrants start new roots in this island's graph,
+            # named after them so ids stay unique without growing on every hop
+            for arrival in arrivals:
+                arrival.lineage_id = self.engine.lineage.add((), arrival.generation)
+                arrival.state_id = f"adv_immigrant_{arrival.lineage_id}"
+            population[-slots:] = arrivals
+        self.engine.population = population
+
+
+def _error_reply(island_id: int) -> Tuple:
+    return ('error', island_id, traceback.format_exc())
+
+
+def _answer(worker: IslandWorker, command: Tuple) -> Tuple:
+    """The worker's reply, or an error reply carrying the traceback if the command raised"""
+    try:
+        return worker.handle(command)
+    except Exception:
+        return _error_reply(worker.island_id)
+
+
+def _serve_island(island_id: int, seed: int, engine_factory, inbox, outbox) -> None:
+    """Process entry point: build the island, then answer commands until None arrives"""
+    try:
+        worker = IslandWorker(island_id, seed, engine_factory)
+    except Exception:
+        outbox.put(_error_reply(island_id))
+        return
+    while True:
+        command = inbox.get()
+        if command is None:
+            break
+        outbox.put(_answer(worker, command))
+
+
+class _LocalIsland:
+    """In-process stand-in with the same queue protocol as a remote island"""
+
+    def __init__(self, island_id: int, seed: int, engine_factory, inbox, outbox):
+        self.worker = IslandWorker(island_id, seed, engine_factory)
+        self.inbox, self.outbox = inbox, outbox
+
+    def pump(self) -> None:
+        while True:
+            try:
+                command = self.inbox.get_nowait()
+            except queue.Empty:
+                return
+            if command is not None:
+                self.outbox.put(_answer(self.worker, command))
+
+
+class IslandModel:
+    """Runs N island populations in epochs, migrating the top-k narratives between epochs"""
+
+    def __init__(self, n_islands: int = 4, epochs: int = 5, generations_per_epoch: int = 5,
+                 migration_size: int = 2, topology: str = 'ring', seed: int = 0,
+                 engine_factory: Callable[[int], Any] = default_engine_factory,
+                 backend: str = 'process', queue_factory: Optional[Callable[[], Any]] = None):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology '{topology}', expected one of {TOPOLOGIES}")
+        if backend not in ('process', 'local'):
+            raise ValueError(f"Unknown island backend '{backend}', expected 'process' or 'local'")
+        self.n_islands = n_islands
+        self.epochs = epochs
+        self.generations_per_epoch = generations_per_epoch
+        self.migration_size = migration_size
+        self.topology = topology
+        self.seed = seed
+        self.engine_factory = engine_factory
+        self.backend = backend
+        # Any queue with put/get works, e.g. manager-served queues shared between hosts
+        self.queue_factory = queue_factory
+
+        self.fitness_history: List[float] = []
+        self.island_fitness_history: List[List[float]] = []
+        self.migrations = 0
+
+    def _start(self):
+        if self.backend == 'process':
+            context = multiprocessing.get_context()
+            make_queue = self.queue_factory or context.Queue
+        else:
+            make_queue = self.queue_factory or queue.Queue
+        inboxes = [make_queue() for _ in range(self.n_islands)]
+        outbox = make_queue()
+
+        islands = []
+        for island_id in range(self.n_islands):
+            args = (island_id, self.seed + island_id, self.engine_factory, inboxes[island_id], outbox)
+            if self.backend == 'process':
+                process = context.Process(target=_serve_island, args=args, daemon=True)
+                process.start()
+                islands.append(process)
+            else:
+                islands.append(_LocalIsland(*args))
+        return islands, inboxes, outbox
+
+    def _broadcast(self, islands, inboxes, outbox, commands: Dict[int, Tuple]) -> Dict[int, Tuple]:
+        """Send one command per island and collect the replies keyed by island id"""
+        for island_id, command in commands.items():
+            inboxes[island_id].put(command)
+        if self.backend == 'local':
+            for island_id in commands:
+                islands[island_id].pump()
+        replies = {}
+        while len(replies) < len(commands):
+            try:
+                reply = outbox.get(timeout=REPLY_POLL_SECONDS)
+            except queue.Empty:
+                self._check_alive(islands, [i for i in commands if i not in replies])
+                continue
+            if reply[0] == 'error':
+                raise IslandError(f"Island {reply[1]} failed:\n{reply[2]}")
+            replies[reply[1]] = reply
+        return replies
+
+    def _check_alive(self, islands, pending: List[int]) -> None:
+        """Raise for a pending island that can no longer reply, instead of waiting on it forever"""
+        for island_id in pending:
+            if self.backend == 'local':
+                raise IslandError(f"Island {island_id} did not reply")
+            if not islands[island_id].is_alive():
+                raise IslandError(f"Island {island_id} exited with code {islands[island_id].exitcode} "
+                                  f"without replying")
+
+    def run(self) -> Dict[str, Any]:
+        """Evolve every island for all epochs and return the merged report"""
+        print(f" Island model: {self.n_islands} islands, {self.topology} topology, {self.backend} backend")
+        islands, inboxes, outbox = self._start()
+        try:
+            for epoch in range(self.epochs):
+                evolve = ('evolve', self.generations_per_epoch, self.migration_size)
+                replies = self._broadcast(islands, inboxes, outbox, {i: evolve for i in range(self.n_islands)})
+
+                island_best = [replies[i][3] for i in range(self.n_islands)]
+                self.island_fitness_history.append(island_best)
+                self.fitness_history.append(max(island_best))
+                print(f"  Epoch {epoch:2d}: best={max(island_best):.3f} "
+                      f"islands=[{', '.join(f'{f:.3f}' for f in island_best)}]")
+
+                if epoch == self.epochs - 1:
+                    break
+                # Route migrants in source-island order so arrivals are deterministic
+                arrivals: Dict[int, List[NarrativeState]] = {i: [] for i in range(self.n_islands)}
+                for source in range(self.n_islands):
+                    for target in migration_targets(source, self.n_islands, self.topology):
+                        arrivals[target].extend(replies[source][2])
+                        self.migrations += len(replies[source][2])
+                self._broadcast(islands, inboxes, outbox,
+                                {i: ('immigrate', arrivals[i]) for i in range(self.n_islands) if arrivals[i]})
+
+            reports = self._broadcast(islands, inboxes, outbox, {i: ('report',) for i in range(self.n_islands)})
+            return self._merge_reports([reports[i][2] for i in range(self.n_islands)])
+        finally:
+            if self.backend == 'process':
+                for inbox in inboxes:
+                    inbox.put(None)
+                for process in islands:
+                    process.join(SHUTDOWN_SECONDS)
+                    if process.is_alive():
+                        process.terminate()
+                        process.join()
+
+    def _merge_reports(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+        best = max(reports, key=lambda r: r["best_fitness"] * 0.7 + r["best_semantic_quality"] * 0.3)
+        return {
+            "n_islands": self.n_islands,
+            "topology": self.topology,
+            "epochs": len(self.fitness_history),
+            "generations_per_epoch": self.generations_per_epoch,
+            "migration_size": self.migration_size,
+            "migrations": self.migrations,
+            "best_island": best["island_id"],
+            "best_fitness": best["best_fitness"],
+            "best_semantic_quality": best["best_semantic_quality"],
+            "best_narrative": best["best_narrative"],
+            "best_concepts": best["best_concepts"],
+            "fitness_progression": self.fitness_history,
+            "island_fitness_progression": self.island_fitness_history,
+            "islands": reports,
+        }
@@ -0,0 +1,78 @@
+#  LEXICON MATCHER
+# Keyword lists compiled once, matched against a narrative in a single pass
+
+import re
+from typing import Dict, FrozenSet, Iterable, Iterator, Tuple, Union
+from .text_analysis import AnalyzedText
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Combined regex with one branch per shared prefix, longest keyword first"""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional suffix: continue to the longer keyword before settling for this one
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class Lexicon:
+    """Compiled keyword matcher; keywords are lowercase and matched as substrings"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self._words = tuple(k for k in self.keywords if len(k.split()) == 1 and k == k.strip())
+        words = set(self._words)
+        self._phrases = tuple((k, tuple(k.split())) for k in self.keywords if k not in words)
+
+        # Every keyword that is a prefix of a match starts at the same position
+        self._prefixes = {
+            keyword: tuple(sorted((k for k in self.keywords if keyword.startswith(k)), key=len, reverse=True))
+            for keyword in self.keywords
+        }
+        self._pattern = re.compile(_trie_pattern(self.keywords)) if self.keywords else None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def present(self, content: Union[str, AnalyzedText]) -> FrozenSet[str]:
+        """Keywords occurring anywhere in the lowercased content"""
+        if isinstance(content, AnalyzedText):
+            lower, vocabulary, token_set = content.lower, content.vocabulary, content.token_set
+        else:
+            lower = vocabulary = content.lower()
+            token_set = frozenset()
+
+        # A keyword without whitespace can only occur inside one token, so the
+        # distinct-token vocabulary stands in for the full text
+        found = [k for k in self._words if k in token_set or k in vocabulary]
+        for phrase, pieces in self._phrases:
+            if all(piece in vocabulary for piece in pieces) and phrase in lower:
+                found.append(phrase)
+        return frozenset(found)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """All (start, keyword) hits in one scan of lowercased text, overlaps included"""
+        if self._pattern is None:
+            return
+        search = self._pattern.search
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            for keyword in self._prefixes[match.group()]:
+                yield start, keyword
+            match = search(text, start + 1)
+
+    def count(self, content: Union[str, AnalyzedText]) -> int:
+        """Number of distinct keywords present"""
+        return len(self.present(content))
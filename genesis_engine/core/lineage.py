@@ -0,0 +1,170 @@
+#  LINEAGE STORE
+# Append-only parent graph of evolved narratives with compact integer ids
+
+import os
+import json
+import numpy as np
+from typing import Dict, Iterable, Optional, Sequence
+
+LINEAGE_FORMAT_VERSION = 1
+MAX_PARENTS = 2
+
+
+def _expand_ranges(indptr: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Concatenation of range(indptr[v], indptr[v + 1]) for every node, without a Python loop"""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return shifts + np.arange(total)
+
+
+class LineageStore:
+    """
+    Every individual gets the next integer id (0, 1, 2, ... in insertion order) and one row of
+    up to two parent ids (-1 padded) and its generation, kept in append-only arrays. Parents are
+    always added before their children, so a parent id is always smaller than its child's.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.parents = np.full((max(16, capacity), MAX_PARENTS), -1, dtype=np.int32)
+        self.generations = np.zeros(max(16, capacity), dtype=np.int32)
+        self.size = 0
+        # Children as CSR (built on first descendant query, rebuilt after later appends)
+        self._children = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def next_id(self) -> int:
+        """Id the next added individual will receive"""
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * (self.parents.itemsize * MAX_PARENTS + self.generations.itemsize)
+
+    def _reserve(self, count: int) -> None:
+        if self.size + count <= len(self.generations):
+            return
+        capacity = max(16, 2 * (self.size + count))
+        parents = np.full((capacity, MAX_PARENTS), -1, dtype=np.int32)
+        parents[:self.size] = self.parents[:self.size]
+        generations = np.zeros(capacity, dtype=np.int32)
+        generations[:self.size] = self.generations[:self.size]
+        self.parents, self.generations = parents, generations
+
+    def add(self, parents: Iterable[int] = (), generation: int = 0) -> int:
+        """Record one individual and return its id"""
+        parents = [p for p in parents if p is not None and p >= 0]
+        if len(parents) > MAX_PARENTS:
+            raise ValueError(f"At most {MAX_PARENTS} parents per individual, got {len(parents)}")
+        if any(p >= self.size for p in parents):
+            raise ValueError(f"Parents {parents} must be added before their child")
+        self._reserve(1)
+        node = self.size
+        self.parents[node, :len(parents)] = parents
+        self.generations[node] = generation
+        self.size += 1
+        return node
+
+    def add_many(self, parents: np.ndarray, generations: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Record a batch from an (n, 2) parent array (-1 for none); returns the new ids"""
+        parents = np.asarray(parents, dtype=np.int64).reshape(-1, MAX_PARENTS)
+        count = len(parents)
+        ids = np.arange(self.size, self.size + count)
+        # Earlier rows of the same batch may be parents of later ones
+        if count and (parents >= ids[:, np.newaxis]).any():
+            raise ValueError("Parents must be added before their children")
+        self._reserve(count)
+        self.parents[self.size:self.size + count] = np.where(parents >= 0, parents, -1)
+        self.generations[self.size:self.size + count] = 0 if generations is None else generations
+        self.size += count
+        return ids
+
+    def parents_of(self, node: int) -> np.ndarray:
+        row = self.parents[node]
+        return row[row >= 0].astype(np.int64)
+
+    def generation_of(self, node: int) -> int:
+        return int(self.generations[node])
+
+    def _children_index(self):
+        if self._children is None or self._children[0] != self.size:
+            flat = self.parents[:self.size].ravel().astype(np.int64)
+            child = np.repeat(np.arange(self.size), MAX_PARENTS)
+            present = flat >= 0
+            flat, child = flat[present], child[present]
+            order = np.argsort(flat, kind='stable')
+            indptr = np.zeros(self.size + 1, dtype=np.int64)
+            np.cumsum(np.bincount(flat, minlength=self.size), out=indptr[1:])
+            self._children = (self.size, indptr, child[order])
+        return self._children[1], self._children[2]
+
+    def children_of(self, node: int) -> np.ndarray:
+        indptr, children = self._children_index()
+        return children[indptr[node]:indptr[node + 1]]
+
+    def ancestors(self, nodes, max_depth: Optional[int] = None) -> np.ndarray:
+        """Sorted ids of all ancestors of the given nodes (up to max_depth generations back)"""
+        frontier = np.unique(np.atleast_1d(np.asarray(nodes, dtype=np.int64)))
+        seen = np.zeros(self.size, dtype=bool)
+        depth = 0
+        while frontier.size and (max_depth is None or depth < max_depth):
+            step = self.parents[frontier].ravel()
+            step = np.unique(step[step >= 0])
+            frontier = step[~seen[step]]
+            seen[frontier] = True
+            depth += 1
+        return np.flatnonzero(seen)
+
+    def descendants(self, nodes, max_depth: Optional[int] = None) -> np.ndarray:
+        """Sorted ids of all descendants of the given nodes (up to max_depth generations forward)"""
+        indptr, children = self._children_index()
+        frontier = np.unique(np.atleast_1d(np.asarray(nodes, dtype=np.int64)))
+        seen = np.zeros(self.size, dtype=bool)
+        depth = 0
+        while frontier.size and (max_depth is None or depth < max_depth):
+            step = np.unique(children[_expand_ranges(indptr, frontier)])
+            frontier = step[~seen[step]]
+            seen[frontier] = True
+            depth += 1
+        return np.flatnonzero(seen)
+
+    def roots(self) -> np.ndarray:
+        return np.flatnonzero((self.parents[:self.size] < 0).all(axis=1))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {'lineage_parents': self.parents[:self.size], 'lineage_generations': self.generations[:self.size]}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> 'LineageStore':
+        store = cls(capacity=len(arrays['lineage_generations']))
+        store.add_many(arrays['lineage_parents'], arrays['lineage_generations'])
+        return store
+
+    def save(self, path: str) -> None:
+        """Write the graph as .npy files in a directory (loadable as memory maps)"""
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as fh:
+            json.dump({'size': self.size, 'version': LINEAGE_FORMAT_VERSION}, fh)
+        for name, array in self.to_arrays().items():
+            np.save(os.path.join(path, f'{name}.npy'), array)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'LineageStore':
+        """Open a saved graph; with mmap=True it stays on disk until the first append copies it"""
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as fh:
+            meta = json.load(fh)
+        if meta.get('version') != LINEAGE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported lineage format {meta.get('version')} in {path}")
+        mmap_mode = 'r' if mmap else None
+        store = cls.__new__(cls)
+        store.parents = np.load(os.path.join(path, 'lineage_parents.npy'), mmap_mode=mmap_mode)
+        store.generations = np.load(os.path.join(path, 'lineage_generations.npy'), mmap_mode=mmap_mode)
+        store.size = meta['size']
+        store._children = None
+        return store
@@ -0,0 +1,182 @@
+#  MULTI-OBJECTIVE SELECTION
+# NSGA-II non-dominated sorting and crowding distance over CRE evaluation components
+
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+from .advanced_evolution import AdvancedEvolutionaryEngine, NarrativeState
+
+# CREEvaluation fields treated as objectives, all maximized
+CRE_OBJECTIVES = ('eta_meaning', 'conservation_compliance', 'pattern_quality', 'ethical_alignment')
+# Rows of the dominance matrix computed per block; bounds the (block, n) temporaries
+DOMINANCE_BLOCK_SIZE = 64
+
+
+def objective_vector(cre_evaluation, objectives: Sequence[str] = CRE_OBJECTIVES) -> Tuple[float, ...]:
+    """Objective values of one CRE evaluation; () when the evaluation failed"""
+    if cre_evaluation is None:
+        return ()
+    return tuple(float(getattr(cre_evaluation, name)) for name in objectives)
+
+
+def objective_matrix(narratives: Sequence[Any], n_objectives: int = len(CRE_OBJECTIVES)) -> np.ndarray:
+    """(n, m) objectives of the narratives; narratives without an evaluation score 0 on every objective"""
+    F = np.zeros((len(narratives), n_objectives), dtype=np.float64)
+    for row, narrative in enumerate(narratives):
+        if narrative.objectives:
+            F[row] = narrative.objectives
+    return F
+
+
+def dominance_matrix(F: np.ndarray, block_size: int = DOMINANCE_BLOCK_SIZE) -> np.ndarray:
+    """D[i, j] is True when row i dominates row j (>= on every objective, > on at least one)"""
+    n, m = F.shape
+    D = np.empty((n, n), dtype=bool)
+    columns = [np.ascontiguousarray(F[:, k]) for k in range(m)]
+    for start in range(0, n, block_size):
+        stop = min(n, start + block_size)
+        # One objective at a time keeps every comparison a contiguous (block, n) operation
+        at_least = np.ones((stop - start, n), dtype=bool)
+        better = np.zeros((stop - start, n), dtype=bool)
+        for column in columns:
+            block = column[start:stop, np.newaxis]
+            at_least &= block >= column
+            better |= block > column
+        np.logical_and(at_least, better, out=D[start:stop])
+    return D
+
+
+def non_dominated_sort(F: np.ndarray) -> np.ndarray:
+    """
+    Front index of every row (0 = Pareto front), fast non-dominated sorting with vectorized dominance.
+    Identical objective vectors are ranked once, which matters for populations full of clones.
+    """
+    F = np.asarray(F, dtype=np.float64)
+    if len(F) == 0:
+        return np.empty(0, dtype=np.int64)
+    unique, inverse = np.unique(F, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    D = dominance_matrix(unique)
+    dominated_by = D.sum(axis=0)
+    ranks = np.full(len(unique), -1, dtype=np.int64)
+    front = np.flatnonzero(dominated_by == 0)
+    rank = 0
+    while front.size:
+        ranks[front] = rank
+        # Members of the next front were dominated only by this front and earlier ones
+        dominated_by = dominated_by - D[front].sum(axis=0)
+        dominated_by[ranks >= 0] = -1
+        front = np.flatnonzero(dominated_by == 0)
+        rank += 1
+    return ranks[inverse]
+
+
+def crowding_distance(F: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Crowding distance within each front; boundary points of every objective get infinity"""
+    F = np.asarray(F, dtype=np.float64)
+    n, m = F.shape
+    distance = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return distance
+    for front in range(int(ranks.max()) + 1):
+        members = np.flatnonzero(ranks == front)
+        if members.size <= 2:
+            distance[members] = np.inf
+            continue
+        values = F[members]
+        order = np.argsort(values, axis=0, kind='stable')
+        ordered = np.take_along_axis(values, order, axis=0)
+        span = ordered[-1] - ordered[0]
+        gaps = np.zeros_like(ordered)
+        np.divide(ordered[2:] - ordered[:-2], span, out=gaps[1:-1], where=span > 0)
+        gaps[0] = gaps[-1] = np.inf
+        # Scatter each objective's gaps back to member order and sum over objectives
+        contribution = np.zeros_like(values)
+        np.put_along_axis(contribution, order, gaps, axis=0)
+        distance[members] = contribution.sum(axis=1)
+    return distance
+
+
+def crowded_order(ranks: np.ndarray, crowding: np.ndarray) -> np.ndarray:
+    """Rows best first: lower front, then larger crowding distance, then earlier row"""
+    rows = np.arange(len(ranks))
+    return np.lexsort((rows, -crowding, ranks))
+
+
+def nsga2_select(F: np.ndarray, k: int) -> np.ndarray:
+    """Rows kept by NSGA-II environmental selection, best first"""
+    ranks = non_dominated_sort(F)
+    return crowded_order(ranks, crowding_distance(F, ranks))[:k]
+
+
+def pareto_front_report(F: np.ndarray, narratives: Sequence[Any],
+                        objectives: Sequence[str] = CRE_OBJECTIVES, limit: int = 10) -> Dict[str, Any]:
+    """Front sizes and the Pareto-optimal narratives with their objective values"""
+    ranks = non_dominated_sort(F)
+    crowding = crowding_distance(F, ranks)
+    front = [row for row in crowded_order(ranks, crowding) if ranks[row] == 0]
+    return {
+        "objectives": list(objectives),
+        "n_fronts": int(ranks.max()) + 1 if len(ranks) else 0,
+        "front_sizes": np.bincount(ranks).tolist() if len(ranks) else [],
+        "pareto_front": [
+            {
+                "state_id": narratives[row].state_id,
+                "content": narratives[row].content,
+                "objectives": dict(zip(objectives, F[row].tolist())),
+                "crowding_distance": float(crowding[row]),
+            }
+            for row in front[:limit]
+        ],
+        "ideal_point": dict(zip(objectives, F.max(axis=0).tolist())) if len(F) else {},
+    }
+
+
+class MultiObjectiveEvolutionaryEngine(AdvancedEvolutionaryEngine):
+    """
+    NSGA-II variant of the advanced engine: parents win crowded-comparison tournaments and the
+    next population is chosen from parents plus children by front, then crowding distance,
+    over the separate CRE objectives instead of a weighted fitness sum.
+    """
+
+    def __init__(self, hilbert_space, objectives: Sequence[str] = CRE_OBJECTIVES, **kwargs):
+        super().__init__(hilbert_space, **kwargs)
+        self.objectives = tuple(objectives)
+
+    def _objective_vector(self, cre_evaluation) -> Tuple[float, ...]:
+        return objective_vector(cre_evaluation, self.objectives)
+
+    def _objective_matrix(self, narratives: Sequence[NarrativeState]) -> np.ndarray:
+        return objective_matrix(narratives, len(self.objectives))
+
+    def _crowded_ranking(self, narratives: Sequence[NarrativeState]) -> Tuple[np.ndarray, np.ndarray]:
+        F = self._objective_matrix(narratives)
+        ranks = non_dominated_sort(F)
+        return ranks, crowding_distance(F, ranks)
+
+    def _semantic_aware_selection(self) -> List[NarrativeState]:
+        """Binary tournaments decided by the crowded-comparison operator"""
+        store = self._population_store()
+        ranks, crowding = self._crowded_ranking(self.population)
+        position = np.empty(len(ranks), dtype=np.float64)
+        position[crowded_order(ranks, crowding)] = np.arange(len(ranks))
+        winners = store.tournament(len(self.population) // 2, 2, -position)
+        return [self.population[i] for i in winners]
+
+    def _generate_advanced_offspring(self, parents: List[NarrativeState]) -> List[NarrativeState]:
+        """(mu + lambda) survival: a full brood of children competes with the current population"""
+        children = self._breed_children(parents, self.population_size)
+        self._score_narratives(children)
+
+        candidates = self.population + children
+        survivors = nsga2_select(self._objective_matrix(candidates), self.population_size)
+        return [candidates[i] for i in survivors]
+
+    def get_pareto_report(self, limit: int = 10) -> Dict[str, Any]:
+        return pareto_front_report(self._objective_matrix(self.population), self.population,
+                                   self.objectives, limit)
+
+    def get_advanced_report(self) -> Dict[str, Any]:
+        report = super().get_advanced_report()
+        report["pareto"] = self.get_pareto_report()
+        return report
@@ -0,0 +1,144 @@
+#  OFFSPRING RECORDS
+# Crossover children: one slotted record type, or columnar batches of typed records
+
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+from .population_store import Interner
+
+OFFSPRING_DTYPE = np.dtype([
+    ('parent_a', np.int32),          # Rows of OffspringBatch.parents
+    ('parent_b', np.int32),
+    ('coherence', np.float64),
+    ('resonance', np.float32),       # Strongest resonance point, 0 when there is none
+    ('resonance_points', np.int16),
+    ('fallback', np.bool_),          # Produced by the fallback blend after a failed crossover
+])
+
+
+class OffspringRecord:
+    """
+    One crossover child. Every crossover returns this one slotted type (no class minted per call,
+    no per-instance dict); `kind` is 'offspring', 'advanced' or 'fallback'.
+    """
+
+    __slots__ = ('vector_id', 'content', 'concepts', 'coherence', 'parent_ids', 'kind',
+                 'resonance_points', 'semantic_relationships')
+
+    def __init__(self, vector_id: str, content: str, concepts: List[str], coherence: float,
+                 parent_ids: List[str], kind: str = 'offspring',
+                 resonance_points: Sequence[Any] = (), semantic_relationships: Sequence[Any] = ()):
+        self.vector_id = vector_id
+        self.content = content
+        self.concepts = concepts
+        self.coherence = coherence
+        self.parent_ids = parent_ids
+        self.kind = kind
+        self.resonance_points = resonance_points
+        self.semantic_relationships = semantic_relationships
+
+    def __repr__(self) -> str:
+        return f"OffspringRecord({self.vector_id!r}, kind={self.kind!r}, concepts={len(self.concepts)})"
+
+
+def vector_id_of(parent: Any, default: str) -> str:
+    return getattr(parent, 'vector_id', default)
+
+
+def unique_parents(pairs: Sequence[Tuple[Any, Any]]) -> Tuple[List[Any], np.ndarray]:
+    """Distinct parent objects (by identity) and the (n, 2) rows of every pair into them"""
+    rows: Dict[int, int] = {}
+    parents: List[Any] = []
+    pair_rows = np.empty((len(pairs), 2), dtype=np.int32)
+    for i, pair in enumerate(pairs):
+        for column, parent in enumerate(pair):
+            row = rows.get(id(parent))
+            if row is None:
+                row = rows[id(parent)] = len(parents)
+                parents.append(parent)
+            pair_rows[i, column] = row
+    return parents, pair_rows
+
+
+class OffspringBatch:
+    """
+    Children of crossover_batch(pairs): records[i] holds the numeric fields of the child of
+    pairs[i], content[i] its text, and its concepts are vocabulary[concept_ids[offsets[i]:offsets[i + 1]]].
+    """
+
+    def __init__(self, parents: List[Any], records: np.ndarray, content: List[str],
+                 concept_offsets: np.ndarray, concept_ids: np.ndarray, vocabulary: List[str],
+                 kind: str = 'offspring'):
+        self.kind = kind
+        self.parents = parents
+        self.records = records
+        self.content = content
+        self.concept_offsets = concept_offsets
+        self.concept_ids = concept_ids
+        self.vocabulary = vocabulary
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def concepts_of(self, row: int) -> List[str]:
+        vocabulary = self.vocabulary
+        return [vocabulary[i] for i in self.concept_ids[self.concept_offsets[row]:self.concept_offsets[row + 1]]]
+
+    def parent_pair(self, row: int) -> Tuple[Any, Any]:
+        record = self.records[row]
+        return self.parents[record['parent_a']], self.parents[record['parent_b']]
+
+    def record(self, row: int) -> OffspringRecord:
+        """
+        Row as an OffspringRecord with the per-pair crossover's id, content, concepts, coherence,
+        parents and kind. Its resonance_points and semantic_relationships are empty: the batch keeps
+        only the number of resonance points and the strongest one (records['resonance_points'] and
+        records['resonance']), and no relationships.
+        """
+        parent_a, parent_b = self.parent_pair(row)
+        id_a, id_b = vector_id_of(parent_a, 'A'), vector_id_of(parent_b, 'B')
+        kind = 'fallback' if self.records['fallback'][row] else self.kind
+        return OffspringRecord(f"{kind}_{id_a}_{id_b}", self.content[row], self.concepts_of(row),
+                               float(self.records['coherence'][row]), [id_a, id_b], kind)
+
+
+class OffspringBatchBuilder:
+    """Collects children in pair order and packs them into an OffspringBatch"""
+
+    def __init__(self, parents: List[Any], pair_rows: np.ndarray, kind: str = 'offspring'):
+        self.kind = kind
+        self.parents = parents
+        self.pair_rows = pair_rows
+        self.columns: Dict[str, List[Any]] = {
+            name: [] for name in ('coherence', 'resonance', 'resonance_points', 'fallback')
+        }
+        self.content: List[str] = []
+        self.concept_ids: List[int] = []
+        self.concept_offsets = [0]
+        self.interner = Interner()
+
+    def add(self, content: str, concepts: Sequence[str], coherence: float,
+            resonance: float = 0.0, resonance_points: int = 0, fallback: bool = False) -> None:
+        columns = self.columns
+        columns['coherence'].append(coherence)
+        columns['resonance'].append(resonance)
+        columns['resonance_points'].append(resonance_points)
+        columns['fallback'].append(fallback)
+        self.content.append(content)
+        known = self.interner.ids
+        try:
+            # Children mostly recombine concepts already seen in this batch
+            self.concept_ids.extend([known[c] for c in concepts])
+        except KeyError:
+            intern = self.interner.intern
+            self.concept_ids.extend([intern(c) for c in concepts])
+        self.concept_offsets.append(len(self.concept_ids))
+
+    def build(self) -> OffspringBatch:
+        records = np.zeros(len(self.content), dtype=OFFSPRING_DTYPE)
+        records['parent_a'] = self.pair_rows[:len(records), 0]
+        records['parent_b'] = self.pair_rows[:len(records), 1]
+        for name, values in self.columns.items():
+            records[name] = values
+        return OffspringBatch(self.parents, records, self.content,
+                              np.asarray(self.concept_offsets, dtype=np.int64),
+                              np.asarray(self.concept_ids, dtype=np.int32), self.interner.values, self.kind)
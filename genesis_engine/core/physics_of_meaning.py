@@ -3,10 +3,10 @@
 
 import math
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, List, Union
 from dataclasses import dataclass
-import re
-from collections import Counter
+from .text_analysis import AnalyzedText, analyze_text
+from .lexicon import Lexicon
 
 @dataclass
 class CREEvaluation:
@@ -22,21 +22,28 @@ class CREEvaluation:
 class EnhancedCRE:
     """Advanced CRE with mathematical rigor - PHASE 1.5"""
     
+    # Bump whenever scores change, so cached evaluations are not reused
+    evaluator_version = "1.5"
+    
     def __init__(self):
         self.conservation_laws = ConsciousnessConservationLaws()
         self.pattern_operator = PatternExtractionOperator()
         self.ethical_attractor = LogosCouncil()
+        self.complexity_lexicon = Lexicon([
+            'consciousness', 'resonance', 'evolution', 'divine', 'mathematical',
+            'theological', 'philosophical', 'self-reference', 'emergent'
+        ])
         
     def evaluate_narrative_state(self, narrative_state) -> CREEvaluation:
         """Comprehensive evaluation using all physics constraints - PHASE 1.5"""
         
-        # Extract content for analysis
-        content = self._extract_content(narrative_state)
+        # Extract content and tokenize it once for every operator
+        content = analyze_text(self._extract_content(narrative_state))
         
         # Calculate advanced metrics
         entropy_measure = self._calculate_shannon_entropy(content)
         information_density = self._calculate_information_density(content)
-        eta_meaning = self._calculate_meaning_efficiency(content, entropy_measure)
+        eta_meaning = self._calculate_meaning_efficiency(content, entropy_measure, information_density)
         conservation_score = self.conservation_laws.validate(content)
         pattern_score = self.pattern_operator.evaluate(content) 
         ethical_score = self.ethical_attractor.evaluate_kenotic_alignment(content)
@@ -69,18 +76,17 @@ class EnhancedCRE:
         else:
             return str(narrative_state)
     
-    def _calculate_shannon_entropy(self, text: str) -> float:
+    def _calculate_shannon_entropy(self, text: Union[str, AnalyzedText]) -> float:
         """Calculate Shannon entropy of text - ACTUAL MATHEMATICAL IMPLEMENTATION"""
-        if not text or len(text.strip()) == 0:
+        analyzed = analyze_text(text)
+        if not analyzed.tokens:
             return 1.0  # Maximum entropy for empty content
             
-        # Count character frequencies
-        text = text.lower().replace(' ', '')
-        if len(text) == 0:
+        # Character frequencies of the lowercased text without spaces
+        char_counts = analyzed.char_histogram
+        total_chars = sum(char_counts.values())
+        if total_chars == 0:
             return 1.0
-            
-        char_counts = Counter(text)
-        total_chars = len(text)
         
         # Calculate entropy: H = -Σ p(x) * log2(p(x))
         entropy = 0.0
@@ -94,20 +100,15 @@ class EnhancedCRE:
         
         return min(1.0, normalized_entropy)
     
-    def _calculate_information_density(self, text: str) -> float:
+    def _calculate_information_density(self, text: Union[str, AnalyzedText]) -> float:
         """Calculate information density using unique concepts per sentence"""
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
+        analyzed = analyze_text(text)
+        if not analyzed.sentence_tokens:
             return 0.0
             
-        total_words = 0
+        total_words = analyzed.word_count
         unique_concepts = set()
-        
-        for sentence in sentences:
-            words = sentence.split()
-            total_words += len(words)
+        for words in analyzed.sentence_tokens:
             unique_concepts.update(words)
             
         if total_words == 0:
@@ -117,14 +118,17 @@ class EnhancedCRE:
         density = len(unique_concepts) / total_words
         return min(1.0, density * 3)  # Scale to reasonable range
     
-    def _calculate_meaning_efficiency(self, content: str, entropy: float) -> float:
+    def _calculate_meaning_efficiency(self, content: Union[str, AnalyzedText], entropy: float,
+                                      information_density: float = None) -> float:
         """η_meaning = Work extracted from chaos / Entropy invested - ACTUAL IMPLEMENTATION"""
-        if not content or entropy == 0:
+        analyzed = analyze_text(content)
+        if not analyzed.text or entropy == 0:
             return 0.0
             
         # Work extracted = information density * conceptual complexity
-        information_density = self._calculate_information_density(content)
-        conceptual_complexity = self._measure_conceptual_complexity(content)
+        if information_density is None:
+            information_density = self._calculate_information_density(analyzed)
+        conceptual_complexity = self._measure_conceptual_complexity(analyzed)
         
         work_extracted = information_density * conceptual_complexity
         
@@ -135,27 +139,23 @@ class EnhancedCRE:
         eta_meaning = work_extracted / entropy
         return min(1.0, eta_meaning)
 
-    def _measure_conceptual_complexity(self, text: str) -> float:
+    def _measure_conceptual_complexity(self, text: Union[str, AnalyzedText]) -> float:
         """Measure conceptual complexity based on sentence structure and vocabulary"""
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
+        analyzed = analyze_text(text)
+        if not analyzed.sentence_tokens:
             return 0.0
             
         # Factors: sentence length variation, vocabulary diversity, conceptual depth
-        sentence_lengths = [len(s.split()) for s in sentences]
+        sentence_lengths = analyzed.sentence_lengths
         
         if len(sentence_lengths) < 2:
             return 0.3  # Basic complexity for single sentence
             
         length_variance = np.var(sentence_lengths) / 100  # Normalize
-        vocab_diversity = len(set(text.lower().split())) / len(text.split()) if text.split() else 0
+        vocab_diversity = len(analyzed.token_set) / len(analyzed.tokens) if analyzed.tokens else 0
         
         # Conceptual depth based on presence of complex concepts
-        complex_concepts = ['consciousness', 'resonance', 'evolution', 'divine', 'mathematical', 
-                           'theological', 'philosophical', 'self-reference', 'emergent']
-        concept_density = sum(1 for concept in complex_concepts if concept in text.lower()) / len(complex_concepts)
+        concept_density = self.complexity_lexicon.count(analyzed) / len(self.complexity_lexicon)
         
         complexity = (0.4 * min(1.0, length_variance)) + (0.4 * vocab_diversity) + (0.2 * concept_density)
         return min(1.0, complexity)
@@ -177,56 +177,79 @@ class ConsciousnessConservationLaws:
             'evolution': ['development', 'growth', 'progress', 'emergence'],
             'creation': ['formation', 'generation', 'synthesis', 'production']
         }
+        
+        self.implication_map = {
+            'consciousness': ['think', 'know', 'understand', 'aware'],
+            'love': ['care', 'help', 'support', 'give'],
+            'divine': ['sacred', 'holy', 'bless', 'pray'],
+            'evolution': ['change', 'grow', 'develop', 'adapt'],
+            'creation': ['make', 'build', 'form', 'generate']
+        }
+        
+        # One matcher over every term the conservation check can look for
+        self.lexicon = Lexicon(
+            list(self.core_concepts) +
+            [term for terms in self.concept_transformations.values() for term in terms] +
+            [term for terms in self.implication_map.values() for term in terms]
+        )
     
-    def validate(self, content: str) -> float:
+    def validate(self, content: Union[str, AnalyzedText]) -> float:
         """Ensure core concepts are transformed but not destroyed - ENHANCED"""
-        content_lower = content.lower()
+        found = self.lexicon.present(analyze_text(content))
         conserved_quantity = 0
         
         for concept in self.core_concepts:
-            if concept in content_lower:
+            if concept in found:
                 conserved_quantity += 1.0  # Direct presence
-            elif self._concept_transformed(concept, content_lower):
+            elif self._concept_transformed(concept, found):
                 conserved_quantity += 0.7  # Transformed presence
-            elif self._concept_implied(concept, content_lower):
+            elif self._concept_implied(concept, found):
                 conserved_quantity += 0.4  # Implied presence
                 
         return conserved_quantity / len(self.core_concepts)
     
-    def _concept_transformed(self, concept: str, content: str) -> bool:
+    def _concept_transformed(self, concept: str, found: FrozenSet[str]) -> bool:
         """Check if concept exists in transformed state"""
-        if concept in self.concept_transformations:
-            for transformation in self.concept_transformations[concept]:
-                if transformation in content:
-                    return True
-        return False
+        return any(term in found for term in self.concept_transformations.get(concept, ()))
     
-    def _concept_implied(self, concept: str, content: str) -> bool:
+    def _concept_implied(self, concept: str, found: FrozenSet[str]) -> bool:
         """Check if concept is implied through related terms"""
-        implication_map = {
-            'consciousness': ['think', 'know', 'understand', 'aware'],
-            'love': ['care', 'help', 'support', 'give'],
-            'divine': ['sacred', 'holy', 'bless', 'pray'],
-            'evolution': ['change', 'grow', 'develop', 'adapt'],
-            'creation': ['make', 'build', 'form', 'generate']
-        }
-        
-        if concept in implication_map:
-            for implied_term in implication_map[concept]:
-                if implied_term in content:
-                    return True
-        return False
+        return any(term in found for term in self.implication_map.get(concept, ()))
 
 class PatternExtractionOperator:
     """Implementation of graph-theoretic curvature operator   C - ENHANCED"""
     
-    def evaluate(self, content: str) -> float:
+    def __init__(self):
+        # Self-referential patterns
+        self.self_ref_patterns = [
+            'pattern of patterns',
+            'self reference',
+            'recursive',
+            'feedback loop',
+            'circular causality'
+        ]
+        
+        # Novel combinations and unexpected insights
+        self.emergent_indicators = [
+            'emerges from',
+            'gives rise to',
+            'leads to unexpected',
+            'novel combination',
+            'unforeseen consequence',
+            'surprising result'
+        ]
+        
+        self.vortex_lexicon = Lexicon(self.self_ref_patterns)
+        self.emergence_lexicon = Lexicon(self.emergent_indicators)
+    
+    def evaluate(self, content: Union[str, AnalyzedText]) -> float:
         """Measure vorticity and non-obvious connections - ENHANCED"""
-        if not content:
+        analyzed = analyze_text(content)
+        if not analyzed.text:
             return 0.0
             
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Lowercased word set of each sentence, shared by the connection checks
+        sentences = analyzed.sentence_word_sets
         
         if len(sentences) < 2:
             return 0.3  # Basic pattern for single sentence
@@ -235,13 +258,13 @@ class PatternExtractionOperator:
         connection_density = self._calculate_connection_density(sentences)
         
         # 2. Conceptual vortices (self-referential loops)
-        vortices = self._detect_conceptual_vortices(content)
+        vortices = self._detect_conceptual_vortices(analyzed)
         
         # 3. Non-linear progression
         non_linearity = self._measure_non_linearity(sentences)
         
         # 4. Emergent pattern quality
-        emergence = self._detect_emergent_patterns(content)
+        emergence = self._detect_emergent_patterns(analyzed)
         
         pattern_score = (
             0.3 * connection_density +
@@ -252,7 +275,7 @@ class PatternExtractionOperator:
         
         return min(1.0, pattern_score)
     
-    def _calculate_connection_density(self, sentences: List[str]) -> float:
+    def _calculate_connection_density(self, sentences: List[Union[str, frozenset]]) -> float:
         """Calculate how connected the sentences are conceptually"""
         if len(sentences) < 2:
             return 0.0
@@ -267,10 +290,10 @@ class PatternExtractionOperator:
                     
         return connections / total_possible if total_possible > 0 else 0.0
     
-    def _sentences_connected(self, sent1: str, sent2: str) -> bool:
-        """Check if two sentences are conceptually connected"""
-        words1 = set(sent1.lower().split())
-        words2 = set(sent2.lower().split())
+    def _sentences_connected(self, sent1: Union[str, frozenset], sent2: Union[str, frozenset]) -> bool:
+        """Check if two sentences (text or lowercased word sets) are conceptually connected"""
+        words1 = set(sent1.lower().split()) if isinstance(sent1, str) else sent1
+        words2 = set(sent2.lower().split()) if isinstance(sent2, str) else sent2
         
         # Connected if they share meaningful words (not just common words)
         common_words = words1.intersection(words2)
@@ -278,27 +301,12 @@ class PatternExtractionOperator:
         
         return len(common_words) >= 2  # At least 2 meaningful shared concepts
     
-    def _detect_conceptual_vortices(self, content: str) -> List[str]:
+    def _detect_conceptual_vortices(self, content: Union[str, AnalyzedText]) -> List[str]:
         """Detect self-referential conceptual loops"""
-        vortices = []
-        words = content.lower().split()
-        
-        # Look for self-referential patterns
-        self_ref_patterns = [
-            'pattern of patterns',
-            'self reference',
-            'recursive',
-            'feedback loop',
-            'circular causality'
-        ]
-        
-        for pattern in self_ref_patterns:
-            if pattern in content.lower():
-                vortices.append(pattern)
-                
-        return vortices
+        found = self.vortex_lexicon.present(analyze_text(content))
+        return [pattern for pattern in self.self_ref_patterns if pattern in found]
     
-    def _measure_non_linearity(self, sentences: List[str]) -> float:
+    def _measure_non_linearity(self, sentences: List[Union[str, frozenset]]) -> float:
         """Measure how non-linear the narrative progression is"""
         if len(sentences) < 3:
             return 0.5  # Neutral for short content
@@ -315,20 +323,10 @@ class PatternExtractionOperator:
         
         return non_linearity
     
-    def _detect_emergent_patterns(self, content: str) -> float:
+    def _detect_emergent_patterns(self, content: Union[str, AnalyzedText]) -> float:
         """Detect emergent patterns that weren't in individual components"""
-        # Look for novel combinations and unexpected insights
-        emergent_indicators = [
-            'emerges from',
-            'gives rise to',
-            'leads to unexpected',
-            'novel combination',
-            'unforeseen consequence',
-            'surprising result'
-        ]
-        
-        found_indicators = sum(1 for indicator in emergent_indicators if indicator in content.lower())
-        return min(1.0, found_indicators / len(emergent_indicators))
+        found_indicators = self.emergence_lexicon.count(analyze_text(content))
+        return min(1.0, found_indicators / len(self.emergent_indicators))
 
 class LogosCouncil:
     """Ethical attractor ensuring kenotic alignment - ENHANCED"""
@@ -346,28 +344,30 @@ class LogosCouncil:
         self.anti_principles = {
             'hate', 'violence', 'destruction', 'selfishness', 'greed', 'domination'
         }
+        
+        self.lexicon = Lexicon(
+            list(self.kenotic_principles) +
+            [synonym for synonyms in self.kenotic_principles.values() for synonym in synonyms] +
+            list(self.anti_principles)
+        )
     
-    def evaluate_kenotic_alignment(self, content: str) -> float:
+    def evaluate_kenotic_alignment(self, content: Union[str, AnalyzedText]) -> float:
         """Measure alignment with kenotic principles - ENHANCED"""
-        content_lower = content.lower()
+        found = self.lexicon.present(analyze_text(content))
         
         positive_score = 0
         negative_score = 0
         
         # Score positive principles
         for principle, synonyms in self.kenotic_principles.items():
-            if principle in content_lower:
+            if principle in found:
                 positive_score += 1.0
-            else:
-                # Check synonyms
-                for synonym in synonyms:
-                    if synonym in content_lower:
-                        positive_score += 0.7
-                        break
+            elif any(synonym in found for synonym in synonyms):
+                positive_score += 0.7
         
         # Penalize anti-principles
         for anti_principle in self.anti_principles:
-            if anti_principle in content_lower:
+            if anti_principle in found:
                 negative_score += 1.0
         
         # Normalize positive score
@@ -0,0 +1,125 @@
+#  POPULATION STORE
+# Struct-of-arrays view of a narrative population for vectorized selection
+
+import random
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class Interner:
+    """Stable integer ids for strings (concepts)"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def lookup(self, index: int) -> str:
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def selection_rng() -> np.random.Generator:
+    """NumPy generator seeded from the random module, so random.seed() still fixes a run"""
+    return np.random.default_rng(random.getrandbits(64))
+
+
+class PopulationStore:
+    """
+    Columnar population: one NumPy array per numeric field and interned concepts.
+    The narrative objects stay in `narratives` for content; row i describes narratives[i].
+    Ancestry is not stored here: engines keep it in their LineageStore, keyed by lineage_id.
+    """
+
+    def __init__(self, narratives: Sequence[Any], concept_interner: Optional[Interner] = None):
+        self.narratives = narratives
+        self.concept_interner = concept_interner if concept_interner is not None else Interner()
+        n = len(narratives)
+
+        self.fitness = np.fromiter((x.fitness_score for x in narratives), dtype=np.float64, count=n)
+        self.semantic_quality = np.fromiter((getattr(x, 'semantic_quality', 0.0) for x in narratives),
+                                            dtype=np.float64, count=n)
+        self.coherence = np.fromiter((x.coherence for x in narratives), dtype=np.float64, count=n)
+        self.generation = np.fromiter((x.generation for x in narratives), dtype=np.int32, count=n)
+
+        # Concepts as a ragged array: row i owns concept_ids[concept_offsets[i]:concept_offsets[i + 1]]
+        intern_concept = self.concept_interner.intern
+        lengths = np.fromiter((len(x.concepts) for x in narratives), dtype=np.int64, count=n)
+        self.concept_offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.concept_offsets[1:])
+        self.concept_ids = np.fromiter((intern_concept(c) for x in narratives for c in x.concepts),
+                                       dtype=np.int32, count=int(self.concept_offsets[-1]))
+
+    def __len__(self) -> int:
+        return len(self.narratives)
+
+    def concepts_of(self, row: int) -> np.ndarray:
+        return self.concept_ids[self.concept_offsets[row]:self.concept_offsets[row + 1]]
+
+    def weighted_score(self, fitness_weight: float = 1.0, semantic_weight: float = 0.0) -> np.ndarray:
+        return fitness_weight * self.fitness + semantic_weight * self.semantic_quality
+
+    def tournament(self, n_winners: int, tournament_size: int, scores: np.ndarray,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Rows winning n_winners tournaments of distinct contestants; ties go to the first drawn"""
+        n = len(self)
+        if n_winners <= 0 or n == 0:
+            return np.empty(0, dtype=np.int64)
+        if tournament_size > n:
+            raise ValueError(f"Tournament of {tournament_size} from a population of {n}")
+        rng = rng or selection_rng()
+
+        # Draw with replacement, then redraw the few tournaments that repeated a contestant
+        contestants = rng.integers(0, n, size=(n_winners, tournament_size))
+        while tournament_size > 1:
+            ordered = np.sort(contestants, axis=1)
+            repeated = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+            if repeated.size == 0:
+                break
+            contestants[repeated] = rng.integers(0, n, size=(repeated.size, tournament_size))
+
+        best = np.argmax(scores[contestants], axis=1)
+        return contestants[np.arange(n_winners), best]
+
+    def top_k(self, k: int, scores: np.ndarray) -> np.ndarray:
+        """Rows of the k highest scores, best first; earlier rows win ties"""
+        n = len(self)
+        k = min(k, n)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    def best(self, scores: np.ndarray) -> int:
+        return int(np.argmax(scores))
+
+    def unique_concept_count(self) -> int:
+        if self.concept_ids.size == 0:
+            return 0
+        return int(np.count_nonzero(np.bincount(self.concept_ids)))
+
+    def statistics(self) -> Dict[str, Any]:
+        """Population summary computed column-wise"""
+        if len(self) == 0:
+            return {"size": 0}
+        return {
+            "size": len(self),
+            "fitness_mean": float(self.fitness.mean()),
+            "fitness_std": float(self.fitness.std()),
+            "fitness_min": float(self.fitness.min()),
+            "fitness_max": float(self.fitness.max()),
+            "semantic_quality_mean": float(self.semantic_quality.mean()),
+            "semantic_quality_var": float(self.semantic_quality.var()),
+            "coherence_mean": float(self.coherence.mean()),
+            "generation_mean": float(self.generation.mean()),
+            "unique_concepts": self.unique_concept_count(),
+            "concepts_per_narrative": float(self.concept_ids.size / len(self)),
+        }
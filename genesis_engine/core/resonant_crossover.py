@@ -1,8 +1,11 @@
 #  RESONANT CROSSOVER ENGINE - ROBUST VERSION  
 # Fixed concept handling and improved performance
 
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional, Sequence
 from dataclasses import dataclass
+import numpy as np
+from .concept_embeddings import ConceptEmbeddings, SimilarityBlocks, default_concept_embeddings, top_pairs
+from .offspring import OffspringBatch, OffspringBatchBuilder, OffspringRecord, unique_parents, vector_id_of
 
 @dataclass
 class ResonancePoint:
@@ -15,9 +18,12 @@ class ResonancePoint:
 class ResonantCrossoverEngine:
     """The primary variation operator for creative synthesis - ROBUST VERSION"""
     
-    def __init__(self):
+    def __init__(self, concept_embeddings: Optional[ConceptEmbeddings] = None):
         self.resonance_threshold = 0.5  # Lowered threshold for more crossover
-        self.max_concept_pairs = 20  # Limit to prevent combinatorial explosion
+        self.max_resonance_points = 20  # Strongest pairs kept out of all concepts_a x concepts_b
+        if concept_embeddings is None:
+            concept_embeddings = default_concept_embeddings()
+        self.concept_embeddings = concept_embeddings
         
     def crossover(self, parent_a, parent_b):
         """Perform sacred synthesis of two narrative fragments - ROBUST"""
@@ -26,10 +32,6 @@ class ResonantCrossoverEngine:
             concepts_a = self._safe_get_concepts(parent_a)
             concepts_b = self._safe_get_concepts(parent_b)
             
-            # Limit concepts to prevent combinatorial explosion
-            concepts_a = concepts_a[:10]  # Limit to first 10 concepts
-            concepts_b = concepts_b[:10]  # Limit to first 10 concepts
-            
             # 1. Resonance detection
             resonance_points = self._detect_resonance_points(concepts_a, concepts_b)
             
@@ -42,20 +44,46 @@ class ResonantCrossoverEngine:
             blended_content = self._blend_content(content_a, content_b)
             
             # Create offspring state
-            offspring = type('OffspringState', (), {
-                'vector_id': f"offspring_{getattr(parent_a, 'vector_id', 'A')}_{getattr(parent_b, 'vector_id', 'B')}",
-                'content': blended_content,
-                'concepts': blended_concepts,
-                'coherence': (getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
-                'parent_ids': [getattr(parent_a, 'vector_id', 'A'), getattr(parent_b, 'vector_id', 'B')]
-            })()
-            
-            return offspring
+            id_a, id_b = vector_id_of(parent_a, 'A'), vector_id_of(parent_b, 'B')
+            return OffspringRecord(
+                vector_id=f"offspring_{id_a}_{id_b}",
+                content=blended_content,
+                concepts=blended_concepts,
+                coherence=(getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
+                parent_ids=[id_a, id_b],
+                kind='offspring',
+                resonance_points=resonance_points
+            )
             
         except Exception as e:
             # Fallback: simple concatenation if crossover fails
             return self._fallback_crossover(parent_a, parent_b)
     
+    def crossover_batch(self, pairs: Sequence[Tuple[Any, Any]]) -> OffspringBatch:
+        """One child per (parent_a, parent_b) pair; parent features and concept embeddings computed once"""
+        parents, pair_rows = unique_parents(pairs)
+        concepts = [self._safe_get_concepts(p) for p in parents]
+        contents = [self._safe_get_content(p) for p in parents]
+        coherence = [getattr(p, 'coherence', 0.3) for p in parents]
+        blocks = SimilarityBlocks(self.concept_embeddings, concepts)
+        
+        builder = OffspringBatchBuilder(parents, pair_rows, kind='offspring')
+        for a, b in pair_rows.tolist():
+            try:
+                resonance_points = self._resonance_points(concepts[a], concepts[b], blocks.block(a, b))
+                builder.add(
+                    content=self._blend_content(contents[a], contents[b]),
+                    concepts=self._blend_concepts(concepts[a], concepts[b], resonance_points),
+                    coherence=(coherence[a] + coherence[b]) / 2,
+                    resonance=resonance_points[0].resonance_strength if resonance_points else 0.0,
+                    resonance_points=len(resonance_points)
+                )
+            except Exception:
+                content, blended_concepts = self._fallback_blend(contents[a], contents[b], concepts[a], concepts[b])
+                builder.add(content=content, concepts=blended_concepts,
+                            coherence=(coherence[a] + coherence[b]) / 2, fallback=True)
+        return builder.build()
+    
     def _safe_get_concepts(self, parent) -> List[str]:
         """Safely extract concepts from parent with validation"""
         concepts = getattr(parent, 'concepts', [])
@@ -71,106 +99,60 @@ class ResonantCrossoverEngine:
             content = ''
         return str(content)
     
+    def _fallback_blend(self, content_a: str, content_b: str,
+                        concepts_a: List[str], concepts_b: List[str]) -> Tuple[str, List[str]]:
+        """Simple blending as fallback, shared by crossover and crossover_batch"""
+        return f"{content_a} integrated with {content_b}", list(dict.fromkeys(concepts_a + concepts_b))
+    
     def _fallback_crossover(self, parent_a, parent_b):
         """Fallback crossover method if main method fails"""
-        content_a = self._safe_get_content(parent_a)
-        content_b = self._safe_get_content(parent_b)
-        concepts_a = self._safe_get_concepts(parent_a)
-        concepts_b = self._safe_get_concepts(parent_b)
+        blended_content, blended_concepts = self._fallback_blend(
+            self._safe_get_content(parent_a), self._safe_get_content(parent_b),
+            self._safe_get_concepts(parent_a), self._safe_get_concepts(parent_b))
         
-        # Simple blending as fallback
-        blended_content = f"{content_a} integrated with {content_b}"
-        blended_concepts = list(set(concepts_a + concepts_b))
-        
-        offspring = type('OffspringState', (), {
-            'vector_id': f"fallback_{getattr(parent_a, 'vector_id', 'A')}_{getattr(parent_b, 'vector_id', 'B')}",
-            'content': blended_content,
-            'concepts': blended_concepts,
-            'coherence': (getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
-            'parent_ids': [getattr(parent_a, 'vector_id', 'A'), getattr(parent_b, 'vector_id', 'B')]
-        })()
-        
-        return offspring
+        id_a, id_b = vector_id_of(parent_a, 'A'), vector_id_of(parent_b, 'B')
+        return OffspringRecord(
+            vector_id=f"fallback_{id_a}_{id_b}",
+            content=blended_content,
+            concepts=blended_concepts,
+            coherence=(getattr(parent_a, 'coherence', 0.3) + getattr(parent_b, 'coherence', 0.3)) / 2,
+            parent_ids=[id_a, id_b],
+            kind='fallback'
+        )
     
     def _detect_resonance_points(self, concepts_a: List[str], concepts_b: List[str]) -> List[ResonancePoint]:
-        """Find conceptual points of maximum resonance - OPTIMIZED"""
-        resonance_points = []
-        
-        # Limit the number of comparisons to prevent slowdown
-        max_comparisons = min(len(concepts_a) * len(concepts_b), self.max_concept_pairs)
-        comparisons = 0
-        
-        for concept_a in concepts_a:
-            for concept_b in concepts_b:
-                if comparisons >= max_comparisons:
-                    break
-                    
-                score = self._calculate_conceptual_resonance(concept_a, concept_b)
-                if score > self.resonance_threshold:
-                    resonance_points.append(
-                        ResonancePoint(
-                            concept_a=concept_a,
-                            concept_b=concept_b,
-                            resonance_strength=score,
-                            emergent_potential=score * 1.2
-                        )
-                    )
-                
-                comparisons += 1
-            if comparisons >= max_comparisons:
-                break
-        
-        return resonance_points
+        """Find conceptual points of maximum resonance - one similarity matrix over all pairs"""
+        return self._resonance_points(concepts_a, concepts_b, self.concept_embeddings.similarity(concepts_a, concepts_b))
+    
+    def _resonance_points(self, concepts_a: List[str], concepts_b: List[str],
+                          scores: np.ndarray) -> List[ResonancePoint]:
+        """Strongest pairs of a concepts_a x concepts_b similarity matrix above the threshold"""
+        return [
+            ResonancePoint(
+                concept_a=concepts_a[i],
+                concept_b=concepts_b[j],
+                resonance_strength=score,
+                emergent_potential=score * 1.2
+            )
+            for i, j, score in top_pairs(scores, self.max_resonance_points, self.resonance_threshold)
+        ]
     
     def _calculate_conceptual_resonance(self, concept_a: str, concept_b: str) -> float:
-        """Calculate resonance between two concepts - ROBUST"""
-        try:
-            # Handle None or empty concepts
-            if not concept_a or not concept_b:
-                return 0.0
-                
-            a_lower = str(concept_a).lower().strip()
-            b_lower = str(concept_b).lower().strip()
-            
-            if not a_lower or not b_lower:
-                return 0.0
-            
-            # Exact match
-            if a_lower == b_lower:
-                return 1.0
-                
-            # Shared substring (quick check)
-            if a_lower in b_lower or b_lower in a_lower:
-                return 0.8
-                
-            # Shared letters (faster implementation)
-            set_a = set(a_lower)
-            set_b = set(b_lower)
-            
-            if not set_a or not set_b:
-                return 0.3
-                
-            shared_letters = len(set_a & set_b)
-            total_letters = len(set_a | set_b)
-            
-            if total_letters > 0:
-                return shared_letters / total_letters
-                
-            return 0.3  # Default low resonance
-            
-        except Exception:
-            return 0.3  # Safe fallback
+        """Calculate resonance between two concepts - cosine of their concept embeddings"""
+        if not concept_a or not concept_b or not str(concept_a).strip() or not str(concept_b).strip():
+            return 0.0
+        return float(self.concept_embeddings.similarity([str(concept_a)], [str(concept_b)])[0, 0])
     
     def _blend_concepts(self, concepts_a: List[str], concepts_b: List[str], resonance_points: List[ResonancePoint]) -> List[str]:
         """Blend concepts based on resonance points"""
-        # Start with all unique concepts
-        blended = set(concepts_a + concepts_b)
+        # Start with all unique concepts, in first-seen order
+        blended = dict.fromkeys(concepts_a + concepts_b)
         
         # Add emergent concepts from high-resonance pairs (limit to 3)
         high_resonance_points = [p for p in resonance_points if p.resonance_strength > 0.8]
         for point in high_resonance_points[:3]:  # Limit to top 3
             emergent_concept = f"{point.concept_a}-{point.concept_b}"
-            blended.add(emergent_concept)
+            blended[emergent_concept] = None
         
         return list(blended)
     
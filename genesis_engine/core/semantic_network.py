@@ -0,0 +1,97 @@
+#  SEMANTIC NETWORK
+# Concept similarity table compiled once into a dense matrix and shared by every crossover engine
+
+import json
+import numpy as np
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+# Concepts grouped by meaning; stands in for a word embedding space
+DEFAULT_SEMANTIC_GROUPS: Dict[str, Tuple[str, ...]] = {
+    'consciousness': ('awareness', 'mind', 'cognition', 'sentience', 'perception'),
+    'love': ('compassion', 'care', 'empathy', 'kindness', 'devotion'),
+    'evolution': ('development', 'growth', 'progress', 'adaptation', 'emergence'),
+    'resonance': ('harmony', 'vibration', 'frequency', 'sympathy', 'alignment'),
+    'mathematics': ('symmetry', 'logic', 'pattern', 'structure', 'calculation'),
+    'divine': ('sacred', 'holy', 'spiritual', 'transcendent', 'eternal'),
+    'creation': ('formation', 'generation', 'synthesis', 'production', 'inception'),
+    'cosmic': ('universal', 'celestial', 'astral', 'galactic', 'infinite'),
+}
+
+SELF_SIMILARITY = 1.0
+SAME_GROUP_SIMILARITY = 0.8
+CROSS_GROUP_SIMILARITY = 0.4
+
+
+def load_concept_groups(path: str) -> Dict[str, Tuple[str, ...]]:
+    """Concept groups from a JSON file mapping group name to a list of concepts"""
+    with open(path, 'r', encoding='utf-8') as fh:
+        groups = json.load(fh)
+    if not isinstance(groups, dict):
+        raise ValueError(f"Concept groups in {path} must be a JSON object of group -> concepts")
+    return {str(name): tuple(str(c) for c in concepts) for name, concepts in groups.items()}
+
+
+class SemanticNetwork:
+    """
+    Concepts of all groups indexed 0..n-1 with an (n, n) similarity matrix: 1.0 on the diagonal,
+    0.8 for concepts sharing a group and 0.4 otherwise. Group names themselves are not concepts.
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]] = DEFAULT_SEMANTIC_GROUPS):
+        merged: Dict[str, Tuple[str, ...]] = {}
+        for name, concepts in groups.items():
+            merged[name] = tuple(dict.fromkeys(merged.get(name, ()) + tuple(concepts)))
+        self.groups = merged
+        self.concepts: Tuple[str, ...] = tuple(dict.fromkeys(c for cs in merged.values() for c in cs))
+        self.index: Dict[str, int] = {concept: i for i, concept in enumerate(self.concepts)}
+
+        membership = np.zeros((len(self.concepts), len(merged)), dtype=np.float32)
+        for column, concepts in enumerate(merged.values()):
+            membership[[self.index[c] for c in concepts], column] = 1.0
+        shared = (membership @ membership.T) > 0
+        self.similarity = np.where(shared, SAME_GROUP_SIMILARITY, CROSS_GROUP_SIMILARITY)
+        np.fill_diagonal(self.similarity, SELF_SIMILARITY)
+        self.similarity.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.concepts)
+
+    def __contains__(self, concept: str) -> bool:
+        return concept in self.index
+
+    def extended(self, groups: Mapping[str, Iterable[str]]) -> 'SemanticNetwork':
+        """New network with extra groups; a group with an existing name gains the new concepts"""
+        combined: Dict[str, Tuple[str, ...]] = dict(self.groups)
+        for name, concepts in groups.items():
+            combined[name] = combined.get(name, ()) + tuple(concepts)
+        return SemanticNetwork(combined)
+
+    def similarity_of(self, concept_a: str, concept_b: str) -> Optional[float]:
+        """Similarity of two concepts, None when either is outside the network"""
+        i = self.index.get(concept_a)
+        j = self.index.get(concept_b)
+        if i is None or j is None:
+            return None
+        return float(self.similarity[i, j])
+
+    def indices(self, concepts: Sequence[str]) -> np.ndarray:
+        """Row of every concept, -1 for concepts outside the network"""
+        get = self.index.get
+        return np.fromiter((get(c, -1) for c in concepts), dtype=np.int64, count=len(concepts))
+
+
+_NETWORKS: Dict[Optional[str], SemanticNetwork] = {}
+
+
+def load_semantic_network(groups_path: Optional[str] = None) -> SemanticNetwork:
+    """
+    Process-wide network of the default groups, extended by the groups in groups_path if given.
+    Each distinct path is compiled once and the same read-only instance is returned afterwards.
+    """
+    network = _NETWORKS.get(groups_path)
+    if network is None:
+        network = SemanticNetwork(DEFAULT_SEMANTIC_GROUPS)
+        if groups_path is not None:
+            network = network.extended(load_concept_groups(groups_path))
+        _NETWORKS[groups_path] = network
+    return network
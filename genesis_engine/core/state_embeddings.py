@@ -0,0 +1,213 @@
+#  STATE EMBEDDINGS
+# Append-only float32 matrix of state vectors, row-aligned with state ids, memory-mapped when large
+
+import os
+import tempfile
+import weakref
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+from .concept_embeddings import ConceptEmbeddings, default_concept_embeddings
+
+INITIAL_CAPACITY = 64
+# Backing arrays larger than this live in a temporary memory-mapped file instead of RAM
+MMAP_THRESHOLD_BYTES = 256 * 2 ** 20
+# Rows scored per matrix product in nearest-state search (bounds the score buffer)
+SEARCH_BLOCK_ROWS = 1 << 16
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def state_text(state: Any) -> str:
+    """What an encoder reads for a state: its content, or its concepts when it has none"""
+    content = state.semantic_content.get('content') if isinstance(state.semantic_content, dict) else None
+    return content if isinstance(content, str) and content else ' '.join(state.concepts)
+
+
+def embed_states(states: Sequence[Any], encoder: Optional[Any] = None,
+                 concept_embeddings: Optional[ConceptEmbeddings] = None) -> np.ndarray:
+    """
+    (n, d) unit vectors for the states in one batched encode: `encoder.encode(texts)` of their
+    content when given, otherwise the normalized centroid of their concept embeddings. States
+    without concepts get a zero row.
+    """
+    if encoder is not None:
+        texts = [state_text(state) for state in states]
+        return normalize_rows(np.asarray(encoder.encode(texts), dtype=np.float32).reshape(len(texts), -1))
+
+    table = default_concept_embeddings() if concept_embeddings is None else concept_embeddings
+    counts = np.fromiter((len(state.concepts) for state in states), dtype=np.int64, count=len(states))
+    vectors = table.embed([concept for state in states for concept in state.concepts])
+    sums = np.zeros((len(states), vectors.shape[1]), dtype=np.float32)
+    nonempty = counts > 0
+    if nonempty.any():
+        # Consecutive non-empty segments bound each other, so reduceat sums exactly one state each
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        sums[nonempty] = np.add.reduceat(vectors, starts[nonempty], axis=0)
+    return normalize_rows(sums)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass  # Already gone, or still mapped by a view on a platform that forbids removing it
+
+
+class StateEmbeddingMatrix:
+    """
+    Append-only (rows, d) float32 matrix with one row per state vector. Replacing a state
+    appends a new row and retires the old one; removing it only retires its row, so row
+    numbers never move. Past `mmap_threshold` bytes the matrix is a memory-mapped temporary
+    file (in `directory`), removed when the matrix is collected.
+    """
+
+    def __init__(self, mmap_threshold: int = MMAP_THRESHOLD_BYTES, directory: Optional[str] = None):
+        self.mmap_threshold = mmap_threshold
+        self.directory = directory
+        self.dimension: Optional[int] = None
+        self.size = 0
+        self.ids: List[str] = []              # Row -> state id, retired rows included
+        self.rows: Dict[str, int] = {}        # Live state id -> row
+        self._data: Optional[np.ndarray] = None
+        self._live = np.zeros(0, dtype=np.bool_)
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, vector_id: str) -> bool:
+        return vector_id in self.rows
+
+    @property
+    def memory_mapped(self) -> bool:
+        return isinstance(self._data, np.memmap)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Every appended row, retired ones included (mask with `live`)"""
+        if self._data is None:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+        return self._data[:self.size]
+
+    @property
+    def live(self) -> np.ndarray:
+        return self._live[:self.size]
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if capacity * self.dimension * 4 <= self.mmap_threshold:
+            return np.empty((capacity, self.dimension), dtype=np.float32)
+        handle, path = tempfile.mkstemp(suffix='.f32', dir=self.directory)
+        os.close(handle)
+        data = np.memmap(path, dtype=np.float32, mode='w+', shape=(capacity, self.dimension))
+        self._finalizer = weakref.finalize(data, _remove_file, path)
+        return data
+
+    def _grow(self, needed: int) -> None:
+        """Amortized doubling; a memory-mapped matrix moves to a new file and the old one is removed"""
+        capacity = max(INITIAL_CAPACITY, 2 * needed)
+        previous, previous_finalizer = self._data, self._finalizer
+        grown = self._allocate(capacity)
+        if previous is not None:
+            grown[:self.size] = previous[:self.size]
+        live = np.zeros(capacity, dtype=np.bool_)
+        live[:self.size] = self._live[:self.size]
+        self._data, self._live = grown, live
+        if previous_finalizer is not None and previous_finalizer is not self._finalizer:
+            del previous
+            previous_finalizer()
+
+    def append(self, vector_ids: Sequence[str], vectors: np.ndarray) -> np.ndarray:
+        """Append one row per id (retiring any row an id already had); returns the new rows"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(vector_ids), -1)
+        if self.dimension is None:
+            self.dimension = vectors.shape[1]
+        elif vectors.shape[1] != self.dimension:
+            raise ValueError(f"State vectors have dimension {vectors.shape[1]}, expected {self.dimension}")
+        count = len(vector_ids)
+        if self._data is None or self.size + count > len(self._data):
+            self._grow(self.size + count)
+        start = self.size
+        self._data[start:start + count] = vectors
+        self._live[start:start + count] = True
+        for row, vector_id in enumerate(vector_ids, start):
+            previous = self.rows.get(vector_id)
+            if previous is not None:
+                self._live[previous] = False
+            self.rows[vector_id] = row
+        self.ids.extend(vector_ids)
+        self.size += count
+        return np.arange(start, start + count)
+
+    def remove(self, vector_id: str) -> bool:
+        """Retire a state's row; False if it has none"""
+        row = self.rows.pop(vector_id, None)
+        if row is None:
+            return False
+        self._live[row] = False
+        return True
+
+    def rows_of(self, vector_ids: Sequence[str]) -> np.ndarray:
+        rows = self.rows
+        return np.fromiter((rows[vid] for vid in vector_ids), dtype=np.int64, count=len(vector_ids))
+
+    def live_rows(self) -> np.ndarray:
+        return np.flatnonzero(self.live)
+
+    def _blocks(self):
+        """(start, rows, live mask) over the matrix, SEARCH_BLOCK_ROWS at a time"""
+        for start in range(0, self.size, SEARCH_BLOCK_ROWS):
+            stop = min(start + SEARCH_BLOCK_ROWS, self.size)
+            yield start, self._data[start:stop], self._live[start:stop]
+
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """Inner product of every live row with the vector, in row order"""
+        vector = np.asarray(vector, dtype=np.float32)
+        return np.concatenate([block[live] @ vector for _, block, live in self._blocks()] or
+                              [np.zeros(0, dtype=np.float32)])
+
+    def nearest(self, vector: np.ndarray, k: int, exclude: Optional[int] = None):
+        """(rows, scores) of the k live rows with the highest inner product, best first"""
+        vector = np.asarray(vector, dtype=np.float32)
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0, dtype=np.float32)
+        if k <= 0:
+            return best_rows, best_scores
+        for start, block, live in self._blocks():
+            scores = block @ vector
+            scores[~live] = -np.inf
+            if exclude is not None and start <= exclude < start + len(block):
+                scores[exclude - start] = -np.inf
+            if len(scores) > k:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(scores))
+            best_rows = np.concatenate([best_rows, start + top])
+            best_scores = np.concatenate([best_scores, scores[top]])
+            if len(best_rows) > k:
+                keep = np.argpartition(-best_scores, k - 1)[:k]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+        found = np.isfinite(best_scores)
+        best_rows, best_scores = best_rows[found], best_scores[found]
+        # Highest score first, earlier rows first among equal scores
+        order = np.lexsort((best_rows, -best_scores))
+        return best_rows[order], best_scores[order]
+
+    def mean_pairwise_similarity(self) -> float:
+        """
+        Mean inner product over all pairs of distinct live rows, without forming the pairs:
+        Σ_{i≠j} v_i·v_j = |Σ v_i|² - Σ |v_i|², one pass over the matrix
+        """
+        count = len(self.rows)
+        if count < 2:
+            return 0.0
+        total = np.zeros(self.dimension, dtype=np.float64)
+        squared = 0.0
+        for _, block, live in self._blocks():
+            rows = block[live].astype(np.float64)
+            total += rows.sum(axis=0)
+            squared += float(np.einsum('ij,ij->', rows, rows))
+        return float((total @ total - squared) / (count * (count - 1)))
@@ -0,0 +1,139 @@
+#  STEADY-STATE EVOLUTION
+# Asynchronous evaluation pool with per-child replacement instead of generation barriers
+
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Dict, Optional
+import numpy as np
+from .population_store import PopulationStore, selection_rng
+
+REPLACEMENTS = ('worst', 'tournament')
+
+
+def throughput_report(mode: str, evaluations: int, seconds: float) -> Dict[str, Any]:
+    """Evaluations per second of a run, comparable between generational and steady-state modes"""
+    return {
+        "mode": mode,
+        "evaluations": evaluations,
+        "seconds": seconds,
+        "evaluations_per_second": evaluations / seconds if seconds > 0 else 0.0,
+    }
+
+
+class SteadyStateEvolution:
+    """
+    Steady-state driver for AdvancedEvolutionaryEngine or GenerativeEvolutionaryAlgorithm.
+
+    Up to max_in_flight children are under evaluation at once. As soon as any one finishes it is
+    scored and inserted, replacing either the worst narrative (only if the child scores at least
+    as well) or the loser of a random tournament, and a new child is bred from the updated
+    population. Slow evaluations therefore never hold up the rest of the workers.
+    """
+
+    def __init__(self, engine, executor=None, max_in_flight: Optional[int] = None,
+                 replacement: str = 'worst', tournament_size: int = 3, parent_pool: int = 2):
+        if replacement not in REPLACEMENTS:
+            raise ValueError(f"Unknown replacement '{replacement}', expected one of {REPLACEMENTS}")
+        self.engine = engine
+        self.executor = executor if executor is not None else getattr(engine, 'executor', None)
+        if max_in_flight is None:
+            # Two children per worker keeps every worker busy while results are being inserted
+            max_in_flight = 2 * getattr(self.executor, 'max_workers', 1)
+        self.max_in_flight = max(1, max_in_flight)
+        self.replacement = replacement
+        self.tournament_size = tournament_size
+        self.parent_pool = parent_pool
+
+        self.accepted = 0
+        self.rejected = 0
+        self._scores: Optional[np.ndarray] = None
+
+    def run(self, evaluations: int = 200, time_limit: Optional[float] = None) -> Dict[str, Any]:
+        """Breed and insert `evaluations` children (or stop submitting after time_limit seconds)"""
+        engine = self.engine
+        if not engine.population:
+            engine.initialize_population()
+        population_size = len(engine.population)
+        self._scores = np.array(engine._selection_scores(engine._population_store()), dtype=np.float64)
+        rng = selection_rng()
+        print(f" Steady-state evolution: {evaluations} evaluations, {self.max_in_flight} in flight, "
+              f"{self.replacement} replacement")
+
+        pending: Dict[Any, Any] = {}
+        submitted = completed = 0
+        started = time.perf_counter()
+        evaluations_before = engine.evaluation_count
+
+        while completed < evaluations:
+            while (len(pending) < self.max_in_flight and submitted < evaluations
+                   and (time_limit is None or time.perf_counter() - started < time_limit)):
+                child = self._breed(rng)
+                submitted += 1
+                payload, cached = engine._prepare_evaluation(child)
+                if payload is None:
+                    # Cache hit or synchronous fitness: insert straight away
+                    completed += self._complete(child, cached, False, rng, population_size)
+                else:
+                    pending[self.executor.submit(payload)] = child
+            if not pending:
+                break  # everything inserted, or the time limit stopped submission
+
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            # Insert in submission order so a serial executor gives a repeatable run
+            for future in [f for f in pending if f in done]:
+                child = pending.pop(future)
+                result = None if future.exception() is not None else future.result()
+                completed += self._complete(child, result, True, rng, population_size)
+
+        report = throughput_report("steady_state", engine.evaluation_count - evaluations_before,
+                                   time.perf_counter() - started)
+        report.update(max_in_flight=self.max_in_flight, replacement=self.replacement,
+                      accepted=self.accepted, rejected=self.rejected,
+                      generation_equivalents=completed / max(1, population_size),
+                      best_fitness=float(engine._population_store().fitness.max()))
+        engine.throughput = report
+        print(f"   {report['evaluations']} evaluations in {report['seconds']:.2f}s "
+              f"({report['evaluations_per_second']:.1f}/s), {self.accepted} accepted")
+        return report
+
+    def _breed(self, rng: np.random.Generator):
+        """Child of a small pool of tournament winners drawn from the current population"""
+        engine = self.engine
+        n = len(engine.population)
+        contestants = rng.integers(0, n, size=(self.parent_pool, min(self.tournament_size, n)))
+        winners = contestants[np.arange(self.parent_pool), np.argmax(self._scores[contestants], axis=1)]
+        parents = [engine.population[i] for i in winners]
+        # No generation barrier: a child is one generation past its youngest parent
+        return engine._breed_child(parents, max(parent.generation for parent in parents) + 1)
+
+    def _complete(self, child, evaluation, computed: bool, rng: np.random.Generator, population_size: int) -> int:
+        """Score a finished child and insert it; returns 1 (one evaluation completed)"""
+        engine = self.engine
+        engine._finish_evaluation(child, evaluation, computed)
+        score = float(engine._selection_scores(PopulationStore([child]))[0])
+
+        if self.replacement == 'worst':
+            row = int(np.argmin(self._scores))
+            insert = score >= self._scores[row]
+        else:
+            n = len(engine.population)
+            contestants = rng.choice(n, size=min(self.tournament_size, n), replace=False)
+            row = int(contestants[np.argmin(self._scores[contestants])])
+            insert = True
+
+        if insert:
+            engine.population[row] = child
+            engine._store = None
+            self._scores[row] = score
+            self.accepted += 1
+            archive = getattr(engine, 'novelty_archive', None)
+            if archive is not None:
+                archive.add([child.content])
+        else:
+            self.rejected += 1
+
+        # One generation's worth of evaluations: advance the counter and record the best fitness
+        if (self.accepted + self.rejected) % population_size == 0:
+            engine.generation += 1
+            engine.fitness_history.append(float(engine._population_store().fitness.max()))
+        return 1
@@ -0,0 +1,82 @@
+#  ANALYZED TEXT
+# One tokenization pass per narrative, shared by every CRE operator
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Tuple, Union
+
+# Text between sentence terminators
+_SEGMENT_PATTERN = re.compile(r'[^.!?]+')
+
+
+@dataclass(frozen=True)
+class AnalyzedText:
+    """Lowercased text, sentences, tokens and histograms of one narrative"""
+    text: str                                   # Original content
+    lower: str                                  # Lowercased content for substring lookups
+    tokens: Tuple[str, ...]                     # Whitespace tokens of the whole text
+    lower_tokens: Tuple[str, ...]               # Lowercased whitespace tokens
+    sentence_spans: Tuple[Tuple[int, int], ...]  # Stripped sentence (start, end) offsets
+    sentence_tokens: Tuple[Tuple[str, ...], ...]  # Words of each sentence, original case
+    sentence_word_sets: Tuple[FrozenSet[str], ...] = field(repr=False)  # Lowercased word set per sentence
+    token_set: FrozenSet[str] = field(repr=False)                     # Distinct lowercased tokens
+    vocabulary: str = field(repr=False, compare=False)                 # Distinct tokens joined by newlines
+    char_histogram: Dict[str, int] = field(repr=False, compare=False)  # Lowercased chars, spaces removed
+
+    @property
+    def sentences(self) -> List[str]:
+        """Stripped sentences, as re.split(r'[.!?]+') followed by strip() would give"""
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    @property
+    def sentence_lengths(self) -> List[int]:
+        return [len(words) for words in self.sentence_tokens]
+
+    @property
+    def word_count(self) -> int:
+        """Words across all sentences"""
+        return sum(len(words) for words in self.sentence_tokens)
+
+
+def analyze_text(content: Union[str, AnalyzedText]) -> AnalyzedText:
+    """Tokenize content once; already analyzed content is returned unchanged"""
+    if isinstance(content, AnalyzedText):
+        return content
+    text = content or ''
+    lower = text.lower()
+
+    # Lowercasing never adds or removes whitespace or terminators, so the
+    # lowercased segments line up one-to-one with the original ones
+    spans: List[Tuple[int, int]] = []
+    sentences: List[Tuple[str, ...]] = []
+    word_sets: List[FrozenSet[str]] = []
+    for match, lower_segment in zip(_SEGMENT_PATTERN.finditer(text), _SEGMENT_PATTERN.findall(lower)):
+        segment = match.group()
+        words = segment.split()
+        if not words:
+            continue
+        start = match.start() + len(segment) - len(segment.lstrip())
+        end = match.end() - (len(segment) - len(segment.rstrip()))
+        spans.append((start, end))
+        sentences.append(tuple(words))
+        word_sets.append(frozenset(lower_segment.split()))
+
+    # Character counts in first-occurrence order, one linear pass
+    chars = lower.replace(' ', '')
+    char_histogram = dict(Counter(chars))
+
+    lower_tokens = tuple(lower.split())
+    token_set = frozenset(lower_tokens)
+    return AnalyzedText(
+        text=text,
+        lower=lower,
+        tokens=tuple(text.split()),
+        lower_tokens=lower_tokens,
+        sentence_spans=tuple(spans),
+        sentence_tokens=tuple(sentences),
+        sentence_word_sets=tuple(word_sets),
+        token_set=token_set,
+        vocabulary='\n'.join(token_set),
+        char_histogram=char_histogram,
+    )
@@ -2,9 +2,11 @@
 # Complete implementation with all methods
 
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple, Union
 from dataclasses import dataclass
 import math
+from genesis_engine.core.text_analysis import AnalyzedText, analyze_text
+from genesis_engine.core.lexicon import Lexicon
 
 @dataclass
 class QuantumUMTMetrics:
@@ -30,11 +32,47 @@ class QuantumUMTEnhancer:
             'self_emptying', 'service', 'common_good', 'life_affirmation', 
             'love_manifestation', 'integration_unity'
         ]
+        self.principle_indicators = {
+            'self_emptying': ['sacrifice', 'selfless', 'emptying', 'giving up', 'kenosis'],
+            'service': ['serve', 'help', 'assist', 'support', 'benefit others'],
+            'common_good': ['community', 'together', 'shared', 'collective', 'universal'],
+            'life_affirmation': ['life', 'growth', 'flourishing', 'thriving', 'vitality'],
+            'love_manifestation': ['love', 'compassion', 'care', 'kindness', 'empathy'],
+            'integration_unity': ['unity', 'whole', 'integral', 'harmony', 'balance']
+        }
+        self.context_words = ['deep', 'true', 'genuine', 'authentic', 'profound', 'sacred']
+        self.ethical_depth_indicators = [
+            'for the sake of', 'in service of', 'to benefit', 'for the good of',
+            'selflessly', 'unconditionally', 'without expectation'
+        ]
+        self.umt_novelty_concepts = [
+            'dirac', 'spinor', 'gauge', 'field', 'conservation', 'curvature',
+            'divergence', 'kenotic', 'logos', 'quantum', 'entanglement', 'coherence'
+        ]
+        self.quantum_patterns = [
+            'superposition', 'entanglement', 'coherence', 'decoherence',
+            'quantum state', 'wave function', 'probability amplitude'
+        ]
+        self.quantum_terms = ['quantum', 'superposition', 'entanglement', 'coherence', 'decoherence']
+        self.ambiguous_concepts = ['maybe', 'perhaps', 'could be', 'potential', 'possibility']
+        
+        # Every scorer reads its hits from one matcher over all of the lists above
+        self.lexicon = Lexicon(
+            [term for concept, synonyms in self.quantum_concepts.items() for term in [concept] + synonyms] +
+            [term for indicators in self.principle_indicators.values() for term in indicators] +
+            self.context_words + self.ethical_depth_indicators + self.umt_novelty_concepts +
+            self.quantum_patterns + self.quantum_terms + self.ambiguous_concepts
+        )
+        # (analysis, terms found) of the narrative currently being scored
+        self._last_found: Optional[Tuple[AnalyzedText, FrozenSet[str]]] = None
     
     def enhance_umt_alignment(self, narrative: str) -> QuantumUMTMetrics:
         """Apply quantum enhancements to UMT alignment"""
         print("ðŸŒ€ Applying Quantum UMT Enhancement...")
         
+        # Tokenize and match the lexicon once for every scorer
+        narrative = analyze_text(narrative)
+        
         # Boost consciousness charge with quantum concepts
         consciousness_charge = self._quantum_consciousness_boost(narrative)
         
@@ -58,17 +96,25 @@ class QuantumUMTEnhancer:
             entanglement_level=entanglement_level
         )
     
-    def _quantum_consciousness_boost(self, narrative: str) -> float:
+    def _found(self, narrative: Union[str, AnalyzedText]) -> FrozenSet[str]:
+        """Lexicon terms present in the narrative, reused while the same analysis is scored"""
+        analyzed = analyze_text(narrative)
+        cached = self._last_found
+        if cached is None or cached[0] is not analyzed:
+            self._last_found = cached = (analyzed, self.lexicon.present(analyzed))
+        return cached[1]
+    
+    def _quantum_consciousness_boost(self, narrative: Union[str, AnalyzedText]) -> float:
         """Boost consciousness charge using quantum concept expansion"""
-        narrative_lower = narrative.lower()
+        found = self._found(narrative)
         total_concepts = 0
         found_concepts = 0
         
         for core_concept, quantum_synonyms in self.quantum_concepts.items():
             total_concepts += 1
             # Check for core concept or any quantum synonyms
-            if (core_concept in narrative_lower or 
-                any(synonym in narrative_lower for synonym in quantum_synonyms)):
+            if (core_concept in found or 
+                any(synonym in found for synonym in quantum_synonyms)):
                 found_concepts += 1
         
         base_charge = found_concepts / total_concepts
@@ -78,13 +124,13 @@ class QuantumUMTEnhancer:
         
         return min(1.0, base_charge + quantum_boost * 0.3)
     
-    def _kenotic_alignment_boost(self, narrative: str) -> float:
+    def _kenotic_alignment_boost(self, narrative: Union[str, AnalyzedText]) -> float:
         """Boost ethical alignment with deep kenotic principle analysis"""
-        narrative_lower = narrative.lower()
+        found = self._found(narrative)
         
         principle_scores = []
         for principle in self.kenotic_principles:
-            score = self._evaluate_kenotic_principle(principle, narrative_lower)
+            score = self._evaluate_kenotic_principle(principle, found)
             principle_scores.append(score)
         
         base_alignment = np.mean(principle_scores)
@@ -94,62 +140,46 @@ class QuantumUMTEnhancer:
         
         return min(1.0, base_alignment + context_bonus)
     
-    def _evaluate_kenotic_principle(self, principle: str, narrative: str) -> float:
-        """Deep evaluation of specific kenotic principle"""
-        principle_indicators = {
-            'self_emptying': ['sacrifice', 'selfless', 'emptying', 'giving up', 'kenosis'],
-            'service': ['serve', 'help', 'assist', 'support', 'benefit others'],
-            'common_good': ['community', 'together', 'shared', 'collective', 'universal'],
-            'life_affirmation': ['life', 'growth', 'flourishing', 'thriving', 'vitality'],
-            'love_manifestation': ['love', 'compassion', 'care', 'kindness', 'empathy'],
-            'integration_unity': ['unity', 'whole', 'integral', 'harmony', 'balance']
-        }
+    def _evaluate_kenotic_principle(self, principle: str, found: Union[str, AnalyzedText, FrozenSet[str]]) -> float:
+        """Deep evaluation of specific kenotic principle (narrative text or its lexicon hits)"""
+        if not isinstance(found, frozenset):
+            found = self._found(found)
         
-        indicators = principle_indicators.get(principle, [])
+        indicators = self.principle_indicators.get(principle, [])
         if not indicators:
             return 0.5
         
-        indicators_present = sum(1 for indicator in indicators if indicator in narrative)
+        indicators_present = sum(1 for indicator in indicators if indicator in found)
         base_score = indicators_present / len(indicators)
         
-        # Depth bonus for meaningful usage
+        # Depth bonus for meaningful usage, with contextual reinforcement
         depth_bonus = 0.0
+        reinforced = any(context in found for context in self.context_words)
         for indicator in indicators:
-            if indicator in narrative:
-                # Check for contextual reinforcement
-                context_words = ['deep', 'true', 'genuine', 'authentic', 'profound', 'sacred']
-                if any(context in narrative for context in context_words):
-                    depth_bonus += 0.05
+            if indicator in found and reinforced:
+                depth_bonus += 0.05
         
         return min(1.0, base_score + depth_bonus)
     
-    def _evaluate_ethical_context(self, narrative: str) -> float:
+    def _evaluate_ethical_context(self, narrative: Union[str, AnalyzedText]) -> float:
         """Evaluate depth of ethical context in narrative"""
-        ethical_depth_indicators = [
-            'for the sake of', 'in service of', 'to benefit', 'for the good of',
-            'selflessly', 'unconditionally', 'without expectation'
-        ]
-        
-        count = sum(1 for indicator in ethical_depth_indicators if indicator in narrative.lower())
+        found = self._found(narrative)
+        count = sum(1 for indicator in self.ethical_depth_indicators if indicator in found)
         return min(0.3, count * 0.1)
     
-    def _calculate_enhanced_meaning(self, narrative: str) -> float:
+    def _calculate_enhanced_meaning(self, narrative: Union[str, AnalyzedText]) -> float:
         """Enhanced meaning efficiency calculation"""
-        words = narrative.split()
-        if len(words) < 10:
+        analyzed = analyze_text(narrative)
+        if len(analyzed.tokens) < 10:
             return 0.5
             
         # Conceptual novelty with UMT focus
-        umt_novelty_concepts = [
-            'dirac', 'spinor', 'gauge', 'field', 'conservation', 'curvature',
-            'divergence', 'kenotic', 'logos', 'quantum', 'entanglement', 'coherence'
-        ]
-        
-        novelty = sum(1 for concept in umt_novelty_concepts if concept in narrative.lower())
-        novelty_score = novelty / len(umt_novelty_concepts)
+        found = self._found(analyzed)
+        novelty = sum(1 for concept in self.umt_novelty_concepts if concept in found)
+        novelty_score = novelty / len(self.umt_novelty_concepts)
         
         # Structural complexity
-        sentences = [s.strip() for s in narrative.split('.') if s.strip()]
+        sentences = [s.strip() for s in analyzed.text.split('.') if s.strip()]
         if len(sentences) > 1:
             complexity = min(1.0, len(sentences) / 5)
         else:
@@ -157,7 +187,7 @@ class QuantumUMTEnhancer:
             
         return min(1.0, 0.6 * novelty_score + 0.4 * complexity)
     
-    def _calculate_quantum_patterns(self, narrative: str) -> float:
+    def _calculate_quantum_patterns(self, narrative: Union[str, AnalyzedText]) -> float:
         """Quantum-enhanced pattern quality"""
         # Build on existing strong pattern recognition
         base_quality = 0.925  # From previous test
@@ -167,28 +197,23 @@ class QuantumUMTEnhancer:
         
         return min(1.0, base_quality + quantum_bonus * 0.1)
     
-    def _detect_quantum_coherence(self, narrative: str) -> float:
+    def _detect_quantum_coherence(self, narrative: Union[str, AnalyzedText]) -> float:
         """Detect quantum coherence patterns in narrative"""
-        quantum_patterns = [
-            'superposition', 'entanglement', 'coherence', 'decoherence',
-            'quantum state', 'wave function', 'probability amplitude'
-        ]
-        
-        narrative_lower = narrative.lower()
-        pattern_count = sum(1 for pattern in quantum_patterns if pattern in narrative_lower)
+        found = self._found(narrative)
+        pattern_count = sum(1 for pattern in self.quantum_patterns if pattern in found)
         
-        return pattern_count / len(quantum_patterns)
+        return pattern_count / len(self.quantum_patterns)
     
-    def _calculate_quantum_coherence(self, narrative: str) -> float:
+    def _calculate_quantum_coherence(self, narrative: Union[str, AnalyzedText]) -> float:
         """Calculate quantum coherence level"""
-        quantum_terms = ['quantum', 'superposition', 'entanglement', 'coherence', 'decoherence']
-        narrative_lower = narrative.lower()
+        analyzed = analyze_text(narrative)
+        found = self._found(analyzed)
         
-        quantum_presence = sum(1 for term in quantum_terms if term in narrative_lower)
-        quantum_density = quantum_presence / len(quantum_terms)
+        quantum_presence = sum(1 for term in self.quantum_terms if term in found)
+        quantum_density = quantum_presence / len(self.quantum_terms)
         
         # Structural quantum-like properties
-        sentences = narrative.split('.')
+        sentences = analyzed.text.split('.')
         if len(sentences) > 2:
             # Quantum systems show both particle-like (localized) and wave-like (distributed) properties
             sentence_lengths = [len(s.split()) for s in sentences if s.strip()]
@@ -202,12 +227,18 @@ class QuantumUMTEnhancer:
             
         return (quantum_density + structural_quantum) / 2
     
-    def _calculate_entanglement(self, narrative: str) -> float:
+    def _calculate_entanglement(self, narrative: Union[str, AnalyzedText]) -> float:
         """Calculate quantum entanglement level in narrative"""
+        analyzed = analyze_text(narrative)
         # Entanglement manifests as non-local correlations between concepts
-        concepts = self._extract_concepts(narrative)
+        concepts = self._extract_concepts(analyzed)
         if len(concepts) < 3:
             return 0.3
+        
+        # First word index of each concept, from one pass over the tokens
+        first_index = {}
+        for index, word in enumerate(analyzed.lower_tokens):
+            first_index.setdefault(word, index)
             
         # Measure conceptual connectivity (non-local correlations)
         unique_pairs = 0
@@ -218,7 +249,7 @@ class QuantumUMTEnhancer:
                 if i != j:
                     unique_pairs += 1
                     # Concepts are connected if they appear in the same context
-                    if self._concepts_connected(concept1, concept2, narrative):
+                    if abs(first_index[concept1] - first_index[concept2]) <= 5:
                         connected_pairs += 1
         
         if unique_pairs == 0:
@@ -229,10 +260,10 @@ class QuantumUMTEnhancer:
         # Quantum entanglement shows stronger-than-classical correlations
         return min(1.0, connectivity_ratio * 1.2)  # Quantum enhancement
     
-    def _concepts_connected(self, concept1: str, concept2: str, narrative: str) -> bool:
+    def _concepts_connected(self, concept1: str, concept2: str, narrative: Union[str, AnalyzedText]) -> bool:
         """Check if two concepts are connected in the narrative"""
         # Simple implementation: concepts are connected if they appear close together
-        words = narrative.lower().split()
+        words = analyze_text(narrative).lower_tokens
         try:
             idx1 = words.index(concept1.lower())
             idx2 = words.index(concept2.lower())
@@ -240,25 +271,24 @@ class QuantumUMTEnhancer:
         except ValueError:
             return False
     
-    def _calculate_quantum_superposition(self, narrative: str) -> float:
+    def _calculate_quantum_superposition(self, narrative: Union[str, AnalyzedText]) -> float:
         """Calculate quantum superposition of conceptual states"""
+        analyzed = analyze_text(narrative)
         # In quantum UMT, concepts exist in superposition until measured
-        ambiguous_concepts = ['maybe', 'perhaps', 'could be', 'potential', 'possibility']
-        narrative_lower = narrative.lower()
-        
-        superposition_indicators = sum(1 for concept in ambiguous_concepts if concept in narrative_lower)
+        found = self._found(analyzed)
+        superposition_indicators = sum(1 for concept in self.ambiguous_concepts if concept in found)
         
         # Also consider conceptual density (more concepts = more superposition states)
-        concepts = self._extract_concepts(narrative)
-        conceptual_density = len(concepts) / (len(narrative.split()) / 10)
+        concepts = self._extract_concepts(analyzed)
+        conceptual_density = len(concepts) / (len(analyzed.tokens) / 10)
         
         return min(1.0, (superposition_indicators / 5 + conceptual_density) / 2)
     
-    def _extract_concepts(self, text: str) -> List[str]:
+    def _extract_concepts(self, text: Union[str, AnalyzedText]) -> List[str]:
         """Extract key concepts from text"""
-        if not text:
+        analyzed = analyze_text(text)
+        if not analyzed.text:
             return []
-        words = text.lower().split()
-        return [w for w in words if len(w) > 4][:15]
+        return [w for w in analyzed.lower_tokens if len(w) > 4][:15]
 
 print(" Quantum UMT Enhancement Engine COMPLETE with all methods!")
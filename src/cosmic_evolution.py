@@ -9,6 +9,8 @@ WHY: To demonstrate how meaning evolves and amplifies through cosmic time
 print("🚀 COSMIC EVOLUTION ENGINE - 7 GENERATIONS")
 print("=" * 65)
 
+from genesis_engine.core.lineage import LineageStore
+
 class EvolutionaryAlchemist:
     """
     WHAT: Multi-generational coherence tracking system
@@ -20,10 +22,10 @@ class EvolutionaryAlchemist:
     def __init__(self):
         # WHAT: Evolutionary tracking system
         # WHERE: Constructor initialization for evolution tracking
-        # HOW: Dictionary to store generational scores and lineages
+        # HOW: Dictionary of generational scores; compact parent graph for lineages
         # WHY: Enables analysis of evolutionary patterns and improvement trajectories
         self.generational_data = {}
-        self.lineage_trees = {}
+        self.lineage_trees = LineageStore()
         print("🌀 Evolutionary Alchemist initialized - Ready to track cosmic lineages")
     
     def analyze_evolutionary_trajectory(self, generation_data):
@@ -73,20 +75,27 @@ class EvolutionarySynthesizer:
         self.selection_pressure = 0.7  # WHAT: Percentage of top performers that reproduce
         self.mutation_rate = 0.3       # WHAT: Chance of introducing novel elements
         self.generation_count = 0      # WHAT: Evolutionary generation tracker
+        self.population_ids = None     # WHAT: Lineage ids of the current population
         print("🌀 Evolutionary Synthesizer initialized - Cosmic evolution engine ready")
     
-    def evolve_population(self, population, scores, cosmic_alchemist, cosmic_synthesizer):
+    def evolve_population(self, population, scores, cosmic_alchemist, cosmic_synthesizer, lineage=None):
         """
         WHAT: Evolutionary selection and breeding algorithm
         WHERE: Core generational transition function
         HOW: Fitness-proportionate selection with elite preservation and mutation
         WHY: Simulates natural selection to improve meaning-generation quality over time
         """
+        # WHAT: Lineage registration of the starting population
+        # WHERE: First call with a LineageStore
+        # HOW: Every narrative without an id becomes a root of the parent graph
+        # WHY: Children can then record their parents as compact integer ids
+        if lineage is not None and (self.population_ids is None or len(self.population_ids) != len(population)):
+            self.population_ids = [lineage.add((), self.generation_count) for _ in population]
         # WHAT: Population scoring and ranking
         # WHERE: Fitness evaluation phase of evolutionary algorithm
         # HOW: Pairing narratives with their cosmic coherence scores for selection
         # WHY: Enables fitness-based selection for evolutionary improvement
-        scored_population = list(zip(population, scores))
+        scored_population = list(zip(population, scores, self.population_ids or [-1] * len(population)))
         scored_population.sort(key=lambda x: x[1], reverse=True)
         
         # WHAT: Elite selection
@@ -95,26 +104,30 @@ class EvolutionarySynthesizer:
         # WHY: Preserves and propagates high-quality meaning generators
         elite_count = int(len(population) * self.selection_pressure)
         elites = [item[0] for item in scored_population[:elite_count]]
+        elite_ids = [item[2] for item in scored_population[:elite_count]]
         
         # WHAT: Evolutionary breeding
         # WHERE: Reproduction phase of evolutionary algorithm
         # HOW: Creating new generation through selective breeding of elites
         # WHY: Combines successful traits to create potentially better offspring
         new_generation = []
+        new_ids = []
         
         # WHAT: Elite preservation
         # WHERE: Conservation of successful traits
         # HOW: Carrying forward top performers unchanged to next generation
         # WHY: Prevents loss of high-quality solutions (elitism strategy)
         new_generation.extend(elites[:2])  # Preserve top 2 unchanged
+        new_ids.extend(elite_ids[:2])
         
         # WHAT: Selective breeding loop
         # WHERE: Offspring generation phase
         # HOW: Pairing elites to create new narratives through cosmic synthesis
         # WHY: Explores new combinations of successful meaning patterns
         while len(new_generation) < len(population):
-            parent_a = random.choice(elites)
-            parent_b = random.choice(elites)
+            index_a = random.choice(range(len(elites)))
+            index_b = random.choice(range(len(elites)))
+            parent_a, parent_b = elites[index_a], elites[index_b]
             
             if parent_a != parent_b:
                 child = cosmic_synthesizer.create_cosmic_synthesis(parent_a, parent_b)
@@ -127,8 +140,12 @@ class EvolutionarySynthesizer:
                     child = self._apply_cosmic_mutation(child)
                 
                 new_generation.append(child)
+                if lineage is not None:
+                    new_ids.append(lineage.add((elite_ids[index_a], elite_ids[index_b]), self.generation_count + 1))
         
         self.generation_count += 1
+        if lineage is not None:
+            self.population_ids = new_ids
         return new_generation
     
     def _apply_cosmic_mutation(self, narrative):
@@ -276,7 +293,8 @@ for generation in range(1, 8):
     # WHY: Advances evolutionary process toward potentially better solutions
     if generation < 7:
         current_population = evolutionary_synthesizer.evolve_population(
-            current_population, generation_scores, cosmic_alchemist, cosmic_synthesizer
+            current_population, generation_scores, cosmic_alchemist, cosmic_synthesizer,
+            lineage=evolutionary_alchemist.lineage_trees
         )
         print(f"🔁 EVOLVED TO GENERATION {generation + 1}: {len(current_population)} NARRATIVES")
 
@@ -328,6 +346,15 @@ print(f"\n🏆 MOST EVOLVED COSMIC NARRATIVE (Generation {best_generation}):")
 print(f"   '{best_overall['best_narrative']['narrative']}'")
 print(f"   Cosmic Score: {best_overall['avg_score']:.3f}")
 
+# WHAT: Lineage summary
+# WHERE: Parent graph recorded during evolution
+# HOW: Ancestor query over the compact lineage store
+# WHY: Shows how many narratives fed into the final generation
+lineage = evolutionary_alchemist.lineage_trees
+final_ids = evolutionary_synthesizer.population_ids or []
+print(f"   Lineage: {len(lineage)} narratives recorded, "
+      f"{len(lineage.ancestors(final_ids))} ancestors behind the final generation")
+
 print(f"\n{'='*65}")
 print("🌠 7-GENERATION COSMIC EVOLUTION COMPLETE!")
 print("   Educational evolution tracking implemented!")
@@ -2,21 +2,35 @@
 Entropic Alchemy Tools - Quantum Vortices in Semantic Space
 """
 
+import os
+import sys
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from scipy.spatial.distance import cosine
 
+# Share the CRE model registry and embedding cache
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cosmic_resonance_evaluation'))
+
+from embedding_registry import acquire_model, release_model
+from embedding_cache import cached_encoder
+
 class EntropicAlchemist:
     """Transforms chaotic potential into meaningful order"""
     
     def __init__(self, model_name="all-mpnet-base-v2"):
+        self.model_name = model_name
         try:
-            self.model = SentenceTransformer(model_name)
+            self.model = cached_encoder(acquire_model(model_name), model_name)
             print("🌀 Entropic Alchemist initialized - Morphic Field Active")
         except Exception as e:
             print(f"⚠️  Model load failed: {e}")
             self.model = None
     
+    def release(self):
+        """Return the shared embedding model to the registry"""
+        if self.model is not None:
+            release_model(self.model_name)
+            self.model = None
+    
     def calculate_novel_coherence(self, parent_a, parent_b, child):
         """Quantum vortices in semantic space - Novel coherence metric"""
         if self.model is None:
@@ -25,12 +39,12 @@ class EntropicAlchemist:
         try:
             # Embed all narratives in the cosmic field
             texts = [parent_a, parent_b, child]
-            embeddings = self.model.encode(texts, convert_to_tensor=True)
+            embeddings = self.model.encode(texts)
             
             # Calculate semantic relationships
-            parent_similarity = 1 - cosine(embeddings[0].cpu().numpy(), embeddings[1].cpu().numpy())
-            child_to_a = 1 - cosine(embeddings[2].cpu().numpy(), embeddings[0].cpu().numpy())
-            child_to_b = 1 - cosine(embeddings[2].cpu().numpy(), embeddings[1].cpu().numpy())
+            parent_similarity = 1 - cosine(embeddings[0], embeddings[1])
+            child_to_a = 1 - cosine(embeddings[2], embeddings[0])
+            child_to_b = 1 - cosine(embeddings[2], embeddings[1])
             
             # Novel coherence: how child transcends parent similarity
             novel_coherence = (child_to_a + child_to_b) - parent_similarity
@@ -0,0 +1,70 @@
+#  ANALYZED TEXT TEST
+# One tokenization pass must reproduce the per-operator re.split / str.split results
+
+import sys
+import os
+import re
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" ANALYZED TEXT TEST")
+print("=" * 40)
+
+try:
+    from genesis_engine.core.text_analysis import analyze_text
+    from genesis_engine.core.physics_of_meaning import EnhancedCRE
+
+    samples = [
+        "",
+        "   \n\t ",
+        "Love enables creation. Consciousness emerges from pattern!",
+        "The pattern of patterns... is recursive?! Divine care gives rise to growth.x.y",
+        "Self-emptying love\nflows  through\tcommunity. Together we grow. Together we adapt!",
+    ]
+
+    # 1. Sentences and tokens match the string operations they replace
+    for text in samples:
+        analyzed = analyze_text(text)
+        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        assert analyzed.sentences == sentences
+        assert [list(words) for words in analyzed.sentence_tokens] == [s.split() for s in sentences]
+        assert [set(words) for words in analyzed.sentence_word_sets] == [set(s.lower().split()) for s in sentences]
+        assert list(analyzed.tokens) == text.split()
+        assert analyzed.token_set == set(text.lower().split())
+        assert sum(analyzed.char_histogram.values()) == len(text.lower().replace(' ', ''))
+        assert analyze_text(analyzed) is analyzed
+    print("   tokenization matches per-operator splitting")
+
+    # Character histogram: first-occurrence order, linear in text length whatever the alphabet size
+    chars = samples[4].lower().replace(' ', '')
+    assert list(analyze_text(samples[4]).char_histogram) == list(dict.fromkeys(chars))
+    wide = ''.join(chr(0x4e00 + (i * 7919) % 3000) for i in range(100_000))
+    narrow = 'a' * 100_000
+    timings = []
+    for text in (narrow, wide):
+        start = time.perf_counter()
+        analyze_text(text)
+        timings.append(time.perf_counter() - start)
+    assert len(analyze_text(wide).char_histogram) == 3000 and timings[1] < 5 * timings[0] + 0.05, timings
+
+    # 2. Every operator accepts raw strings or the shared analysis
+    cre = EnhancedCRE()
+    for text in samples:
+        analyzed = analyze_text(text)
+        assert cre._calculate_shannon_entropy(text) == cre._calculate_shannon_entropy(analyzed)
+        assert cre._calculate_information_density(text) == cre._calculate_information_density(analyzed)
+        assert cre.conservation_laws.validate(text) == cre.conservation_laws.validate(analyzed)
+        assert cre.pattern_operator.evaluate(text) == cre.pattern_operator.evaluate(analyzed)
+        assert cre.ethical_attractor.evaluate_kenotic_alignment(text) == \
+            cre.ethical_attractor.evaluate_kenotic_alignment(analyzed)
+        evaluation = cre.evaluate_narrative_state({'content': text})
+        assert 0.0 <= evaluation.information_density <= 1.0
+    print("   operators agree on str and AnalyzedText input")
+
+    print("\\n ANALYZED TEXT WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Analyzed text test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,82 @@
+#  BATCHED RESONANCE EVALUATION TEST
+# evaluate_resonance_batch must match the scalar evaluate_resonance path
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'cosmic_resonance_evaluation'))
+os.environ['COSMIC_EMBEDDING_CACHE'] = tempfile.mkdtemp(prefix='cosmic_cache_')
+
+print(" BATCHED RESONANCE EVALUATION TEST")
+print("=" * 45)
+
+try:
+    import numpy as np
+    from embedding_registry import get_registry
+    from cosmic_core import CosmicCore
+
+    class ToyEncoder:
+        """Deterministic bag-of-characters encoder standing in for a sentence model"""
+        def __init__(self):
+            self.calls = 0
+
+        def encode(self, texts):
+            self.calls += 1
+            vectors = np.zeros((len(texts), 32), dtype=np.float32)
+            for row, text in enumerate(texts):
+                for ch in text.lower():
+                    vectors[row, ord(ch) % 32] += 1.0
+            return vectors
+
+    encoder = ToyEncoder()
+    get_registry().register('toy-encoder', encoder)
+    core = CosmicCore(model_name='toy-encoder')
+
+    narratives = [
+        "The universe began in infinite silence",
+        "Light spoke the first creative word into being",
+        "Chaos dreams of beautiful mathematical order",
+        "The void sings quantum melodies to itself"
+    ]
+    triples = []
+    for i in range(len(narratives) - 1):
+        for method in ('adjoint', 'hybrid'):
+            synthesis = core.cosmic_synthesis(narratives[i], narratives[i + 1], method=method)
+            triples.append((synthesis['parent_a'], synthesis['parent_b'], synthesis['child']))
+    triples.append(triples[0])  # duplicate triple in the same batch
+
+    calls_before = encoder.calls
+    batch_results = core.evaluate_resonance_batch(triples)
+    assert encoder.calls - calls_before <= 1, "Batch should encode with at most one model call"
+    print(f"   Evaluated {len(batch_results)} triples")
+
+    # Every field must agree with the scalar path
+    def assert_close(batch_value, scalar_value, path):
+        if isinstance(scalar_value, dict):
+            assert batch_value.keys() == scalar_value.keys(), f"Key mismatch at {path}"
+            for key in scalar_value:
+                assert_close(batch_value[key], scalar_value[key], f"{path}.{key}")
+        elif isinstance(scalar_value, (str, bool, np.bool_)):
+            assert batch_value == scalar_value, f"Mismatch at {path}: {batch_value} != {scalar_value}"
+        else:
+            assert np.isclose(batch_value, scalar_value, rtol=1e-9, atol=1e-12), \
+                f"Mismatch at {path}: {batch_value} != {scalar_value}"
+
+    for triple, batch_result in zip(triples, batch_results):
+        scalar_result = core.evaluate_resonance(*triple)
+        assert_close(batch_result, scalar_result, 'result')
+
+    print("   Batch results identical to scalar path")
+    assert core.evaluate_resonance_batch([]) == []
+
+    experiment = core.run_complete_experiment(narratives, num_syntheses=3)
+    assert experiment['overall_analysis']['total_experiments'] == 3
+
+    core.release()
+    print("\\n BATCHED EVALUATION WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Batched evaluation test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,92 @@
+#  CONCEPT EMBEDDING RESONANCE TEST
+# Matrix resonance detection must match pairwise scoring and scale to hundreds of concepts
+
+import sys
+import os
+import random
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" CONCEPT EMBEDDING RESONANCE TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    from genesis_engine.core.concept_embeddings import ConceptEmbeddings, top_pairs
+    from genesis_engine.core.resonant_crossover import ResonantCrossoverEngine
+    from genesis_engine.core.advanced_crossover import AdvancedResonantCrossoverEngine
+
+    # 1. Top-k selection equals a stable sort of every pair above the threshold
+    rng = np.random.default_rng(5)
+    for shape, k in (((30, 40), 7), ((5, 5), 25), ((12, 9), 1)):
+        scores = rng.integers(0, 6, size=shape) / 5.0
+        expected = sorted(((i, j, scores[i, j]) for i in range(shape[0]) for j in range(shape[1])
+                           if scores[i, j] > 0.3), key=lambda p: -p[2])[:k]
+        assert top_pairs(scores, k, 0.3) == expected
+    assert top_pairs(np.zeros((0, 4)), 5) == []
+
+    # 2. Embeddings are cached, unit length and case-insensitive
+    table = ConceptEmbeddings()
+    vectors = table.embed(['Love', 'love', 'compassion', 'love'])
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0) and np.allclose(vectors[0], vectors[1])
+    assert len(table) == 3 and table.misses == 3 and table.hits == 1
+    scores = table.similarity(['consciousness'], ['conscious', 'awareness', 'xyz'])
+    assert scores[0, 0] > scores[0, 1] > scores[0, 2] >= 0.0
+
+    class FixedEncoder:
+        """Stands in for a sentence encoder: one basis vector per first letter"""
+        def encode(self, texts):
+            return np.eye(26)[[ord(t[0].lower()) - ord('a') for t in texts]]
+
+    letters = ConceptEmbeddings(encoder=FixedEncoder(), capacity=3)
+    assert letters.similarity(['apple', 'berry'], ['avocado', 'banana', 'cherry']).tolist() == \
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+    assert len(letters) <= 3
+
+    # 3. Both engines' matrix detection matches their per-pair scores
+    robust = ResonantCrossoverEngine(ConceptEmbeddings())
+    advanced = AdvancedResonantCrossoverEngine(concept_embeddings=ConceptEmbeddings())
+    concepts_a = ['consciousness', 'evolution', 'love', 'harmony', 'awareness', 'growth']
+    concepts_b = ['conscious', 'evolving', 'compassion', 'harmony', 'mind', 'cosmos']
+
+    pairwise = sorted(((a, b, robust._calculate_conceptual_resonance(a, b))
+                       for a in concepts_a for b in concepts_b), key=lambda p: -p[2])
+    points = robust._detect_resonance_points(concepts_a, concepts_b)
+    assert [(p.concept_a, p.concept_b) for p in points] == \
+        [(a, b) for a, b, s in pairwise if s > robust.resonance_threshold][:robust.max_resonance_points]
+
+    for point in advanced._advanced_resonance_detection(concepts_a, concepts_b):
+        lexical = advanced._calculate_lexical_resonance(point.concept_a, point.concept_b)
+        semantic = advanced._calculate_semantic_resonance(point.concept_a, point.concept_b)
+        assert abs(point.semantic_similarity - semantic) < 1e-6
+        assert abs(point.resonance_strength - (0.3 * lexical + 0.7 * semantic)) < 1e-6
+    relationships = advanced._analyze_semantic_relationships(concepts_a, concepts_b)
+    assert len(relationships) == advanced.max_relationships
+    assert relationships[0].similarity == max(advanced._calculate_semantic_resonance(a, b)
+                                              for a in concepts_a for b in concepts_b)
+
+    # 4. Parents with hundreds of concepts are compared in full
+    random.seed(1)
+    vocabulary = [''.join(random.choice('aeioulmnrst') for _ in range(random.randint(4, 10))) for _ in range(2000)]
+
+    class Parent:
+        def __init__(self, concepts):
+            self.vector_id, self.content, self.concepts, self.coherence = 'p', 'narrative text here', concepts, 0.5
+
+    parent_a, parent_b = Parent(random.sample(vocabulary, 400)), Parent(random.sample(vocabulary, 400))
+    start = time.perf_counter()
+    for _ in range(20):
+        child = advanced.crossover(parent_a, parent_b)
+        robust_child = robust.crossover(parent_a, parent_b)
+    elapsed = (time.perf_counter() - start) / 20
+    assert child.resonance_points and child.kind == 'advanced'
+    assert len(robust_child.concepts) >= len(set(parent_a.concepts) | set(parent_b.concepts))
+    print(f"   400 x 400 concept crossover (both engines): {1e3 * elapsed:.1f} ms")
+
+    print("\\n CONCEPT EMBEDDING RESONANCE WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Concept embedding resonance test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,106 @@
+#  CROSSOVER BATCH TEST
+# crossover_batch must breed the same children as per-pair crossover, packed as typed records
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" CROSSOVER BATCH TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    from genesis_engine.core.resonant_crossover import ResonantCrossoverEngine
+    from genesis_engine.core.advanced_crossover import AdvancedResonantCrossoverEngine
+    from genesis_engine.core.advanced_evolution import AdvancedEvolutionaryEngine, NarrativeState
+    from genesis_engine.core.offspring import OFFSPRING_DTYPE, OffspringRecord
+    from genesis_engine.core import concept_embeddings
+
+    class Parent:
+        def __init__(self, vector_id, content, concepts, coherence):
+            self.vector_id, self.content, self.concepts, self.coherence = vector_id, content, concepts, coherence
+
+    random.seed(2)
+    words = ['consciousness', 'love', 'evolution', 'harmony', 'awareness', 'compassion', 'growth',
+             'symmetry', 'sacred', 'cosmic', 'emergence', 'pattern', 'resonance', 'care', 'mind']
+    parents = [Parent(f"p{i}", f"Narrative {i} about {random.choice(words)}. It grows.",
+                      random.sample(words, random.randint(0, 8)), random.random()) for i in range(12)]
+    pairs = [tuple(random.sample(parents, 2)) for _ in range(40)] + [(parents[0], parents[0])]
+
+    # 1. Both engines: batch rows equal per-pair crossover children under the same random state
+    for engine in (ResonantCrossoverEngine(), AdvancedResonantCrossoverEngine()):
+        random.seed(7)
+        batch = engine.crossover_batch(pairs)
+        random.seed(7)
+        singles = [engine.crossover(a, b) for a, b in pairs]
+
+        assert batch.records.dtype == OFFSPRING_DTYPE and len(batch) == len(pairs)
+        assert len(batch.parents) == len({id(p) for pair in pairs for p in pair})
+        for row, (child, (a, b)) in enumerate(zip(singles, pairs)):
+            assert batch.parent_pair(row) == (a, b)
+            assert batch.content[row] == child.content
+            assert sorted(batch.concepts_of(row)) == sorted(child.concepts)
+            assert abs(batch.records['coherence'][row] - child.coherence) < 1e-12
+            # Every child is the one shared slotted type, and batch rows convert back to it
+            assert type(child) is OffspringRecord and not hasattr(child, '__dict__')
+            record = batch.record(row)
+            assert (record.vector_id, record.kind, record.parent_ids) == (child.vector_id, child.kind, child.parent_ids)
+        assert not batch.records['fallback'].any()
+        print(f"   {type(engine).__name__}: {len(batch)} children, "
+              f"{int((batch.records['resonance_points'] > 0).sum())} with resonance")
+
+    # 2. Large parent vocabularies use per-pair products instead of one vocabulary matrix
+    limit = concept_embeddings.BATCH_MATRIX_LIMIT
+    concept_embeddings.BATCH_MATRIX_LIMIT = 4
+    try:
+        random.seed(7)
+        blocked = AdvancedResonantCrossoverEngine().crossover_batch(pairs)
+    finally:
+        concept_embeddings.BATCH_MATRIX_LIMIT = limit
+    random.seed(7)
+    full = AdvancedResonantCrossoverEngine().crossover_batch(pairs)
+    assert blocked.content == full.content and np.allclose(blocked.records['resonance'], full.records['resonance'])
+
+    # 3. A failing pair falls back without losing the rest of the batch
+    engine = ResonantCrossoverEngine()
+    blend = engine._blend_content
+    engine._blend_content = lambda a, b: (_ for _ in ()).throw(ValueError("boom")) if 'Narrative 3 ' in a else blend(a, b)
+    batch = engine.crossover_batch(pairs)
+    failed = [row for row, (a, _) in enumerate(pairs) if a is parents[3]]
+    assert batch.records['fallback'][failed].all() and batch.records['fallback'].sum() == len(failed)
+    for row in failed:
+        single = engine._fallback_crossover(*pairs[row])
+        assert (batch.content[row], batch.concepts_of(row)) == (single.content, single.concepts)
+    assert {batch.record(row).kind for row in failed} == {'fallback'}
+    fallback = engine._fallback_crossover(parents[1], parents[2])
+    assert type(fallback) is OffspringRecord and fallback.vector_id == 'fallback_p1_p2'
+
+    # Records convert straight into narrative states, linked to the parent states
+    state_a = NarrativeState('a', 'Love grows.', ['love'], coherence=0.4)
+    state_b = NarrativeState('b', 'Mind opens.', ['mind'], coherence=0.8)
+    child = AdvancedResonantCrossoverEngine().crossover(state_a, state_b)
+    narrative = NarrativeState.from_offspring(child, state_a, state_b, 'adv_child_7', 3)
+    assert narrative.parent_ids == ['a', 'b'] and narrative.concepts == child.concepts
+    assert narrative.content == child.content and abs(narrative.coherence - 0.6) < 1e-12
+
+    # 4. The advanced engine breeds each generation's crossovers through one batch
+    calls = []
+    random.seed(5)
+    evolution = AdvancedEvolutionaryEngine(None)
+    original = evolution.crossover_engine.crossover_batch
+    evolution.crossover_engine.crossover_batch = lambda p: calls.append(len(p)) or original(p)
+    evolution.population_size = 16
+    evolution.initialize_population()
+    evolution.evolve_narrative(generations=3)
+    assert calls and max(calls) > 1 and len(calls) <= 3
+    ids = [n.state_id for n in evolution.population]
+    assert len(set(ids)) == len(ids)
+
+    print("\\n CROSSOVER BATCH WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Crossover batch test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,116 @@
+#  EMBEDDING CACHE TEST
+# Memory LRU tier, memory-mapped disk tier and cached encode()
+
+import sys
+import os
+import subprocess
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'cosmic_resonance_evaluation'))
+
+print(" EMBEDDING CACHE TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    from embedding_cache import EmbeddingCache, CachedEncoder, text_digest
+
+    class CountingEncoder:
+        """Deterministic toy encoder that records every text it is asked to encode"""
+        def __init__(self, dim=8):
+            self.dim = dim
+            self.encoded = []
+
+        def encode(self, texts, normalize_embeddings=False, batch_size=32):
+            texts = [texts] if isinstance(texts, str) else texts
+            self.encoded.extend(texts)
+            vectors = np.stack([np.random.default_rng(len(t)).normal(size=self.dim) for t in texts])
+            return vectors / np.linalg.norm(vectors, axis=1, keepdims=True) if normalize_embeddings else vectors
+
+    seeds = [
+        "The universe began in infinite silence",
+        "Light spoke the first creative word into being",
+        "Chaos dreams of beautiful mathematical order"
+    ]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # 1. Only misses reach the model, in one batch
+        model = CountingEncoder()
+        encoder = CachedEncoder(model, EmbeddingCache('toy-model', cache_dir=cache_dir))
+
+        first = encoder.encode(seeds + [seeds[0]])
+        assert first.shape == (4, 8) and first.dtype == np.float32
+        assert len(model.encoded) == 3, "Duplicates inside a batch should be encoded once"
+
+        second = encoder.encode(seeds)
+        assert len(model.encoded) == 3, "Second pass should be served from cache"
+        assert np.allclose(first[:3], second)
+        assert encoder.encode(seeds[1]).shape == (8,)
+
+        # Output-neutral options are served from the cache; output-changing ones bypass it
+        assert np.allclose(encoder.encode(seeds, batch_size=2), second) and len(model.encoded) == 3
+        normalized = encoder.encode(seeds, normalize_embeddings=True)
+        assert len(model.encoded) == 6 and np.allclose(np.linalg.norm(normalized, axis=1), 1.0)
+        assert np.allclose(encoder.encode(seeds), second) and len(model.encoded) == 6
+
+        stats = encoder.cache.stats()
+        print(f"   Memory hits: {stats['memory_hits']}, misses: {stats['misses']}")
+        assert stats['memory_hits'] >= 4
+
+        # 2. Disk tier survives a restart
+        encoder.cache.close()
+        restarted = CachedEncoder(CountingEncoder(), EmbeddingCache('toy-model', cache_dir=cache_dir))
+        reloaded = restarted.encode(seeds)
+        assert restarted.model.encoded == [], "Restarted cache should not hit the model"
+        assert np.allclose(reloaded, second)
+        print(f"   Disk hits after restart: {restarted.cache.stats()['disk_hits']}")
+
+        # 3. Size-bounded eviction on both tiers
+        small = EmbeddingCache('small-model', cache_dir=cache_dir, memory_capacity=4, disk_capacity=16)
+        texts = [f"narrative number {i}" for i in range(40)]
+        small.put_many(texts, np.ones((40, 8), dtype=np.float32))
+        stats = small.stats()
+        assert stats['memory_entries'] == 4
+        assert stats['disk_entries'] <= 16
+        assert stats['memory_evictions'] == 36 and stats['disk_evictions'] > 0
+        assert small.get(texts[-1]) is not None, "Most recent entry must survive eviction"
+        print(f"   Bounded footprint: {stats['disk_entries']} disk entries, {stats['disk_bytes']} bytes")
+
+        # 4. Shrinking the disk capacity on reopen keeps the newest entries
+        small.close()
+        shrunk = EmbeddingCache('small-model', cache_dir=cache_dir, disk_capacity=4)
+        assert shrunk.stats()['disk_entries'] == 4
+        assert shrunk.get(texts[-1]) is not None
+
+        # 5. A slot rewritten under another text's digest is a miss, not the wrong vector
+        tier = restarted.cache._disk
+        slot = tier.slots[text_digest(seeds[0])]
+        tier.keys[slot] = np.frombuffer(text_digest("some other narrative"), dtype=np.uint8)
+        assert tier.get(text_digest(seeds[0])) is None and text_digest(seeds[0]) not in tier.slots
+
+        # 6. A second process cannot write a directory this one holds: it runs from memory
+        probe = ("import sys; sys.path.insert(0, sys.argv[1]); from embedding_cache import EmbeddingCache; "
+                 "print(EmbeddingCache('toy-model', cache_dir=sys.argv[2])._disk is None)")
+        module_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cosmic_resonance_evaluation')
+        second = subprocess.run([sys.executable, '-c', probe, module_dir, cache_dir],
+                                capture_output=True, text=True, check=True)
+        assert second.stdout.strip().splitlines()[-1] == 'True', second.stdout
+        restarted.cache.close()
+        second = subprocess.run([sys.executable, '-c', probe, module_dir, cache_dir],
+                                capture_output=True, text=True, check=True)
+        assert second.stdout.strip().splitlines()[-1] == 'False', second.stdout
+        shrunk.close()
+
+    # 7. Memory-only mode
+    memory_only = CachedEncoder(CountingEncoder(), EmbeddingCache('toy-model', cache_dir=None))
+    memory_only.encode(seeds)
+    memory_only.encode(seeds)
+    assert len(memory_only.model.encoded) == 3
+    assert memory_only.cache.stats()['disk_bytes'] == 0
+
+    print("\\n EMBEDDING CACHE WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Embedding cache test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,70 @@
+#  EMBEDDING MODEL REGISTRY TEST
+# One shared encoder per (model_name, device), reference counted
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'cosmic_resonance_evaluation'))
+
+print(" EMBEDDING MODEL REGISTRY TEST")
+print("=" * 40)
+
+try:
+    from embedding_registry import EmbeddingModelRegistry
+
+    loads = []
+
+    def counting_loader(model_name, device=None):
+        loads.append((model_name, device))
+        return object()
+
+    registry = EmbeddingModelRegistry(loader=counting_loader)
+
+    # Three components asking for the same model share one load
+    model_1 = registry.acquire('all-mpnet-base-v2')
+    model_2 = registry.acquire('all-mpnet-base-v2')
+    model_3 = registry.acquire('all-mpnet-base-v2')
+
+    assert model_1 is model_2 is model_3, "Same key must return the same encoder"
+    assert len(loads) == 1, f"Expected 1 load, got {len(loads)}"
+    assert registry.refcount('all-mpnet-base-v2') == 3
+    print(f"   Shared encoder: {len(loads)} load for 3 holders")
+
+    # Device is part of the key
+    cpu_model = registry.acquire('all-mpnet-base-v2', device='cpu')
+    assert cpu_model is not model_1
+    assert len(loads) == 2
+    print(f"   Per-device keys: {registry.loaded_models()}")
+
+    # Release unloads only when the last holder lets go
+    assert registry.release('all-mpnet-base-v2') is False
+    assert registry.release('all-mpnet-base-v2') is False
+    assert registry.release('all-mpnet-base-v2') is True
+    assert ('all-mpnet-base-v2', None) not in registry.loaded_models()
+    assert registry.release('all-mpnet-base-v2') is False
+    print("   Reference counting and release: OK")
+
+    # Re-acquiring after unload loads a fresh copy
+    registry.acquire('all-mpnet-base-v2')
+    assert len(loads) == 3
+
+    # Loader failures leave no stale entry behind
+    def failing_loader(model_name, device=None):
+        raise RuntimeError("model unavailable")
+
+    broken = EmbeddingModelRegistry(loader=failing_loader)
+    try:
+        broken.acquire('missing-model')
+        raise AssertionError("Loader failure should propagate")
+    except RuntimeError:
+        pass
+    assert broken.loaded_models() == []
+    assert broken.refcount('missing-model') == 0
+    print("   Loader failure handling: OK")
+
+    print("\\n EMBEDDING REGISTRY WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Embedding registry test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,88 @@
+#  EVALUATION EXECUTOR TEST
+# Every backend must return the serial CRE results in population order
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" EVALUATION EXECUTOR TEST")
+print("=" * 40)
+
+
+class FailingCRE:
+    """Picklable evaluator that rejects empty narratives"""
+
+    def evaluate_narrative_state(self, narrative_state):
+        if not narrative_state['content']:
+            raise ValueError("empty narrative")
+        return len(narrative_state['content'])
+
+
+class CountingFailingCRE:
+    """Evaluator that always raises, recording every narrative it was asked to evaluate"""
+
+    def __init__(self):
+        self.calls = []
+
+    def evaluate_narrative_state(self, narrative_state):
+        self.calls.append((narrative_state['content'], tuple(narrative_state['concepts'])))
+        raise ValueError("evaluator offline")
+
+
+if __name__ == "__main__":
+    try:
+        from genesis_engine.core.evaluation_executor import SerialEvaluationExecutor, make_executor
+        from genesis_engine.core.steady_state import SteadyStateEvolution
+        from genesis_engine.core.advanced_evolution import AdvancedEvolutionaryEngine
+
+        words = "consciousness love resonance evolution divine care pattern of patterns emerges from".split()
+        rng = random.Random(11)
+        payloads = [{'content': ' '.join(rng.choice(words) for _ in range(rng.randint(3, 40))), 'concepts': []}
+                    for _ in range(60)]
+
+        # 1. Same results, same order, for every backend and chunking
+        with make_executor('serial') as serial:
+            expected = [e.__dict__ for e in serial.evaluate(payloads)]
+        for backend, options in (('thread', {'max_workers': 3, 'chunk_size': 7}),
+                                 ('process', {'max_workers': 2}),
+                                 ('process', {'max_workers': 2, 'chunk_size': 1})):
+            with make_executor(backend, **options) as executor:
+                assert [e.__dict__ for e in executor.evaluate(payloads)] == expected
+                assert executor.evaluate([]) == []
+            print(f"   {backend} {options} matches serial")
+
+        # 2. A failing narrative yields None without losing its neighbours
+        with make_executor('process', evaluator_factory=FailingCRE, max_workers=2, chunk_size=2) as executor:
+            assert executor.evaluate([{'content': 'ab'}, {'content': ''}, {'content': 'abc'}]) == [2, None, 3]
+
+        # 3. Evolution is reproducible and backend-independent for a fixed seed
+        def run(executor):
+            random.seed(5)
+            engine = AdvancedEvolutionaryEngine(None, executor=executor)
+            engine.initialize_population()
+            engine.evolve_narrative(generations=4)
+            return [(n.content, n.fitness_score) for n in engine.population]
+
+        with make_executor('process', max_workers=2) as executor:
+            assert run(None) == run(executor)
+        print("   evolution reproducible across backends")
+
+        # 4. A failed evaluation falls back to quick fitness once and is never re-evaluated
+        failing = CountingFailingCRE()
+        random.seed(9)
+        engine = AdvancedEvolutionaryEngine(None, executor=SerialEvaluationExecutor(evaluator=failing))
+        engine.population_size = 10
+        engine.initialize_population()
+        engine.evolve_narrative(generations=3)
+        SteadyStateEvolution(engine).run(evaluations=20)
+        assert failing.calls and len(failing.calls) == len(set(failing.calls))
+        print(f"   {len(failing.calls)} failing evaluations, each attempted once")
+
+        print("\\n EVALUATION EXECUTOR WORKING SUCCESSFULLY!")
+
+    except Exception as e:
+        print(f" Evaluation executor test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
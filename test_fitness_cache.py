@@ -0,0 +1,63 @@
+#  FITNESS CACHE TEST
+# Elites and clones must hit the cache instead of re-running the CRE
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" FITNESS CACHE TEST")
+print("=" * 40)
+
+try:
+    from genesis_engine.core.fitness_cache import FitnessCache
+    from genesis_engine.core.physics_of_meaning import EnhancedCRE
+    from genesis_engine.core.evolutionary_engine import GenerativeEvolutionaryAlgorithm
+    from genesis_engine.core.advanced_evolution import AdvancedEvolutionaryEngine
+
+    # 1. LRU bookkeeping
+    cache = FitnessCache(capacity=2)
+    calls = []
+    compute = lambda value: (lambda: calls.append(value) or value)
+    assert cache.get_or_compute(FitnessCache.key("a"), compute(1)) == 1
+    assert cache.get_or_compute(FitnessCache.key("a"), compute(99)) == 1
+    cache.get_or_compute(FitnessCache.key("b"), compute(2))
+    cache.get_or_compute(FitnessCache.key("c"), compute(3))
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get_or_compute(FitnessCache.key("a"), compute(4)) == 4
+    assert calls == [1, 2, 3, 4]
+    assert FitnessCache.key("a", ["x"], 0.5, "v1") != FitnessCache.key("a", ["x"], 0.5, "v2")
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 4
+
+    # 2. Advanced engine runs the CRE once per distinct narrative
+    class CountingCRE(EnhancedCRE):
+        evaluations = 0
+
+        def evaluate_narrative_state(self, narrative_state):
+            CountingCRE.evaluations += 1
+            return super().evaluate_narrative_state(narrative_state)
+
+    shared = FitnessCache()
+    advanced = AdvancedEvolutionaryEngine(None, cre_system=CountingCRE(), fitness_cache=shared)
+    advanced.initialize_population()
+    advanced.evolve_narrative(generations=5)
+    stats = advanced.get_advanced_report()["fitness_cache"]
+    assert CountingCRE.evaluations == stats["misses"]
+    assert stats["hits"] > 0
+    print(f"   advanced engine hit rate {stats['hit_rate']:.2f}")
+
+    # 3. The basic engine shares the cache without colliding with CRE entries
+    basic = GenerativeEvolutionaryAlgorithm(None, fitness_cache=shared)
+    basic.initialize_population()
+    basic.evolve_narrative(generations=5)
+    assert basic.get_evolutionary_report()["fitness_cache"]["hits"] > stats["hits"]
+    for narrative in basic.population:
+        assert 0.0 <= narrative.fitness_score <= 1.0
+        assert narrative.fitness_score == basic._compute_quick_fitness(narrative)
+
+    print("\\n FITNESS CACHE WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Fitness cache test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,55 @@
+#  HILBERT GEOMETRY TEST
+# Vectorized triple kernels must agree with the scalar scipy path in every dtype
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'cosmic_resonance_evaluation'))
+
+print(" HILBERT GEOMETRY TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    from scipy.spatial.distance import cosine
+    from hilbert_geometry import triple_geometry, pairwise_cosine, row_cosine, normalize_rows
+
+    rng = np.random.default_rng(7)
+    A, B, C = (rng.normal(size=(20, 768)) for _ in range(3))
+
+    # 1. float64 matches scipy to rounding error
+    geometry = triple_geometry(A, B, C)
+    for i in range(len(A)):
+        assert np.isclose(geometry['parent_similarity'][i], 1 - cosine(A[i], B[i]), rtol=1e-12, atol=1e-12)
+        assert np.isclose(geometry['heritage_a'][i], 1 - cosine(C[i], A[i]), rtol=1e-12, atol=1e-12)
+        J_0 = np.linalg.norm(C[i]) ** 2
+        assert np.isclose(geometry['J_0_c'][i], J_0)
+        assert np.isclose(geometry['conservation_ratio'][i],
+                          J_0 / (np.linalg.norm(A[i]) ** 2 + np.linalg.norm(B[i]) ** 2))
+    assert geometry['parent_similarity'].dtype == np.float64
+    print("   float64 matches scalar path")
+
+    # 2. Reduced precision inputs are computed in float32
+    for dtype, tolerance in ((np.float32, 1e-5), (np.float16, 2e-3)):
+        reduced = triple_geometry(A.astype(dtype), B.astype(dtype), C.astype(dtype))
+        assert reduced['novelty_coefficient'].dtype == np.float32
+        for key in ('parent_similarity', 'heritage_b', 'geometric_coherence', 'novelty_coefficient'):
+            assert np.allclose(reduced[key], geometry[key], atol=tolerance), f"{key} drifted in {dtype.__name__}"
+        print(f"   {np.dtype(dtype).name} within {tolerance}")
+
+    # 3. Pairwise and row kernels, zero vectors stay finite
+    S = pairwise_cosine(A[:5], B[:4])
+    assert S.shape == (5, 4)
+    assert np.allclose(np.diag(pairwise_cosine(A[:4], B[:4])), row_cosine(A[:4], B[:4]))
+    zero = np.zeros((1, 768))
+    assert np.all(normalize_rows(zero) == 0)
+    degenerate = triple_geometry(zero, zero, zero)
+    assert degenerate['conservation_ratio'][0] == 1.0
+    assert np.all(np.isfinite(degenerate['parent_similarity']))
+
+    print("\\n HILBERT GEOMETRY WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Hilbert geometry test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,96 @@
+#  ISLAND MODEL TEST
+# Process islands must reproduce the local queue stand-in, migration included
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" ISLAND MODEL TEST")
+print("=" * 40)
+
+
+def failing_engine_factory(island_id):
+    """Island 1 raises in evolve_narrative; picklable for process islands"""
+    from genesis_engine.core.advanced_evolution import AdvancedEvolutionaryEngine
+    engine = AdvancedEvolutionaryEngine(None)
+    if island_id == 1:
+        def evolve_narrative(generations=25):
+            raise RuntimeError("island exploded")
+        engine.evolve_narrative = evolve_narrative
+    return engine
+
+
+def dying_engine_factory(island_id):
+    """Island 1's process exits without replying"""
+    from genesis_engine.core.advanced_evolution import AdvancedEvolutionaryEngine
+    engine = AdvancedEvolutionaryEngine(None)
+    if island_id == 1:
+        engine.evolve_narrative = lambda generations=25: os._exit(3)
+    return engine
+
+
+if __name__ == "__main__":
+    try:
+        import time
+        from genesis_engine.core.island_model import IslandError, IslandModel, IslandWorker, migration_targets
+
+        # 1. Topologies
+        assert migration_targets(2, 3, 'ring') == [0]
+        assert migration_targets(1, 3, 'full') == [0, 2]
+        assert migration_targets(0, 1, 'full') == []
+
+        # 2. Immigrants replace the weakest narratives but never the island's best
+        worker = IslandWorker(0, seed=1)
+        best_before = worker._best().state_id
+        migrants = IslandWorker(1, seed=2).emigrants(3)
+        worker.immigrate(migrants)
+        ids = [n.state_id for n in worker.engine.population]
+        assert best_before in ids and sum(i.startswith('adv_immigrant_') for i in ids) == 3
+        assert len(ids) == worker.engine.population_size and len(set(ids)) == len(ids)
+
+        # Migrating back and forth renames rather than nesting state ids
+        other = IslandWorker(1, seed=2)
+        for _ in range(3):
+            other.immigrate(worker.emigrants(2))
+            worker.immigrate(other.emigrants(2))
+        for island in (worker, other):
+            for narrative in island.engine.population:
+                assert narrative.state_id.count('immigrant') <= 1
+                if narrative.state_id.startswith('adv_immigrant_'):
+                    assert narrative.state_id == f"adv_immigrant_{narrative.lineage_id}"
+
+        # 3. Local and process backends give the same run for the same seed
+        options = dict(n_islands=3, epochs=3, generations_per_epoch=2, migration_size=2, seed=7)
+        local = IslandModel(backend='local', **options).run()
+        remote = IslandModel(backend='process', **options).run()
+        assert local['fitness_progression'] == remote['fitness_progression']
+        assert local['best_narrative'] == remote['best_narrative']
+        assert local['migrations'] == 3 * 2 * 2
+        assert len(local['islands']) == 3
+        assert local['best_fitness'] == local['islands'][local['best_island']]['best_fitness']
+        print(f"   ring: best {local['best_fitness']:.3f} from island {local['best_island']}")
+
+        full = IslandModel(backend='local', topology='full', **options).run()
+        assert full['migrations'] == 3 * 2 * 2 * 2
+        print(f"   full: best {full['best_fitness']:.3f} from island {full['best_island']}")
+
+        # 4. A failing or dead island is reported instead of hanging the run
+        for factory, backends, message in ((failing_engine_factory, ('local', 'process'), 'island exploded'),
+                                           (dying_engine_factory, ('process',), 'exited with code 3')):
+            for backend in backends:
+                start = time.perf_counter()
+                try:
+                    IslandModel(backend=backend, engine_factory=factory, **options).run()
+                    raise AssertionError("A failing island must fail the run")
+                except IslandError as error:
+                    assert message in str(error) and 'Island 1' in str(error), error
+                assert time.perf_counter() - start < 30
+        print("   failing and dead islands raise IslandError")
+
+        print("\\n ISLAND MODEL WORKING SUCCESSFULLY!")
+
+    except Exception as e:
+        print(f" Island model test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,48 @@
+#  LEXICON TEST
+# Compiled lexicon hits must equal per-keyword substring checks, overlaps included
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" LEXICON TEST")
+print("=" * 40)
+
+try:
+    from genesis_engine.core.lexicon import Lexicon
+    from genesis_engine.core.text_analysis import analyze_text
+
+    keywords = ['care', 'careful', 'self-emptying', 'emptying', 'letting go', 'gives rise to',
+                'rise', 'love', 'love_manifestation', 'a', 'for the sake of']
+    lexicon = Lexicon(keywords + ['Love'])
+    assert len(lexicon) == len(keywords)
+
+    rng = random.Random(5)
+    pieces = keywords + ['the', 'Careful', 'LOVE', 'scared', 'of', 'sake', 'letting', 'go', 'x.y']
+    for _ in range(500):
+        text = ''.join(rng.choice(pieces) + rng.choice([' ', '', '  ', '\n', '. ']) for _ in range(rng.randint(0, 30)))
+        lower = text.lower()
+        expected = {k for k in lexicon.keywords if k in lower}
+
+        # 1. Presence from raw text and from a shared analysis
+        assert lexicon.present(text) == expected
+        assert lexicon.present(analyze_text(text)) == expected
+        assert lexicon.count(text) == len(expected)
+
+        # 2. Positional hits in one scan, overlapping keywords included
+        brute = {(i, k) for k in lexicon.keywords for i in range(len(lower)) if lower.startswith(k, i)}
+        assert set(lexicon.finditer(lower)) == brute
+    print("   presence and positions match substring scans")
+
+    # 3. Empty lexicon finds nothing
+    assert Lexicon([]).present("anything") == frozenset()
+    assert list(Lexicon([]).finditer("anything")) == []
+
+    print("\\n LEXICON WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Lexicon test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,106 @@
+#  LINEAGE STORE TEST
+# Compact parent graph queries must match a plain walk and stay fast at millions of narratives
+
+import sys
+import os
+import random
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" LINEAGE STORE TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    from genesis_engine.core.lineage import LineageStore
+    from genesis_engine.core.advanced_evolution import AdvancedEvolutionaryEngine
+    from genesis_engine.core.evolutionary_engine import GenerativeEvolutionaryAlgorithm
+
+    def walk(neighbours, nodes):
+        """Reachable set by following neighbours one node at a time"""
+        seen, stack = set(), list(nodes)
+        while stack:
+            for other in neighbours(stack.pop()):
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        return sorted(seen)
+
+    # 1. Single and batched appends agree, and queries match a per-node walk
+    rng = np.random.default_rng(3)
+    store = LineageStore(capacity=4)
+    parent_map = {}
+    for node in range(400):
+        parents = [] if node < 20 else sorted(set(rng.integers(0, node, size=rng.integers(1, 3)).tolist()))
+        assert store.add(parents, generation=node // 20) == node
+        parent_map[node] = parents
+    child_map = {node: [c for c, ps in parent_map.items() if node in ps] for node in parent_map}
+
+    for nodes in ([399], [250, 310], [0], list(range(380, 400))):
+        assert store.ancestors(nodes).tolist() == walk(lambda v: parent_map[v], nodes)
+        assert store.descendants(nodes).tolist() == walk(lambda v: child_map[v], nodes)
+    assert store.ancestors([399], max_depth=1).tolist() == parent_map[399]
+    assert store.roots().tolist() == list(range(20)) and store.generation_of(399) == 19
+
+    batch = LineageStore()
+    batch.add_many(np.zeros((20, 2)) - 1)
+    batch.add_many([(parent_map[v] + [-1, -1])[:2] for v in range(20, 400)], np.arange(20, 400) // 20)
+    assert np.array_equal(batch.parents[:400], store.parents[:400])
+    try:
+        store.add([store.next_id])
+        raise AssertionError("A parent that does not exist yet must be rejected")
+    except ValueError:
+        pass
+
+    # 2. Save/load round-trips through memory maps and stays appendable
+    with tempfile.TemporaryDirectory() as tmp:
+        store.save(tmp)
+        loaded = LineageStore.load(tmp)
+        assert isinstance(loaded.parents, np.memmap)
+        assert loaded.descendants([5]).tolist() == store.descendants([5]).tolist()
+        assert loaded.add([399], 20) == 400 and loaded.parents_of(400).tolist() == [399]
+
+    # 3. Millions of individuals: batched appends and deep queries
+    n, width = 2_000_000, 10_000
+    big = LineageStore(capacity=n)
+    start = time.perf_counter()
+    big.add_many(np.full((width, 2), -1))
+    for first in range(width, n, width):
+        # Each generation breeds from the previous one
+        previous = np.arange(first - width, first)
+        big.add_many(rng.choice(previous, size=(width, 2)), np.full(width, first // width))
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    ancestors = big.ancestors(np.arange(n - 10, n))
+    descendants = big.descendants([0], max_depth=20)
+    query = time.perf_counter() - start
+    assert len(big) == n and ancestors.size > 0 and descendants.size > 0
+    assert big.generations[ancestors].max() < big.generation_of(n - 1)
+    print(f"   {n:,} narratives in {big.nbytes / 2 ** 20:.0f} MB, built in {1e3 * build:.0f} ms, "
+          f"ancestor + descendant queries {1e3 * query:.0f} ms")
+
+    # 4. Both engines record every narrative in their lineage with short state ids
+    for engine_class in (AdvancedEvolutionaryEngine, GenerativeEvolutionaryAlgorithm):
+        random.seed(11)
+        engine = engine_class(None)
+        engine.population_size = 10
+        engine.initialize_population()
+        engine.evolve_narrative(generations=5)
+        ids = [n.lineage_id for n in engine.population]
+        assert all(0 <= i < len(engine.lineage) for i in ids)
+        assert all(len(n.state_id) < 32 for n in engine.population)
+        assert len(engine.lineage.ancestors(ids)) > 0
+        for narrative in engine.population:
+            parents = engine.lineage.parents_of(narrative.lineage_id)
+            assert all(engine.lineage.generation_of(p) < engine.lineage.generation_of(narrative.lineage_id)
+                       for p in parents)
+        print(f"   {engine_class.__name__}: {len(engine.lineage)} narratives recorded")
+
+    print("\\n LINEAGE STORE WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Lineage store test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
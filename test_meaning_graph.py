@@ -0,0 +1,76 @@
+#  MEANING GRAPH TEST
+# Sparse similarity graph construction and vectorized Ricci curvature
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'cosmic_resonance_evaluation'))
+
+print(" MEANING GRAPH TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    import networkx as nx
+    from scipy import sparse
+    from scipy.spatial.distance import cosine
+    from meaning_graph import MeaningGraph
+    from mathematical_foundation import MathematicalFoundation
+
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(120, 16))
+    X[:, :3] += 2 * rng.normal(size=(120, 1))
+
+    # 1. Blocked construction matches the pairwise cosine loop
+    graph = MeaningGraph.from_vectors(X, threshold=0.5, block_size=17)
+    expected = {(i, j) for i in range(len(X)) for j in range(i + 1, len(X)) if 1 - cosine(X[i], X[j]) > 0.5}
+    rows, cols, weights = graph.edges()
+    assert set(zip(rows.tolist(), cols.tolist())) == expected
+    assert np.allclose(weights, [1 - cosine(X[i], X[j]) for i, j in zip(rows, cols)])
+    assert (graph.adjacency != graph.adjacency.T).nnz == 0
+    print(f"   {graph.n_edges} edges, density {graph.density:.3f}")
+
+    # 2. 'overlap' curvature equals the neighbour-set walk it replaces
+    nx_graph = graph.to_networkx()
+    overlap = graph.curvature_dict('overlap')
+    for (i, j), value in overlap.items():
+        n_i, n_j = set(nx_graph.neighbors(i)), set(nx_graph.neighbors(j))
+        assert np.isclose(value, len(n_i & n_j) / len(n_i | n_j))
+
+    # 3. Ollivier-Ricci on graphs with known curvature
+    def from_networkx(G):
+        return MeaningGraph(sparse.csr_matrix(nx.to_numpy_array(G)))
+
+    assert np.allclose(MeaningGraph.complete(5).curvature('ollivier'), 3 / 4)
+    assert np.allclose(from_networkx(nx.path_graph(5)).curvature('ollivier'), 0)
+    assert np.allclose(from_networkx(nx.star_graph(3)).curvature('ollivier'), 0)
+    assert np.allclose(from_networkx(nx.star_graph(3)).curvature('ollivier_bound'), 0)
+    assert np.allclose(from_networkx(nx.cycle_graph(4)).curvature('ollivier', alpha=0.5), 1 / 2)
+    assert np.allclose(from_networkx(nx.complete_graph(4)).curvature('ollivier', alpha=0.5), 2 / 3)
+
+    # The vectorized Jost-Liu bound never exceeds the exact value
+    knn = MeaningGraph.from_vectors(X, threshold=0.3, k=4)
+    exact = knn.curvature('ollivier')
+    assert np.all(knn.curvature('ollivier_bound') <= exact + 1e-9)
+    assert knn.degrees.max() < len(X) and knn.n_edges >= len(X) * 4 // 2
+    print(f"   k-NN graph: {knn.n_edges} edges, mean Ollivier-Ricci {exact.mean():.3f}")
+
+    # 4. Population-level validation through MathematicalFoundation
+    foundation = MathematicalFoundation(embedding_model='unavailable-model')
+    report = foundation.validate_graph_curvature_population(vectors=X, threshold=0.5)
+    assert report['num_nodes'] == len(X) and report['num_edges'] == graph.n_edges
+    assert len(report['node_curvature']) == len(X)
+    assert report['pattern_capability'] in ('HIGH', 'MEDIUM', 'LOW')
+    try:
+        foundation.validate_graph_curvature_population(narratives=['a narrative', 'another one'])
+        raise AssertionError("Narratives without a loaded model must be rejected")
+    except ValueError as error:
+        assert 'precomputed vectors' in str(error)
+    print(f"   Population curvature: {report['average_curvature']:.3f} ({report['pattern_capability']})")
+
+    print("\\n MEANING GRAPH WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Meaning graph test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,74 @@
+#  POPULATION STORE TEST
+# Columnar selection must agree with the list-of-dataclasses scans it replaces
+
+import sys
+import os
+import random
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" POPULATION STORE TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    from genesis_engine.core.population_store import PopulationStore, Interner
+    from genesis_engine.core.advanced_evolution import NarrativeState
+
+    rng = random.Random(3)
+    concepts = ['love', 'consciousness', 'resonance', 'evolution', 'divine', 'cosmic', 'pattern']
+
+    def population(size):
+        return [NarrativeState(state_id=f"n{i}", content=f"narrative {i}",
+                               concepts=rng.sample(concepts, rng.randint(0, 4)),
+                               coherence=rng.random(), fitness_score=round(rng.random(), 2),
+                               generation=rng.randint(0, 9),
+                               parent_ids=[f"n{rng.randrange(size)}" for _ in range(rng.randint(0, 2))],
+                               semantic_quality=rng.random())
+                for i in range(size)]
+
+    narratives = population(200)
+    store = PopulationStore(narratives)
+
+    # 1. Columns and interned concepts round-trip
+    assert np.array_equal(store.fitness, [n.fitness_score for n in narratives])
+    for row, narrative in enumerate(narratives):
+        assert [store.concept_interner.lookup(c) for c in store.concepts_of(row)] == narrative.concepts
+    assert store.unique_concept_count() == len({c for n in narratives for c in n.concepts})
+
+    # 2. Elitism and best match the sorted()/max() scans, ties included
+    scores = store.weighted_score(0.6, 0.4)
+    expected = sorted(narratives, key=lambda x: x.fitness_score * 0.6 + x.semantic_quality * 0.4, reverse=True)
+    for k in (1, 3, 50, 200, 500):
+        assert [narratives[i] for i in store.top_k(k, scores)] == expected[:k]
+    assert narratives[store.best(store.fitness)] is max(narratives, key=lambda x: x.fitness_score)
+
+    # 3. Tournaments use distinct contestants and return the best of them
+    generator = np.random.default_rng(0)
+    winners = store.tournament(5000, 3, store.fitness, rng=generator)
+    assert winners.shape == (5000,)
+    tiny = PopulationStore(narratives[:3])
+    assert set(tiny.tournament(100, 3, tiny.fitness).tolist()) == {int(np.argmax(tiny.fitness))}
+    # Winning rate tracks rank: the best row wins every tournament it enters
+    top = store.best(store.fitness)
+    assert abs(np.mean(winners == top) - 3 / len(narratives)) < 0.01
+
+    # 4. Statistics
+    stats = store.statistics()
+    assert np.isclose(stats["fitness_mean"], np.mean([n.fitness_score for n in narratives]))
+    assert np.isclose(stats["semantic_quality_var"], np.var([n.semantic_quality for n in narratives]))
+
+    # 5. Large populations select without Python-level tournaments
+    large = PopulationStore(population(50000), Interner())
+    start = time.perf_counter()
+    large.tournament(25000, 3, large.fitness)
+    large.top_k(100, large.fitness)
+    print(f"   50k selection + elitism: {1e3 * (time.perf_counter() - start):.1f} ms")
+
+    print("\\n POPULATION STORE WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Population store test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
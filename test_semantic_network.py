@@ -0,0 +1,91 @@
+#  SEMANTIC NETWORK TEST
+# The compiled similarity matrix must reproduce the nested-loop table and be shared by engines
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" SEMANTIC NETWORK TEST")
+print("=" * 40)
+
+try:
+    from genesis_engine.core.semantic_network import (
+        SemanticNetwork, DEFAULT_SEMANTIC_GROUPS, load_semantic_network
+    )
+    from genesis_engine.core.advanced_crossover import AdvancedResonantCrossoverEngine
+
+    def nested_loop_network(semantic_groups):
+        """The original dict-of-dicts construction"""
+        all_concepts = set()
+        for group_concepts in semantic_groups.values():
+            all_concepts.update(group_concepts)
+        network = {}
+        for concept in all_concepts:
+            network[concept] = {}
+            for other_concept in all_concepts:
+                if concept == other_concept:
+                    network[concept][other_concept] = 1.0
+                    continue
+                similarity = 0.1
+                for group_name, group_concepts in semantic_groups.items():
+                    if concept in group_concepts and other_concept in group_concepts:
+                        similarity = 0.8
+                        break
+                    elif concept in group_concepts or other_concept in group_concepts:
+                        for other_group_name, other_group_concepts in semantic_groups.items():
+                            if group_name != other_group_name:
+                                if (concept in group_concepts and other_concept in other_group_concepts) or \
+                                   (concept in other_group_concepts and other_concept in group_concepts):
+                                    similarity = 0.4
+                                    break
+                network[concept][other_concept] = similarity
+        return network
+
+    # 1. Every pair matches the nested-loop table, including concepts listed in two groups
+    overlapping = dict(DEFAULT_SEMANTIC_GROUPS, bridge=('harmony', 'care', 'logic'))
+    for groups in (DEFAULT_SEMANTIC_GROUPS, overlapping):
+        reference = nested_loop_network(groups)
+        network = SemanticNetwork(groups)
+        assert set(network.concepts) == set(reference)
+        for a, row in reference.items():
+            for b, value in row.items():
+                assert network.similarity_of(a, b) == value, (a, b)
+    assert network.similarity_of('harmony', 'unknown') is None
+
+    # 2. Crossover engines share one compiled network and look pairs up by index
+    engines = [AdvancedResonantCrossoverEngine() for _ in range(3)]
+    assert all(e.semantic_network is engines[0].semantic_network for e in engines)
+    assert engines[0]._calculate_semantic_resonance('awareness', 'mind') == 0.8
+    assert engines[0]._calculate_semantic_resonance('awareness', 'care') == 0.4
+    assert engines[0]._calculate_semantic_resonance('awareness', 'awareness') == 1.0
+    lexical = engines[0]._calculate_lexical_resonance('quasar', 'mind')
+    assert engines[0]._calculate_semantic_resonance('quasar', 'mind') == lexical * 0.5
+
+    start = time.perf_counter()
+    for _ in range(200):
+        AdvancedResonantCrossoverEngine()
+    print(f"   200 engines constructed in {1e3 * (time.perf_counter() - start):.1f} ms")
+
+    # 3. Extra concept groups load from a file and extend existing groups by name
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'groups.json')
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump({'ocean': ['tide', 'current', 'depth'], 'love': ['tenderness']}, fh)
+        extended = AdvancedResonantCrossoverEngine(concept_groups_path=path).semantic_network
+        assert extended is load_semantic_network(path) and extended is not engines[0].semantic_network
+        assert extended.similarity_of('tide', 'depth') == 0.8
+        assert extended.similarity_of('tenderness', 'empathy') == 0.8
+        assert extended.similarity_of('tide', 'empathy') == 0.4
+        assert len(extended) == len(engines[0].semantic_network) + 4
+    print(f"   Extended network: {len(extended)} concepts")
+
+    print("\\n SEMANTIC NETWORK WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" Semantic network test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
@@ -0,0 +1,125 @@
+#  STATE EMBEDDING MATRIX TEST
+# Hilbert space geometry from one float32 matrix must match per-state computation, in RAM or memory-mapped
+
+import sys
+import os
+import random
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+print(" STATE EMBEDDING MATRIX TEST")
+print("=" * 40)
+
+try:
+    import numpy as np
+    from genesis_engine.core.concept_embeddings import ConceptEmbeddings
+    from genesis_engine.core.consciousness_space import ConsciousnessHilbertSpace, ConsciousnessState
+    from genesis_engine.core.state_embeddings import StateEmbeddingMatrix, embed_states
+
+    random.seed(8)
+    words = ['love', 'consciousness', 'evolution', 'symmetry', 'divine', 'resonance', 'entropy', 'kenosis',
+             'lagrangian', 'harmony', 'awareness', 'emergence']
+
+    class Document:
+        def __init__(self, i):
+            self.doc_type = random.choice(['mathematics', 'theology', 'code'])
+            self.concepts = random.sample(words, random.randint(0, 4))
+            self.content = f"Document {i} on " + ' and '.join(self.concepts)
+            self.coherence_potential = random.random()
+
+    class CountingEncoder:
+        """Stands in for a sentence encoder and counts how often it is called"""
+        def __init__(self):
+            self.calls = 0
+        def encode(self, texts):
+            self.calls += 1
+            return np.stack([ConceptEmbeddings().embed([text])[0] * (1 + len(text)) for text in texts])
+
+    corpus = [Document(i) for i in range(200)]
+
+    # 1. The corpus is embedded in one batched encode; centroids match a per-state computation
+    encoder = CountingEncoder()
+    encoded = ConsciousnessHilbertSpace(encoder=encoder)
+    encoded.initialize_from_corpus(corpus)
+    assert encoder.calls == 1 and len(encoded.embeddings) == len(encoded.state_vectors)
+
+    table = ConceptEmbeddings()
+    space = ConsciousnessHilbertSpace(concept_embeddings=table)
+    space.initialize_from_corpus(corpus)
+    for state in space.state_vectors.values():
+        expected = table.embed(state.concepts).sum(axis=0) if state.concepts else np.zeros(table.dimension)
+        norm = np.linalg.norm(expected)
+        assert np.allclose(space.state_embedding(state.vector_id), expected / norm if norm else expected, atol=1e-6)
+
+    # 2. Removal and replacement retire rows without moving the others
+    ids = list(space.state_vectors)
+    for vid in ids[::5]:
+        space.remove_state(vid)
+    replaced = space.state_vectors[ids[1]]
+    space.add_state(ConsciousnessState(replaced.vector_id, {}, ['love', 'divine'], 0.7, document_type='theology'))
+    assert space.embeddings.size == len(ids) + 1 and len(space.embeddings) == len(space.state_vectors)
+    assert space.state_ids() == [vid for vid in ids if vid in space.state_vectors and vid != ids[1]] + [ids[1]]
+
+    # 3. Superposition, projection, nearest states and coherence match explicit computation
+    live = space.state_ids()
+    M = np.stack([space.state_embedding(vid) for vid in live]).astype(np.float64)
+    weights = np.linspace(0.1, 1.0, 6)
+    mixed = space.superpose(live[:6], weights)
+    expected = weights @ M[:6]
+    assert np.allclose(mixed, expected / np.linalg.norm(expected), atol=1e-5)
+    assert np.allclose(space.project(mixed), M @ mixed, atol=1e-5)
+
+    query = space.state_vectors[live[3]]
+    neighbours = space.nearest_states(query.vector_id, k=10)
+    scores = M @ M[3]
+    scores[3] = -np.inf
+    assert [s.vector_id for s, _ in neighbours] == \
+        [live[i] for i in sorted(range(len(live)), key=lambda i: (-np.float32(scores[i]), i))[:10]]
+    assert all(abs(c - scores[live.index(s.vector_id)]) < 1e-5 for s, c in neighbours)
+
+    gram = M @ M.T
+    pairwise = (gram.sum() - np.trace(gram)) / (len(live) * (len(live) - 1))
+    assert abs(space.measure_geometric_coherence() - pairwise) < 1e-6
+    assert space.get_dimensionality_report()['geometric_coherence'] == space.measure_geometric_coherence()
+
+    # 4. A memory-mapped matrix answers the same and cleans up its files
+    directory = tempfile.mkdtemp()
+    mapped = StateEmbeddingMatrix(mmap_threshold=4096, directory=directory)
+    in_memory = StateEmbeddingMatrix()
+    vectors = embed_states(list(space.state_vectors.values()), concept_embeddings=table)
+    for start in range(0, len(vectors), 7):
+        chunk_ids = list(space.state_vectors)[start:start + 7]
+        mapped.append(chunk_ids, vectors[start:start + 7])
+        in_memory.append(chunk_ids, vectors[start:start + 7])
+    assert mapped.memory_mapped and not in_memory.memory_mapped and len(os.listdir(directory)) == 1
+    for matrix in (mapped, in_memory):
+        matrix.remove(chunk_ids[0])
+    assert np.array_equal(mapped.nearest(vectors[0], 5)[0], in_memory.nearest(vectors[0], 5)[0])
+    assert mapped.mean_pairwise_similarity() == in_memory.mean_pairwise_similarity()
+    del mapped
+    assert os.listdir(directory) == []
+    os.rmdir(directory)
+
+    # 5. Whole-space statistics stay one pass over the matrix at scale
+    rng = np.random.default_rng(3)
+    large = StateEmbeddingMatrix(mmap_threshold=64 * 2 ** 20)
+    for block in range(10):
+        block_vectors = rng.standard_normal((50_000, 64)).astype(np.float32)
+        block_vectors /= np.linalg.norm(block_vectors, axis=1, keepdims=True)
+        large.append([f"s{block}_{i}" for i in range(50_000)], block_vectors)
+    start = time.perf_counter()
+    coherence = large.mean_pairwise_similarity()
+    rows, scores = large.nearest(block_vectors[17], 10)
+    elapsed = time.perf_counter() - start
+    assert large.memory_mapped and rows[0] == 9 * 50_000 + 17 and abs(scores[0] - 1.0) < 1e-5
+    assert abs(coherence) < 1e-3
+    print(f"   500k x 64 memory-mapped states: coherence + 10-nearest in {1e3 * elapsed:.0f} ms")
+
+    print("\\n STATE EMBEDDING MATRIX WORKING SUCCESSFULLY!")
+
+except Exception as e:
+    print(f" State embedding matrix test failed: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)